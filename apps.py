@@ -0,0 +1,13 @@
+from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+from DataBucket.src.database.bucket_cache import RefetchScheduler
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class DataBucketConfig(AppConfig):
+    name = "DataBucket"
+
+    def ready(self) -> None:
+        DataBucketRegistry.materializeModels()
+        if getattr(settings, "DATA_BUCKET_REFETCH_AUTOSTART", False):
+            RefetchScheduler.startDefault()
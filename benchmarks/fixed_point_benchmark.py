@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from decimal import Decimal
+import argparse
+import time
+
+
+def runOperations(value_class: type, count: int) -> dict[str, float]:
+    from DataBucket.src.units.weight_unit import WeightUnit
+
+    values = [
+        value_class(Decimal(index) / 7, unit=WeightUnit.KILOGRAM, decimal_places=3)
+        for index in range(1, count + 1)
+    ]
+    tons = [
+        value_class(Decimal(index) / 11, unit=WeightUnit.TON, decimal_places=3)
+        for index in range(1, count + 1)
+    ]
+    timings = {}
+
+    started_at = time.perf_counter()
+    total = values[0]
+    for value in values[1:]:
+        total = total + value
+    timings["add"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for value, ton in zip(values, tons):
+        ton + value
+    timings["add mixed units"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for value in values:
+        value * value
+    timings["multiply"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    for value in values:
+        value.convert(WeightUnit.POUND)
+    timings["convert"] = time.perf_counter() - started_at
+    return timings
+
+
+def main() -> None:
+    from DataBucket.src.auxiliary.value import FixedPointNumberValue, NumberValue
+
+    parser = argparse.ArgumentParser(
+        description="Decimal NumberValue against the fixed-point integer backend."
+    )
+    parser.add_argument("--count", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    decimal_timings = runOperations(NumberValue, arguments.count)
+    fixed_point_timings = runOperations(FixedPointNumberValue, arguments.count)
+    print(f"{arguments.count} values per operation")
+    print(f"{'operation':<16} {'Decimal ms':>12} {'fixed-point ms':>15} {'speedup':>8}")
+    for operation, decimal_time in decimal_timings.items():
+        fixed_point_time = fixed_point_timings[operation]
+        print(
+            f"{operation:<16} {decimal_time * 1000:>12.1f} {fixed_point_time * 1000:>15.1f} "
+            f"{decimal_time / fixed_point_time:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import time
+
+from DataBucket.benchmarks.startup_benchmark import configureDjango
+
+
+def defineBucket() -> type:
+    from DataBucket.src.data_bucket import DataBucket
+    from DataBucket.src.database.database_interface import Database
+    from DataBucket.src.database.db_field import Number, String
+    from DataBucket.src.units.weight_unit import WeightUnit
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    class ImportBenchmarkShipment(DataBucket):
+
+        class DataInterface(Database):
+            name = String(max_length=100, is_required=True, is_changeable=False)
+            weight = Number(decimal_places=3, unit=WeightUnit.TON, default=0)
+            note = String(max_length=100)
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(get_user_model())
+        for model in ImportBenchmarkShipment.DataInterface.model_tuple:
+            schema_editor.create_model(model)
+    return ImportBenchmarkShipment
+
+
+def buildCsv(count: int) -> str:
+    symbols = ("lb", "kg", "t")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["name", "weight", "weight_unit", "note"])
+    for index in range(count):
+        writer.writerow(
+            [f"row {index}", f"{index % 1000}.25", symbols[index % 3], "supplier"]
+        )
+    return buffer.getvalue()
+
+
+def runRowByRow(bucket: type, source: str, creator: int) -> float:
+    from DataBucket.src.auxiliary.value import NumberValue
+    from DataBucket.src.units.weight_unit import WeightUnit
+
+    units = {unit.symbol: unit for unit in WeightUnit.UNITS}
+    started_at = time.perf_counter()
+    rows = [
+        {
+            "name": row["name"],
+            "weight": NumberValue(row["weight"], units[row["weight_unit"]], 3),
+            "note": row["note"],
+        }
+        for row in csv.DictReader(io.StringIO(source))
+    ]
+    bucket.objects.bulk_create(rows, creator=creator)
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Row-by-row bulk_create against the chunked BulkImporter."
+    )
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--processes", type=int, default=2)
+    arguments = parser.parse_args()
+
+    configureDjango()
+    from DataBucket.src.database.bulk_import import BulkImporter
+    from django.contrib.auth import get_user_model
+
+    bucket = defineBucket()
+    creator = get_user_model().objects.create(username="importer").pk
+    source = buildCsv(arguments.count)
+
+    row_by_row = runRowByRow(bucket, source, creator)
+    print(f"{arguments.count} rows, mixed lb/kg/t")
+    print(f"{'pipeline':<20} {'rows/s':>10} {'read':>8} {'prepare':>8} {'insert':>8}")
+    print(f"{'row by row':<20} {arguments.count / row_by_row:>10,.0f}")
+    for processes in (None, arguments.processes):
+        report = BulkImporter(
+            bucket.DataInterface, processes=processes, creator=creator
+        ).importCsv(io.StringIO(source))
+        timings = report.timings
+        print(
+            f"{f'importer x{processes or 1}':<20} {report.rows_per_second:>10,.0f} "
+            f"{timings['read']:>8.2f} {timings['prepare']:>8.2f} {timings['insert']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from DataBucket.benchmarks.startup_benchmark import configureDjango
+
+
+def defineBucket() -> type:
+    from DataBucket.src.data_bucket import DataBucket
+    from DataBucket.src.database.database_interface import Database
+    from DataBucket.src.database.db_field import Number, String
+    from DataBucket.src.units.weight_unit import WeightUnit
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    class IndexBenchmarkOrder(DataBucket):
+
+        class DataInterface(Database):
+            name = String(max_length=100, is_required=True, is_changeable=False)
+            status = String(max_length=20, db_index=True)
+            weight = Number(decimal_places=2, unit=WeightUnit.TON, default=0)
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(get_user_model())
+        for model in IndexBenchmarkOrder.DataInterface.model_tuple:
+            schema_editor.create_model(model)
+    return IndexBenchmarkOrder
+
+
+def populate(bucket: type, count: int, versions: int, creator: int) -> list[int]:
+    records = bucket.objects.bulk_create(
+        [
+            {"name": f"order {index}", "status": "open", "weight": index % 100}
+            for index in range(count)
+        ],
+        creator=creator,
+    )
+    ids = [record.id for record in records]
+    for version in range(1, versions):
+        bucket.objects.bulk_update(
+            ids,
+            [
+                {"status": f"state {(index + version) % 50}", "weight": version}
+                for index in range(count)
+            ],
+            creator=creator,
+        )
+    return ids
+
+
+def measure(bucket: type, ids: list[int], lookups: int) -> tuple[float, float]:
+    sample = random.Random(7).sample(ids, min(lookups, len(ids)))
+    started_at = time.perf_counter()
+    for id in sample:
+        bucket.DataInterface.get({"id": id})
+    by_id = (time.perf_counter() - started_at) / len(sample)
+    started_at = time.perf_counter()
+    for index in range(len(sample)):
+        bucket.DataInterface.filter({"status": f"state {index % 50}"}).count()
+    by_status = (time.perf_counter() - started_at) / len(sample)
+    return by_id, by_status
+
+
+def dropIndexes(bucket: type) -> int:
+    from django.db import connection
+
+    dropped = 0
+    with connection.schema_editor() as schema_editor:
+        for model in bucket.DataInterface.model_tuple:
+            for index in model._meta.indexes:
+                schema_editor.remove_index(model, index)
+                dropped += 1
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return dropped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Current-record lookups with and without the generated indexes."
+    )
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--versions", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=500)
+    arguments = parser.parse_args()
+
+    configureDjango()
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    bucket = defineBucket()
+    creator = get_user_model().objects.create(username="indexer").pk
+    ids = populate(bucket, arguments.count, arguments.versions, creator)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    print(
+        f"{arguments.count} records x {arguments.versions} versions, "
+        f"{arguments.lookups} lookups"
+    )
+    print(f"{'indexes':<22} {'get by id':>12} {'filter status':>14}")
+    with_indexes = measure(bucket, ids, arguments.lookups)
+    dropped = dropIndexes(bucket)
+    without_indexes = measure(bucket, ids, arguments.lookups)
+    for label, (by_id, by_status) in (
+        ("generated", with_indexes),
+        (f"dropped ({dropped})", without_indexes),
+    ):
+        print(f"{label:<22} {by_id * 1e6:>10,.0f}us {by_status * 1e6:>12,.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import django
+from django.conf import settings
+
+
+def configureDjango() -> None:
+    if settings.configured:
+        return
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "DataBucket",
+        ],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        DEFAULT_AUTO_FIELD="django.db.models.AutoField",
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+def defineBuckets(prefix: str, count: int, lazy_models: bool | str) -> list[type]:
+    from DataBucket.src.data_bucket import DataBucket
+    from DataBucket.src.database.database_interface import Database
+    from DataBucket.src.database.db_field import Number, String
+    from DataBucket.src.units.weight_unit import WeightUnit
+
+    buckets = []
+    for index in range(count):
+        data_interface = type(
+            "DataInterface",
+            (Database,),
+            {
+                "__module__": __name__,
+                "name": String(max_length=100, is_required=True),
+                "note": String(max_length=100),
+                "weight": Number(decimal_places=2, unit=WeightUnit.TON, default=0),
+            },
+        )
+        buckets.append(
+            type(
+                f"{prefix}{index}",
+                (DataBucket,),
+                {
+                    "__module__": __name__,
+                    "DataInterface": data_interface,
+                    "lazy_models": lazy_models,
+                },
+            )
+        )
+    return buckets
+
+
+def timeCalls(owner: type, name: str, totals: dict[str, float]) -> None:
+    original = getattr(owner, name)
+
+    def timed(*args, **kwargs):
+        started_at = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            totals["register"] += time.perf_counter() - started_at
+
+    setattr(owner, name, staticmethod(timed))
+
+
+def measure(prefix: str, count: int, lazy_models: bool | str) -> dict[str, float]:
+    from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+    from DataBucket.src.database.app_label_index import AppLabelIndex
+
+    totals = {"register": 0.0}
+    timeCalls(AppLabelIndex, "getAppLabel", totals)
+    timeCalls(DataBucketRegistry, "register", totals)
+
+    started_at = time.perf_counter()
+    buckets = defineBuckets(prefix, count, lazy_models)
+    imported_at = time.perf_counter()
+    DataBucketRegistry.materializeModels()
+    ready_at = time.perf_counter()
+    buckets[0].DataInterface.model_tuple
+    first_access_at = time.perf_counter()
+    return {
+        "import": imported_at - started_at,
+        "register": totals["register"],
+        "ready": ready_at - imported_at,
+        "import_to_ready": ready_at - started_at,
+        "first_access": first_access_at - ready_at,
+    }
+
+
+MODES: dict[str, bool | str] = {
+    "eager": False,
+    "lazy": "ready",
+}
+
+
+def runMode(mode: str, count: int) -> dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-m", __spec__.name, "--buckets", str(count), "--mode", mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import-to-ready time for synthetic DataBucket definitions."
+    )
+    parser.add_argument("--buckets", type=int, default=200)
+    parser.add_argument("--mode", choices=list(MODES))
+    arguments = parser.parse_args()
+
+    if arguments.mode is not None:
+        configureDjango()
+        timings = measure(
+            "StartupBenchmarkBucket", arguments.buckets, MODES[arguments.mode]
+        )
+        print(json.dumps(timings))
+        return
+
+    print(f"{arguments.buckets} buckets, one fresh process per mode")
+    print(
+        f"{'mode':<12} {'import ms':>10} {'register ms':>12} {'ready ms':>10} "
+        f"{'total ms':>10} {'first access ms':>16}"
+    )
+    for mode in MODES:
+        timings = runMode(mode, arguments.buckets)
+        print(
+            f"{mode:<12} {timings['import'] * 1000:>10.1f} {timings['register'] * 1000:>12.2f} "
+            f"{timings['ready'] * 1000:>10.1f} {timings['import_to_ready'] * 1000:>10.1f} "
+            f"{timings['first_access'] * 1000:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from decimal import Decimal
+import argparse
+import gc
+import time
+import tracemalloc
+
+
+def measureMemory(count: int) -> float:
+    from DataBucket.src.auxiliary.value import NumberValue
+    from DataBucket.src.units.weight_unit import WeightUnit
+
+    gc.collect()
+    tracemalloc.start()
+    values = [
+        NumberValue(Decimal(index), unit=WeightUnit.KILOGRAM, decimal_places=2)
+        for index in range(count)
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del values
+    return size / count
+
+
+def measureThroughput(count: int) -> dict[str, float]:
+    from DataBucket.src.auxiliary.value import NumberValue
+    from DataBucket.src.units.weight_unit import WeightUnit
+
+    started_at = time.perf_counter()
+    values = [
+        NumberValue(Decimal(index), unit=WeightUnit.KILOGRAM, decimal_places=2)
+        for index in range(count)
+    ]
+    constructed_at = time.perf_counter()
+    total = values[0]
+    for value in values[1:]:
+        total = total + value
+    added_at = time.perf_counter()
+    for value in values:
+        value * 2
+    multiplied_at = time.perf_counter()
+    return {
+        "construct": count / (constructed_at - started_at),
+        "add": (count - 1) / (added_at - constructed_at),
+        "multiply": count / (multiplied_at - added_at),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory per NumberValue and construction/arithmetic throughput."
+    )
+    parser.add_argument("--count", type=int, default=200_000)
+    arguments = parser.parse_args()
+
+    bytes_per_value = measureMemory(arguments.count)
+    throughput = measureThroughput(arguments.count)
+    print(f"{arguments.count} NumberValues")
+    print(f"{'bytes/value':<16} {bytes_per_value:>12.1f}")
+    for name, operations_per_second in throughput.items():
+        print(f"{name + ' ops/s':<16} {operations_per_second:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
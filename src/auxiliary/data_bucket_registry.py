@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import RLock
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from django.db import models
+    from DataBucket.src.data_bucket import DataBucket
+    from DataBucket.src.auxiliary.interface_definition import DataInterface
+
+
+@dataclass(frozen=True)
+class DataBucketRegistration:
+    name: str
+    app_label: str | None
+    data_bucket: type[DataBucket]
+    data_interface: type[DataInterface]
+    lazy_mode: str | None = None
+
+    @property
+    def qualified_name(self) -> str:
+        if self.app_label is None:
+            return self.name
+        return f"{self.app_label}.{self.name}"
+
+    @property
+    def models(self) -> tuple[type[models.Model], type[models.Model]]:
+        return self.data_interface.model_tuple
+
+    @property
+    def unchangeable_model(self) -> type[models.Model]:
+        return self.models[0]
+
+    @property
+    def changeable_model(self) -> type[models.Model]:
+        return self.models[1]
+
+
+class DataBucketRegistry:
+
+    __LOCK = RLock()
+    __BY_NAME: dict[str, list[DataBucketRegistration]] = {}
+    __BY_QUALIFIED_NAME: dict[str, DataBucketRegistration] = {}
+    __BY_CLASS: dict[type, DataBucketRegistration] = {}
+    __PENDING: dict[str, list[Callable[[DataBucketRegistration], None]]] = {}
+
+    @classmethod
+    def register(
+        cls,
+        data_bucket: type[DataBucket],
+        app_label: str | None = None,
+        lazy_mode: str | None = None,
+    ) -> DataBucketRegistration:
+        registration = DataBucketRegistration(
+            name=data_bucket.__name__,
+            app_label=app_label,
+            data_bucket=data_bucket,
+            data_interface=data_bucket.DataInterface,
+            lazy_mode=lazy_mode,
+        )
+        with cls.__LOCK:
+            previous = cls.__BY_QUALIFIED_NAME.get(registration.qualified_name)
+            if previous is not None:
+                cls.__remove(previous)
+            cls.__BY_NAME.setdefault(registration.name, []).append(registration)
+            cls.__BY_QUALIFIED_NAME[registration.qualified_name] = registration
+            cls.__BY_CLASS[data_bucket] = registration
+            callbacks = cls.__PENDING.pop(registration.name, []) + cls.__PENDING.pop(
+                registration.qualified_name, []
+            )
+        for callback in callbacks:
+            callback(registration)
+        return registration
+
+    @classmethod
+    def unregister(cls, data_bucket: type[DataBucket]) -> None:
+        with cls.__LOCK:
+            registration = cls.__BY_CLASS.get(data_bucket)
+            if registration is not None:
+                cls.__remove(registration)
+
+    @classmethod
+    def __remove(cls, registration: DataBucketRegistration) -> None:
+        cls.__BY_QUALIFIED_NAME.pop(registration.qualified_name, None)
+        cls.__BY_CLASS.pop(registration.data_bucket, None)
+        same_name = cls.__BY_NAME.get(registration.name, [])
+        if registration in same_name:
+            same_name.remove(registration)
+        if not same_name:
+            cls.__BY_NAME.pop(registration.name, None)
+
+    @classmethod
+    def find(cls, name: str | type[DataBucket]) -> DataBucketRegistration | None:
+        if isinstance(name, type):
+            return cls.__BY_CLASS.get(name)
+        registration = cls.__BY_QUALIFIED_NAME.get(name)
+        if registration is not None:
+            return registration
+        same_name = cls.__BY_NAME.get(name, [])
+        if len(same_name) > 1:
+            raise ValueError(
+                f"DataBucket name {name} is ambiguous, use one of {sorted(registration.qualified_name for registration in same_name)}"
+            )
+        return same_name[0] if same_name else None
+
+    @classmethod
+    def get(cls, name: str | type[DataBucket]) -> DataBucketRegistration:
+        registration = cls.find(name)
+        if registration is None:
+            raise ValueError(f"DataBucket with name {name} not found")
+        return registration
+
+    @classmethod
+    def isRegistered(cls, name: str | type[DataBucket]) -> bool:
+        return cls.find(name) is not None
+
+    @classmethod
+    def getDataBucket(cls, name: str | type[DataBucket]) -> type[DataBucket]:
+        return cls.get(name).data_bucket
+
+    @classmethod
+    def getDataInterface(cls, name: str | type[DataBucket]) -> type[DataInterface]:
+        return cls.get(name).data_interface
+
+    @classmethod
+    def getModels(
+        cls, name: str | type[DataBucket]
+    ) -> tuple[type[models.Model], type[models.Model]]:
+        return cls.get(name).models
+
+    @classmethod
+    def whenRegistered(
+        cls, name: str, callback: Callable[[DataBucketRegistration], None]
+    ) -> None:
+        with cls.__LOCK:
+            registration = cls.find(name)
+            if registration is None:
+                cls.__PENDING.setdefault(name, []).append(callback)
+                return
+        callback(registration)
+
+    @classmethod
+    def getRegistrations(cls) -> list[DataBucketRegistration]:
+        with cls.__LOCK:
+            return list(cls.__BY_QUALIFIED_NAME.values())
+
+    @classmethod
+    def materializeModels(cls, lazy_mode: str | None = None) -> int:
+        materialized = 0
+        for registration in cls.getRegistrations():
+            if lazy_mode is not None and registration.lazy_mode != lazy_mode:
+                continue
+            if not registration.data_interface.is_materialized():
+                registration.data_interface.materialize()
+                materialized += 1
+        return materialized
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from DataBucket.src.data_bucket import DataBucket
+
+
+class IdentityMap:
+
+    def __init__(self) -> None:
+        self.__records: dict[tuple[type[DataBucket], int], DataBucket] = {}
+
+    def get(self, data_bucket: type[DataBucket], id: int) -> DataBucket | None:
+        return self.__records.get((data_bucket, id))
+
+    def getMany(
+        self, data_bucket: type[DataBucket], ids: Iterable[int]
+    ) -> dict[int, DataBucket]:
+        records = {}
+        for id in ids:
+            record = self.__records.get((data_bucket, id))
+            if record is not None:
+                records[id] = record
+        return records
+
+    def add(self, record: DataBucket) -> DataBucket:
+        return self.__records.setdefault((record.__class__, record.id), record)
+
+    def discard(self, data_bucket: type[DataBucket], id: int) -> None:
+        self.__records.pop((data_bucket, id), None)
+
+    def discardAll(self, data_bucket: type[DataBucket]) -> None:
+        self.__records = {
+            key: record
+            for key, record in self.__records.items()
+            if key[0] is not data_bucket
+        }
+
+    def clear(self) -> None:
+        self.__records.clear()
+
+    def __contains__(self, record: DataBucket) -> bool:
+        return (record.__class__, record.id) in self.__records
+
+    def __len__(self) -> int:
+        return len(self.__records)
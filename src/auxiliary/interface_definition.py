@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from DataBucket.src.units.unit import Unit
+from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+from DataBucket.src.units.unit import Unit, CombinedUnit
 from dataclasses import dataclass
-from typing import Any, Literal, TYPE_CHECKING
+from typing import Any, Iterable, Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from DataBucket.src.auxiliary.identity_map import IdentityMap
+    from DataBucket.src.auxiliary.value import NumberValue
+    from DataBucket.src.database.bucket_cache import BucketCache
     from DataBucket.src.data_bucket import (
         DataBucket,
-        DataBucketObject,
         DataBucketQuerryset,
     )
 
@@ -28,13 +31,23 @@ class FieldInformationDict:
 
 class DataInterface:
     data_bucket: DataBucket
+    app_label: str | None = None
+    cache: BucketCache | None = None
 
     @classmethod
-    def initialize_class(cls) -> None:
+    def initialize_class(cls, lazy: bool = False) -> None:
         raise NotImplementedError
 
     @classmethod
-    def getFields(cls) -> FieldInformationDict:
+    def materialize(cls) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def is_materialized(cls) -> bool:
+        raise NotImplementedError
+
+    @classmethod
+    def getFields(cls) -> list[FieldInformationDict]:
         raise NotImplementedError
 
     @classmethod
@@ -50,21 +63,125 @@ class DataInterface:
         raise NotImplementedError
 
     @classmethod
-    def create(cls, data: dict) -> DataBucketObject:
+    def get(cls, filter: dict) -> DataBucket | None:
+        raise NotImplementedError
+
+    @classmethod
+    def create(cls, data: dict, creator: Any = None) -> DataBucket:
+        raise NotImplementedError
+
+    @classmethod
+    def bulk_create(
+        cls, rows: Iterable[dict], creator: Any = None, batch_size: int | None = None
+    ) -> list[DataBucket]:
+        raise NotImplementedError
+
+    @classmethod
+    def delete(cls, id: int) -> DataBucket:
+        raise NotImplementedError
+
+    @classmethod
+    def bulk_delete(cls, ids: Iterable[int]) -> int:
         raise NotImplementedError
 
     @classmethod
-    def delete(cls, id: int) -> DataBucketObject:
+    def update(cls, id: int, data: dict, creator: Any = None) -> DataBucket:
         raise NotImplementedError
 
     @classmethod
-    def update(cls, id: int, data: dict) -> DataBucketObject:
+    def bulk_update(
+        cls,
+        ids: Iterable[int],
+        rows: Iterable[dict],
+        creator: Any = None,
+        batch_size: int | None = None,
+    ) -> list[DataBucket]:
+        raise NotImplementedError
+
+    @classmethod
+    def synchronize(cls, rows: Iterable[dict], creator: Any = None) -> dict[str, int]:
+        raise NotImplementedError
+
+    @classmethod
+    async def aall(cls) -> list[DataBucket]:
+        raise NotImplementedError
+
+    @classmethod
+    async def afilter(cls, filter: dict) -> list[DataBucket]:
+        raise NotImplementedError
+
+    @classmethod
+    async def aget(cls, filter: dict) -> DataBucket | None:
+        raise NotImplementedError
+
+    @classmethod
+    async def acreate(cls, data: dict, creator: Any = None) -> DataBucket:
+        raise NotImplementedError
+
+    @classmethod
+    async def abulk_create(
+        cls, rows: Iterable[dict], creator: Any = None, batch_size: int | None = None
+    ) -> list[DataBucket]:
+        raise NotImplementedError
+
+    @classmethod
+    async def aupdate(cls, id: int, data: dict, creator: Any = None) -> DataBucket:
+        raise NotImplementedError
+
+    @classmethod
+    async def adelete(cls, id: int) -> DataBucket:
+        raise NotImplementedError
+
+    @classmethod
+    def _bulkInsert(
+        cls,
+        rows: Iterable[dict[str, Any]],
+        creator: Any = None,
+        batch_size: int | None = None,
+    ) -> int:
+        raise NotImplementedError
+
+    @classmethod
+    def _resolveIds(
+        cls, ids: Iterable[int], identity_map: IdentityMap
+    ) -> dict[int, DataBucket]:
+        raise NotImplementedError
+
+    @classmethod
+    def _prefetchConnections(
+        cls,
+        records: list[DataBucket],
+        lookups: Iterable[str],
+        identity_map: IdentityMap,
+        many_to_many: bool = True,
+    ) -> None:
         raise NotImplementedError
 
     @classmethod
     def _getInterfaceConnection(cls) -> DataInterface:
         raise NotImplementedError
 
+    @classmethod
+    def _toRecord(cls, model_object: Any) -> DataBucket:
+        raise NotImplementedError
+
+    @classmethod
+    def _aggregate(
+        cls,
+        queryset: Any,
+        aggregations: dict[str, str | list[str]],
+        to_unit: Unit | CombinedUnit | dict[str, Unit | CombinedUnit] | None = None,
+    ) -> dict[str, NumberValue | None]:
+        raise NotImplementedError
+
+    @classmethod
+    def _translateFilter(cls, filter: dict) -> dict[str, Any]:
+        raise NotImplementedError
+
+    @classmethod
+    def _translateOrdering(cls, field_names: Iterable[str]) -> list[str]:
+        raise NotImplementedError
+
 
 class ConnectionType:
     pass
@@ -97,24 +214,18 @@ class DataBucketConnection:
         is_required: bool,
         on_delete: Any = None,
     ):
-        self.__data_bucket = self.__getDataBucket(data_bucket)
+        self.__data_bucket_name = self.__getDataBucketName(data_bucket)
         self.__connection_type = self.__getConnectionType(connection_type)
         self.__is_required = bool(is_required)
         self.__on_delete = on_delete
 
-    def __getDataBucket(self, data_bucket: type[DataBucket] | str) -> type[DataBucket]:
-        def getDataBucketByName(name: str) -> type[DataBucket]:
-            for subclass in DataBucket.__subclasses__():
-                if subclass.__name__ == name:
-                    return subclass
-
-            raise ValueError(f"DataBucket with name {name} not found")
-
+    def __getDataBucketName(self, data_bucket: type[DataBucket] | str) -> str:
         if isinstance(data_bucket, str):
-            data_bucket = getDataBucketByName(data_bucket)
-        if not issubclass(data_bucket, DataBucket):
-            raise ValueError("data_bucket must be a subclass of DataBucket")
-        return data_bucket
+            return data_bucket
+        registration = DataBucketRegistry.find(data_bucket)
+        if registration is None:
+            raise ValueError("data_bucket must be a registered DataBucket")
+        return registration.qualified_name
 
     def __getConnectionType(self, connection_type: str) -> type[ConnectionType]:
         if connection_type not in self.CONNECTION_TYPE_TRANSLATION:
@@ -123,9 +234,13 @@ class DataBucketConnection:
             )
         return self.CONNECTION_TYPE_TRANSLATION[connection_type]
 
+    @property
+    def data_bucket_name(self) -> str:
+        return self.__data_bucket_name
+
     @property
     def data_bucket(self) -> type[DataBucket]:
-        return self.__data_bucket
+        return DataBucketRegistry.getDataBucket(self.__data_bucket_name)
 
     @property
     def connection_type(self) -> type[ConnectionType]:
@@ -140,4 +255,4 @@ class DataBucketConnection:
         return self.__on_delete
 
     def __str__(self) -> str:
-        return f"{self.__data_bucket.__name__}({self.__connection_type.__name__})"
+        return f"{self.__data_bucket_name}({self.__connection_type.__name__})"
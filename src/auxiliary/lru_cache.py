@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class CacheStatistics:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class LRUCache:
+
+    __MISSING = object()
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        on_evict: Callable[[Hashable, Any], None] | None = None,
+    ) -> None:
+        self.__entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__on_evict = on_evict
+        self.__lock = RLock()
+        self.__max_size = self.__checkAndGetSize(max_size)
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @staticmethod
+    def __checkAndGetSize(max_size: int) -> int:
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError("max_size must be an integer greater than or equal to 0")
+        return max_size
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self.__lock:
+            return CacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__entries),
+                max_size=self.__max_size,
+            )
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.__lock:
+            value = self.__entries.get(key, self.__MISSING)
+            if value is self.__MISSING:
+                self.__misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self.__lock:
+            if self.__max_size == 0:
+                return
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            self.__evict()
+
+    def getOrCompute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key, self.__MISSING)
+        if value is self.__MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def resetStatistics(self) -> None:
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def resize(self, max_size: int) -> None:
+        with self.__lock:
+            self.__max_size = self.__checkAndGetSize(max_size)
+            self.__evict()
+
+    def __evict(self) -> None:
+        while len(self.__entries) > self.__max_size:
+            key, value = self.__entries.popitem(last=False)
+            self.__evictions += 1
+            if self.__on_evict is not None:
+                self.__on_evict(key, value)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self.__lock:
+            return key in self.__entries
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
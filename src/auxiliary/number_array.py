@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from DataBucket.src.auxiliary.value import (
+    NumberValue,
+    syncUnitsAddAndSub,
+    syncUnitsMulAndDiv,
+)
+from DataBucket.src.units.unit import Unit, CombinedUnit
+from DataBucket.src.units.currency_unit import CurrencyUnit
+from typing import Any, Callable, Iterable, Iterator
+
+import numpy as np
+
+
+class NumberArray:
+
+    def __init__(
+        self,
+        values: Iterable[float | Decimal | int] | np.ndarray,
+        unit: Unit | CombinedUnit | None = None,
+        decimal_places: int = 9,
+        connected_interface: Any = None,
+    ) -> None:
+        try:
+            array = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid values for NumberArray: {values}")
+        if array.ndim != 1:
+            raise ValueError("NumberArray values must be one-dimensional")
+        if (
+            unit is not None
+            and not isinstance(unit, Unit)
+            and not isinstance(unit, CombinedUnit)
+        ):
+            raise TypeError(
+                f"Invalid type for unit: {type(unit)}, must be Unit or CombinedUnit"
+            )
+        array = np.round(array, decimal_places)
+        array.setflags(write=False)
+        self.__values = array
+        self.__unit = unit
+        self.__decimal_places = decimal_places
+        self.__connected_interface = connected_interface
+
+    @classmethod
+    def fromNumberValues(
+        cls,
+        values: Iterable[NumberValue],
+        unit: Unit | CombinedUnit | None = None,
+    ) -> NumberArray:
+        values = list(values)
+        if unit is None and values:
+            unit = values[0].unit
+        decimal_places = max((value.decimal_places for value in values), default=9)
+        factors: dict[int, float] = {}
+        raw_values = np.empty(len(values), dtype=np.float64)
+        for index, value in enumerate(values):
+            key = id(value.unit)
+            if key not in factors:
+                factors[key] = syncUnitsAddAndSub(value.unit, unit)[1]
+            raw_values[index] = float(value.value) * factors[key]
+        return cls(raw_values, unit=unit, decimal_places=decimal_places)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.__values
+
+    @property
+    def unit(self) -> Unit | CombinedUnit | None:
+        return self.__unit
+
+    @property
+    def decimal_places(self) -> int:
+        return self.__decimal_places
+
+    @property
+    def connected_interface(self) -> Any:
+        return self.__connected_interface
+
+    def convert(
+        self,
+        to_unit: Unit | CombinedUnit,
+        dates: Iterable[datetime | date] | None = None,
+    ) -> NumberArray:
+        if self.unit is None:
+            raise ValueError("Cannot convert a unitless number")
+        if dates is not None:
+            return self.__convertAtDates(to_unit, list(dates))
+        new_unit, factor = self.__getConversion(to_unit)
+        return self.__new(self.values * factor, new_unit, self.decimal_places)
+
+    def __getConversion(
+        self, to_unit: Unit | CombinedUnit, date: datetime | date | None = None
+    ) -> tuple[Unit | CombinedUnit, float]:
+        if isinstance(self.unit, CombinedUnit):
+            new_unit = self.unit.resetTotalFactor().convert(to_unit, date)
+            return new_unit, new_unit.total_factor
+        factor, new_unit = self.unit.convert(to_unit, date)
+        return new_unit, factor
+
+    def __convertAtDates(
+        self, to_unit: Unit | CombinedUnit, dates: list[datetime | date]
+    ) -> NumberArray:
+        if len(dates) != len(self):
+            raise ValueError(
+                f"Expected {len(self)} dates for conversion, got {len(dates)}"
+            )
+        rate_store = CurrencyUnit.RATE_STORE
+        if (
+            rate_store is not None
+            and isinstance(self.unit, CurrencyUnit)
+            and isinstance(to_unit, CurrencyUnit)
+        ):
+            factors = np.asarray(rate_store.rates_at(self.unit, dates)) / np.asarray(
+                rate_store.rates_at(to_unit, dates)
+            )
+            return self.__new(self.values * factors, to_unit, self.decimal_places)
+        conversions = {at: self.__getConversion(to_unit, at) for at in set(dates)}
+        factors = np.asarray([conversions[at][1] for at in dates])
+        new_unit = conversions[dates[0]][0] if dates else to_unit
+        return self.__new(self.values * factors, new_unit, self.decimal_places)
+
+    def toNumberValues(self) -> list[NumberValue]:
+        return list(self)
+
+    def __new(
+        self,
+        values: np.ndarray,
+        unit: Unit | CombinedUnit | None,
+        decimal_places: int,
+    ) -> NumberArray:
+        return NumberArray(values, unit=unit, decimal_places=decimal_places)
+
+    def __toNumberValue(self, value: Any) -> NumberValue:
+        return NumberValue(
+            value=float(value),
+            unit=self.unit,
+            decimal_places=self.decimal_places,
+            connected_interface=self.connected_interface,
+        )
+
+    def __cast(
+        self, other: Any
+    ) -> tuple[np.ndarray | float, Unit | CombinedUnit | None, int]:
+        if isinstance(other, NumberArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    f"Cannot combine NumberArrays of length {len(self)} and {len(other)}"
+                )
+            return other.values, other.unit, other.decimal_places
+        if isinstance(other, NumberValue):
+            return float(other.value), other.unit, other.decimal_places
+        if isinstance(other, np.ndarray):
+            return other.astype(np.float64), None, self.decimal_places
+        try:
+            return float(other), None, self.decimal_places
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid operand for NumberArray: {other}")
+
+    def __addAndSub(self, other: Any, operation: Callable) -> NumberArray:
+        other_values, other_unit, other_decimal_places = self.__cast(other)
+        new_unit, factor = syncUnitsAddAndSub(self.unit, other_unit)
+        return self.__new(
+            operation(self.values * factor, other_values),
+            new_unit,
+            max(self.decimal_places, other_decimal_places),
+        )
+
+    def __mulAndDiv(self, other: Any, operation: Callable) -> NumberArray:
+        other_values, other_unit, other_decimal_places = self.__cast(other)
+        new_unit, factor = syncUnitsMulAndDiv(self.unit, other_unit, operation)
+        return self.__new(
+            operation(self.values, other_values) * factor,
+            new_unit,
+            max(self.decimal_places, other_decimal_places),
+        )
+
+    def __boolOperation(self, other: Any, operation: Callable) -> np.ndarray:
+        other_values, other_unit, _ = self.__cast(other)
+        _, factor = syncUnitsAddAndSub(self.unit, other_unit)
+        return operation(self.values * factor, other_values)
+
+    def __add__(self, other: Any) -> NumberArray:
+        return self.__addAndSub(other, lambda x, y: x + y)
+
+    def __radd__(self, other: Any) -> NumberArray:
+        return self.__addAndSub(other, lambda x, y: x + y)
+
+    def __sub__(self, other: Any) -> NumberArray:
+        return self.__addAndSub(other, lambda x, y: x - y)
+
+    def __rsub__(self, other: Any) -> NumberArray:
+        return self.__addAndSub(other, lambda x, y: y - x)
+
+    def __mul__(self, other: Any) -> NumberArray:
+        return self.__mulAndDiv(other, lambda x, y: x * y)
+
+    def __rmul__(self, other: Any) -> NumberArray:
+        return self.__mulAndDiv(other, lambda x, y: x * y)
+
+    def __truediv__(self, other: Any) -> NumberArray:
+        return self.__mulAndDiv(other, lambda x, y: x / y)
+
+    def __eq__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return self.__boolOperation(other, lambda x, y: x == y)
+
+    def __ne__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return self.__boolOperation(other, lambda x, y: x != y)
+
+    def __lt__(self, other: Any) -> np.ndarray:
+        return self.__boolOperation(other, lambda x, y: x < y)
+
+    def __le__(self, other: Any) -> np.ndarray:
+        return self.__boolOperation(other, lambda x, y: x <= y)
+
+    def __gt__(self, other: Any) -> np.ndarray:
+        return self.__boolOperation(other, lambda x, y: x > y)
+
+    def __ge__(self, other: Any) -> np.ndarray:
+        return self.__boolOperation(other, lambda x, y: x >= y)
+
+    def __neg__(self) -> NumberArray:
+        return self.__new(-self.values, self.unit, self.decimal_places)
+
+    def __abs__(self) -> NumberArray:
+        return self.__new(np.abs(self.values), self.unit, self.decimal_places)
+
+    def sum(self) -> NumberValue:
+        return self.__toNumberValue(np.sum(self.values))
+
+    def mean(self) -> NumberValue:
+        if not len(self):
+            raise ValueError("Cannot compute the mean of an empty NumberArray")
+        return self.__toNumberValue(np.mean(self.values))
+
+    def min(self) -> NumberValue:
+        if not len(self):
+            raise ValueError("Cannot compute the min of an empty NumberArray")
+        return self.__toNumberValue(np.min(self.values))
+
+    def max(self) -> NumberValue:
+        if not len(self):
+            raise ValueError("Cannot compute the max of an empty NumberArray")
+        return self.__toNumberValue(np.max(self.values))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[NumberValue]:
+        for value in self.values:
+            yield self.__toNumberValue(value)
+
+    def __getitem__(self, item: int | slice | np.ndarray) -> NumberValue | NumberArray:
+        if isinstance(item, (int, np.integer)):
+            return self.__toNumberValue(self.values[item])
+        return self.__new(self.values[item], self.unit, self.decimal_places)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return f"{self.values} {self.unit if self.unit is not None else ''}".strip()
+
+    def __repr__(self) -> str:
+        return f"NumberArray({self.values.tolist()})"
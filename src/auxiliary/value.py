@@ -1,13 +1,65 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from fractions import Fraction
 from datetime import date, datetime, timedelta, timezone
+from DataBucket.src.auxiliary.lru_cache import LRUCache
 from DataBucket.src.units.unit import Unit, CombinedUnit
 from typing import Any, Callable
+import operator
+
+
+def toDecimal(factor: float | int | Decimal) -> Decimal:
+    if isinstance(factor, float):
+        return Decimal(str(factor))
+    return Decimal(factor)
+
+
+def toFraction(factor: float | int | Decimal | Fraction) -> Fraction:
+    if isinstance(factor, float):
+        return Fraction(str(factor))
+    return Fraction(factor)
+
+
+def syncUnitsAddAndSub(
+    unit: Unit | CombinedUnit | None, other_unit: Unit | CombinedUnit | None
+) -> tuple[Unit | CombinedUnit | None, float]:
+    if unit is None or unit.is_none:
+        return other_unit, 1
+    if other_unit is None or other_unit.is_none:
+        return unit, 1
+    if isinstance(unit, CombinedUnit):
+        new_unit = unit.resetTotalFactor().convert(other_unit)
+        if new_unit != other_unit:
+            raise ValueError("Cannot add or subtract different units")
+        factor = new_unit.total_factor
+    elif isinstance(other_unit, CombinedUnit):
+        new_unit = other_unit.resetTotalFactor().convert(unit)
+        if new_unit != unit:
+            raise ValueError("Cannot add or subtract different units")
+        factor = new_unit.total_factor
+    else:
+        factor, new_unit = unit.convert(other_unit)
+    return new_unit, factor
+
+
+def syncUnitsMulAndDiv(
+    unit: Unit | CombinedUnit | None,
+    other_unit: Unit | CombinedUnit | None,
+    operation: Callable,
+) -> tuple[Unit | CombinedUnit | None, float]:
+    if unit is None or unit.is_none:
+        return other_unit, 1
+    if other_unit is None or other_unit.is_none:
+        return unit, 1
+    new_unit: CombinedUnit = operation(unit, other_unit)
+    return new_unit, new_unit.total_factor
 
 
 class Value:
 
+    __slots__ = ("__value", "__connected_interface")
+
     def __init__(self, value: Any, connected_interface: Any = None) -> None:
         self.__value = value
         self.__connected_interface = connected_interface
@@ -24,8 +76,29 @@ class Value:
         return self.__connected_interface
 
 
+class ConnectionValue(Value):
+
+    __slots__ = ("__instance",)
+
+    def __init__(
+        self, value: Any, connected_interface: Any = None, instance: Any = None
+    ) -> None:
+        super().__init__(value=value, connected_interface=connected_interface)
+        self.__instance = instance
+
+    @property
+    def instance(self) -> Any:
+        return self.__instance
+
+    def __repr__(self) -> str:
+        return f"ConnectionValue({self.value}, {self.connected_interface})"
+
+
 class NumberValue(Value):
 
+    __slots__ = ("__decimal_places", "__unit")
+    __QUANTIZERS: dict[int, Decimal] = {}
+
     def __init__(
         self,
         value: float | Decimal | int,
@@ -34,7 +107,7 @@ class NumberValue(Value):
         connected_interface: Any = None,
     ) -> None:
         try:
-            value = Decimal(value).quantize(Decimal(f"1e-{decimal_places}"))
+            value = Decimal(value).quantize(self.__getQuantizer(decimal_places))
         except ValueError:
             raise ValueError(f"Invalid value for NumberValue: {value}")
         super().__init__(value=value, connected_interface=connected_interface)
@@ -49,6 +122,42 @@ class NumberValue(Value):
             )
         self.__unit = unit
 
+    @classmethod
+    def _fromDecimal(
+        cls,
+        value: Decimal,
+        unit: Unit | CombinedUnit | None,
+        decimal_places: int,
+        connected_interface: Any = None,
+    ) -> NumberValue:
+        number_value = cls.__new__(cls)
+        number_value._setState(
+            value.quantize(cls.__getQuantizer(decimal_places)),
+            unit,
+            decimal_places,
+            connected_interface,
+        )
+        return number_value
+
+    def _setState(
+        self,
+        value: Decimal | None,
+        unit: Unit | CombinedUnit | None,
+        decimal_places: int,
+        connected_interface: Any = None,
+    ) -> None:
+        Value.__init__(self, value, connected_interface)
+        self.__decimal_places = decimal_places
+        self.__unit = unit
+
+    @classmethod
+    def __getQuantizer(cls, decimal_places: int) -> Decimal:
+        quantizer = cls.__QUANTIZERS.get(decimal_places)
+        if quantizer is None:
+            quantizer = Decimal(f"1e-{decimal_places}")
+            cls.__QUANTIZERS[decimal_places] = quantizer
+        return quantizer
+
     @property
     def decimal_places(self) -> int:
         return self.__decimal_places
@@ -57,20 +166,22 @@ class NumberValue(Value):
     def unit(self) -> Unit | CombinedUnit | None:
         return self.__unit
 
-    def convert(self, to_unit: Unit) -> NumberValue:
+    def convert(
+        self, to_unit: Unit | CombinedUnit, date: datetime | date | None = None
+    ) -> NumberValue:
         if self.unit is None:
             raise ValueError("Cannot convert a unitless number")
         if isinstance(self.unit, CombinedUnit):
             combined_unit = self.unit.resetTotalFactor()
-            new_unit = combined_unit.convert(to_unit)
+            new_unit = combined_unit.convert(to_unit, date)
             factor = new_unit.total_factor
         else:
-            factor, new_unit = self.unit.convert(to_unit)
-        return NumberValue(
-            value=self.value * factor,
-            unit=new_unit,
-            decimal_places=self.decimal_places,
-            connected_interface=self.connected_interface,
+            factor, new_unit = self.unit.convert(to_unit, date)
+        return NumberValue._fromDecimal(
+            self.value * toDecimal(factor),
+            new_unit,
+            self.decimal_places,
+            self.connected_interface,
         )
 
     @classmethod
@@ -97,56 +208,29 @@ class NumberValue(Value):
     ) -> NumberValue:
         other = self.__cast(other, decimal_places=self.decimal_places)
         new_unit, factor = self.__syncUnitsAddAndSub(other)
-        new_value = operation(self.value * factor, other.value)
-        return NumberValue(
-            value=new_value,
-            decimal_places=max(self.decimal_places, other.decimal_places),
-            connected_interface=None,
-            unit=new_unit,
+        new_value = operation(self.value * toDecimal(factor), other.value)
+        return NumberValue._fromDecimal(
+            new_value, new_unit, max(self.decimal_places, other.decimal_places)
         )
 
     def __syncUnitsAddAndSub(
         self, other: NumberValue
     ) -> tuple[Unit | CombinedUnit | None, float]:
-        if self.unit is None or self.unit.is_none:
-            return other.unit, 1
-        if other.unit is None or other.unit.is_none:
-            return self.unit, 1
-        if isinstance(self.unit, CombinedUnit):
-            new_unit = self.unit.resetTotalFactor().convert(other.unit)
-            if new_unit != other.unit:
-                raise ValueError("Cannot add or subtract different units")
-            factor = new_unit.total_factor
-        elif isinstance(other.unit, CombinedUnit):
-            new_unit = other.unit.resetTotalFactor().convert(self.unit)
-            if new_unit != self.unit:
-                raise ValueError("Cannot add or subtract different units")
-            factor = new_unit.total_factor
-        else:
-            factor, new_unit = self.unit.convert(other.unit)
-        return new_unit, factor
+        return syncUnitsAddAndSub(self.unit, other.unit)
 
     def __syncUnitsMulAndDiv(
         self, other: NumberValue, operation: Callable
     ) -> tuple[Unit | CombinedUnit | None, float]:
-        if self.unit is None or self.unit.is_none:
-            return other.unit, 1
-        if other.unit is None or other.unit.is_none:
-            return self.unit, 1
-        new_unit: CombinedUnit = operation(self.unit, other.unit)
-        return new_unit, new_unit.total_factor
+        return syncUnitsMulAndDiv(self.unit, other.unit, operation)
 
     def __mulAndDiv(
         self, other: NumberValue | int | float | str, operation: Callable
     ) -> NumberValue:
         other = self.__cast(other, decimal_places=self.decimal_places)
         new_unit, factor = self.__syncUnitsMulAndDiv(other, operation)
-        new_value = operation(self.value, other.value) * factor
-        return NumberValue(
-            value=new_value,
-            decimal_places=max(self.decimal_places, other.decimal_places),
-            connected_interface=None,
-            unit=new_unit,
+        new_value = operation(self.value, other.value) * toDecimal(factor)
+        return NumberValue._fromDecimal(
+            new_value, new_unit, max(self.decimal_places, other.decimal_places)
         )
 
     def __powOperation(
@@ -157,11 +241,10 @@ class NumberValue(Value):
                 raise ValueError("Cannot raise a number to a unit")
 
         other = self.__cast(self, decimal_places=self.decimal_places)
-        return NumberValue(
-            value=operation(self.value, other.value),
-            decimal_places=max(self.decimal_places, other.decimal_places),
-            connected_interface=None,
-            unit=self.unit,
+        return NumberValue._fromDecimal(
+            operation(self.value, other.value),
+            self.unit,
+            max(self.decimal_places, other.decimal_places),
         )
 
     def __boolOperation(
@@ -224,19 +307,19 @@ class NumberValue(Value):
         return self.__mathOperation(other, lambda x, y: x >> y)
 
     def __neg__(self) -> NumberValue:
-        return NumberValue(value=-self.value, decimal_places=self.decimal_places)
+        return NumberValue._fromDecimal(-self.value, None, self.decimal_places)
 
     def __pos__(self) -> NumberValue:
-        return NumberValue(value=+self.value, decimal_places=self.decimal_places)
+        return NumberValue._fromDecimal(+self.value, None, self.decimal_places)
 
     def __abs__(self) -> NumberValue:
-        return NumberValue(value=abs(self.value), decimal_places=self.decimal_places)
+        return NumberValue._fromDecimal(abs(self.value), None, self.decimal_places)
 
     def __invert__(self) -> NumberValue:
         return NumberValue(value=~self.value, decimal_places=self.decimal_places)
 
     def __round__(self, n: int = 0) -> NumberValue:
-        return NumberValue(value=self.value, decimal_places=n)
+        return NumberValue._fromDecimal(self.value, None, n)
 
     def __floor__(self) -> NumberValue:
         return NumberValue(value=int(self.value), decimal_places=0)
@@ -257,8 +340,234 @@ class NumberValue(Value):
         return f"NumberValue({self.value})"
 
 
+class FixedPointNumberValue(NumberValue):
+
+    __slots__ = ("__scaled",)
+    EXACT_FACTOR_CACHE_SIZE: int = 256
+    __EXACT_FACTORS = LRUCache(EXACT_FACTOR_CACHE_SIZE)
+
+    def __init__(
+        self,
+        value: float | Decimal | int,
+        unit: Unit | CombinedUnit | None = None,
+        decimal_places: int = 9,
+        connected_interface: Any = None,
+    ) -> None:
+        super().__init__(
+            value,
+            unit=unit,
+            decimal_places=decimal_places,
+            connected_interface=connected_interface,
+        )
+        self.__scaled = int(Value.value.fget(self).scaleb(decimal_places))
+        self._setState(None, self.unit, decimal_places, connected_interface)
+
+    @classmethod
+    def _fromScaled(
+        cls,
+        scaled: int,
+        unit: Unit | CombinedUnit | None,
+        decimal_places: int,
+        connected_interface: Any = None,
+    ) -> FixedPointNumberValue:
+        number_value = cls.__new__(cls)
+        number_value._setState(None, unit, decimal_places, connected_interface)
+        number_value.__scaled = scaled
+        return number_value
+
+    @classmethod
+    def fromNumberValue(cls, number_value: NumberValue) -> FixedPointNumberValue:
+        if isinstance(number_value, FixedPointNumberValue):
+            return number_value
+        return cls(
+            number_value.value,
+            unit=number_value.unit,
+            decimal_places=number_value.decimal_places,
+            connected_interface=number_value.connected_interface,
+        )
+
+    @property
+    def scaled(self) -> int:
+        return self.__scaled
+
+    @property
+    def value(self) -> Decimal:
+        return Decimal(self.__scaled).scaleb(-self.decimal_places)
+
+    @staticmethod
+    def __divideRounded(numerator: int, denominator: int) -> int:
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        quotient, remainder = divmod(numerator, denominator)
+        doubled_remainder = 2 * remainder
+        if doubled_remainder > denominator or (
+            doubled_remainder == denominator and quotient & 1
+        ):
+            quotient += 1
+        return quotient
+
+    @classmethod
+    def __getExactFactor(cls, factor: float | int | Fraction) -> tuple[int, int]:
+        if factor == 1:
+            return 1, 1
+        return cls.__EXACT_FACTORS.getOrCompute(
+            factor, lambda: toFraction(factor).as_integer_ratio()
+        )
+
+    @classmethod
+    def __cast(cls, value: Any, decimal_places: int) -> FixedPointNumberValue:
+        if isinstance(value, FixedPointNumberValue):
+            return value
+        if isinstance(value, NumberValue):
+            return cls.fromNumberValue(value)
+        if isinstance(value, Value):
+            value = value.value
+        return cls(value, decimal_places=decimal_places)
+
+    @classmethod
+    def __getAddFactor(
+        cls, unit: Unit | CombinedUnit | None, other_unit: Unit | CombinedUnit | None
+    ) -> tuple[Unit | CombinedUnit | None, int, int]:
+        if unit is other_unit:
+            return other_unit, 1, 1
+        if isinstance(unit, Unit) and isinstance(other_unit, Unit):
+            factor, new_unit = unit.convertExact(other_unit)
+            return new_unit, factor.numerator, factor.denominator
+        new_unit, factor = syncUnitsAddAndSub(unit, other_unit)
+        return new_unit, *cls.__getExactFactor(factor)
+
+    def __addAndSub(self, other: Any, sign: int) -> FixedPointNumberValue:
+        other = self.__cast(other, self.decimal_places)
+        decimal_places = max(self.decimal_places, other.decimal_places)
+        new_unit, numerator, denominator = self.__getAddFactor(self.unit, other.unit)
+        left = self.__scaled * numerator * 10 ** (decimal_places - self.decimal_places)
+        if denominator != 1:
+            left = self.__divideRounded(left, denominator)
+        right = other.__scaled * 10 ** (decimal_places - other.decimal_places)
+        return FixedPointNumberValue._fromScaled(
+            left + sign * right, new_unit, decimal_places
+        )
+
+    def __mulAndDiv(self, other: Any, operation: Callable) -> FixedPointNumberValue:
+        other = self.__cast(other, self.decimal_places)
+        new_unit, factor = syncUnitsMulAndDiv(self.unit, other.unit, operation)
+        factor_numerator, factor_denominator = self.__getExactFactor(factor)
+        decimal_places = max(self.decimal_places, other.decimal_places)
+        if operation is operator.mul:
+            numerator = self.__scaled * other.__scaled * factor_numerator
+            denominator = factor_denominator * 10 ** (
+                self.decimal_places + other.decimal_places - decimal_places
+            )
+        else:
+            numerator = (
+                self.__scaled
+                * factor_numerator
+                * 10 ** (other.decimal_places + decimal_places - self.decimal_places)
+            )
+            denominator = other.__scaled * factor_denominator
+        return FixedPointNumberValue._fromScaled(
+            self.__divideRounded(numerator, denominator), new_unit, decimal_places
+        )
+
+    def __compare(self, other: Any, operation: Callable) -> bool:
+        other = self.__cast(other, self.decimal_places)
+        decimal_places = max(self.decimal_places, other.decimal_places)
+        return operation(
+            self.__scaled * 10 ** (decimal_places - self.decimal_places),
+            other.__scaled * 10 ** (decimal_places - other.decimal_places),
+        )
+
+    def convert(
+        self, to_unit: Unit | CombinedUnit, date: datetime | date | None = None
+    ) -> FixedPointNumberValue:
+        if date is None and isinstance(self.unit, Unit) and isinstance(to_unit, Unit):
+            factor, new_unit = self.unit.convertExact(to_unit)
+            return FixedPointNumberValue._fromScaled(
+                self.__divideRounded(
+                    self.__scaled * factor.numerator, factor.denominator
+                ),
+                new_unit,
+                self.decimal_places,
+                self.connected_interface,
+            )
+        return self.fromNumberValue(super().convert(to_unit, date))
+
+    def toNumberValue(self) -> NumberValue:
+        return NumberValue._fromDecimal(
+            self.value, self.unit, self.decimal_places, self.connected_interface
+        )
+
+    def __add__(self, other: Any) -> FixedPointNumberValue:
+        return self.__addAndSub(other, 1)
+
+    def __sub__(self, other: Any) -> FixedPointNumberValue:
+        return self.__addAndSub(other, -1)
+
+    def __mul__(self, other: Any) -> FixedPointNumberValue:
+        return self.__mulAndDiv(other, operator.mul)
+
+    def __truediv__(self, other: Any) -> FixedPointNumberValue:
+        return self.__mulAndDiv(other, operator.truediv)
+
+    def __floordiv__(self, other: Any) -> FixedPointNumberValue:
+        return self.fromNumberValue(super().__floordiv__(other))
+
+    def __mod__(self, other: Any) -> FixedPointNumberValue:
+        return self.fromNumberValue(super().__mod__(other))
+
+    def __pow__(self, other: Any) -> FixedPointNumberValue:
+        return self.fromNumberValue(super().__pow__(other))
+
+    def __round__(self, n: int = 0) -> FixedPointNumberValue:
+        return self.fromNumberValue(super().__round__(n))
+
+    def __floor__(self) -> FixedPointNumberValue:
+        return self.fromNumberValue(super().__floor__())
+
+    def __ceil__(self) -> FixedPointNumberValue:
+        return self.fromNumberValue(super().__ceil__())
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__compare(other, operator.eq)
+
+    def __ne__(self, other: Any) -> bool:
+        return self.__compare(other, operator.ne)
+
+    def __lt__(self, other: Any) -> bool:
+        return self.__compare(other, operator.lt)
+
+    def __le__(self, other: Any) -> bool:
+        return self.__compare(other, operator.le)
+
+    def __gt__(self, other: Any) -> bool:
+        return self.__compare(other, operator.gt)
+
+    def __ge__(self, other: Any) -> bool:
+        return self.__compare(other, operator.ge)
+
+    def __neg__(self) -> FixedPointNumberValue:
+        return FixedPointNumberValue._fromScaled(
+            -self.__scaled, None, self.decimal_places
+        )
+
+    def __pos__(self) -> FixedPointNumberValue:
+        return FixedPointNumberValue._fromScaled(
+            self.__scaled, None, self.decimal_places
+        )
+
+    def __abs__(self) -> FixedPointNumberValue:
+        return FixedPointNumberValue._fromScaled(
+            abs(self.__scaled), None, self.decimal_places
+        )
+
+    def __repr__(self) -> str:
+        return f"FixedPointNumberValue({self.value})"
+
+
 class StringValue(Value):
 
+    __slots__ = ()
+
     def __init__(self, value: Any, connected_interface: Any = None) -> None:
         super().__init__(value=str(value), connected_interface=connected_interface)
 
@@ -317,6 +626,8 @@ class StringValue(Value):
 
 class BooleanValue(Value):
 
+    __slots__ = ()
+
     def __init__(self, value: Any, connected_interface: Any = None) -> None:
         super().__init__(value=bool(value), connected_interface=connected_interface)
 
@@ -369,6 +680,8 @@ class BooleanValue(Value):
 
 class DateValue(Value):
 
+    __slots__ = ()
+
     def __init__(
         self, value: str | datetime | date, connected_interface: Any = None
     ) -> None:
@@ -437,6 +750,8 @@ class DateValue(Value):
 
 class DateTimeValue(Value):
 
+    __slots__ = ()
+
     def __init__(
         self, value: str | datetime | date, connected_interface: Any = None
     ) -> None:
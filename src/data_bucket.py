@@ -1,26 +1,82 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+from DataBucket.src.auxiliary.identity_map import IdentityMap
+from DataBucket.src.database.bucket_cache import BucketCache, freezeCacheKey
+from DataBucket.src.database.instrumentation import Instrumentation
+from DataBucket.src.database.session import DataBucketSession
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    TYPE_CHECKING,
+)
+import copy
 
 if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from pyarrow import RecordBatch, Table
     from DataBucket.src.auxiliary.interface_definition import DataInterface
+    from DataBucket.src.auxiliary.value import NumberValue, Value
+    from DataBucket.src.units.unit import Unit, CombinedUnit
 
 
 class DataBucket:
 
-    objects: DataInterface
+    objects: DataBucketObject
     DataInterface: DataInterface
+    cache_invalidation: dict | None = None
+    lazy_models: bool | str | None = None
+
+    LAZY_MODES: tuple[str, ...] = ("ready",)
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
         if hasattr(cls, "DataInterface"):
+            lazy_mode = cls.__getLazyMode()
             cls.DataInterface.data_bucket = cls()
-            cls.DataInterface.initialize_class()
-            cls.objects = cls.DataInterface
+            cls.DataInterface.initialize_class(lazy=lazy_mode is not None)
+            cls.objects = DataBucketObject(cls.DataInterface)
+            DataBucketRegistry.register(
+                cls, cls.DataInterface.app_label, lazy_mode=lazy_mode
+            )
+            if cls.cache_invalidation is not None:
+                cls.DataInterface.cache = BucketCache.fromConfiguration(
+                    cls.DataInterface, cls.cache_invalidation
+                )
+
+    @classmethod
+    def __getLazyMode(cls) -> str | None:
+        lazy_models = cls.lazy_models
+        if lazy_models is None:
+            lazy_models = getattr(settings, "DATA_BUCKET_LAZY_MODELS", False)
+        if lazy_models is False or lazy_models is None:
+            return None
+        if lazy_models is True:
+            return "ready"
+        if lazy_models not in cls.LAZY_MODES:
+            raise ValueError(
+                f"lazy_models must be a bool or one of {cls.LAZY_MODES}, not {lazy_models}"
+            )
+        return lazy_models
+
+    def __init__(self, id: int | None = None, **values: Value) -> None:
+        self.id = id
+        for field_name, value in values.items():
+            setattr(self, field_name, value)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.id})"
 
 
 class DataBucketObject:
-    def __init__(self, data_interface: DataInterface):
-        self.data_interface = DataInterface
+    def __init__(self, data_interface: type[DataInterface]):
+        self.data_interface = data_interface
 
     def filter(self, filter: dict):
         return self.data_interface.filter(filter)
@@ -31,23 +87,449 @@ class DataBucketObject:
     def all(self):
         return self.data_interface.all()
 
-    def create(self, data: dict):
-        return self.data_interface.create(data)
+    def create(self, data: dict, creator: Any = None):
+        return self.__write(
+            "create",
+            self.data_interface.create,
+            data,
+            creator=creator,
+            count_rows=Instrumentation.countRecords,
+        )
+
+    def bulk_create(
+        self, rows: Iterable[dict], creator: Any = None, batch_size: int | None = None
+    ):
+        return self.__write(
+            "bulk_create",
+            self.data_interface.bulk_create,
+            rows,
+            creator=creator,
+            batch_size=batch_size,
+            count_rows=Instrumentation.countRecords,
+        )
 
     def delete(self, id: int):
-        return self.data_interface.delete(id)
+        return self.__write(
+            "delete",
+            self.data_interface.delete,
+            id,
+            deleted_ids=(id,),
+            count_rows=Instrumentation.countRecords,
+        )
+
+    def bulk_delete(self, ids: Iterable[int]):
+        ids = list(ids)
+        return self.__write(
+            "bulk_delete",
+            self.data_interface.bulk_delete,
+            ids,
+            deleted_ids=ids,
+            count_rows=int,
+        )
+
+    def update(self, id: int, data: dict, creator: Any = None):
+        return self.__write(
+            "update",
+            self.data_interface.update,
+            id,
+            data,
+            creator=creator,
+            count_rows=Instrumentation.countRecords,
+        )
 
-    def update(self, id: int, data: dict):
-        return self.data_interface.update(id, data)
+    def bulk_update(
+        self,
+        ids: Iterable[int],
+        rows: Iterable[dict],
+        creator: Any = None,
+        batch_size: int | None = None,
+    ):
+        return self.__write(
+            "bulk_update",
+            self.data_interface.bulk_update,
+            ids,
+            rows,
+            creator=creator,
+            batch_size=batch_size,
+            count_rows=Instrumentation.countRecords,
+        )
 
     def get(self, filter: dict):
-        return self.filter(filter).first()
+        session = DataBucketSession.getCurrent()
+        if session is None:
+            return self.__get(filter)
+        return session.get(self.data_interface, filter, lambda: self.__get(filter))
+
+    def __get(self, filter: dict):
+        return Instrumentation.run(
+            self.data_interface,
+            "get",
+            self.data_interface.get,
+            filter,
+            count_rows=Instrumentation.countRecords,
+        )
+
+    def __write(
+        self,
+        operation: str,
+        function: Callable[..., Any],
+        *args: Any,
+        deleted_ids: Iterable[int] = (),
+        count_rows: Callable[[Any], int] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        session = DataBucketSession.getCurrent()
+        if session is not None:
+            session.flush()
+        result = Instrumentation.run(
+            self.data_interface,
+            operation,
+            function,
+            *args,
+            count_rows=count_rows,
+            **kwargs,
+        )
+        if session is not None:
+            if deleted_ids:
+                session.recordWrite(self.data_interface, deleted_ids=deleted_ids)
+            elif isinstance(result, list):
+                session.recordWrite(self.data_interface, result)
+            elif result is not None:
+                session.recordWrite(self.data_interface, [result])
+        return result
+
+    async def afilter(self, filter: dict):
+        return await self.data_interface.afilter(filter)
+
+    async def aall(self):
+        return await self.data_interface.aall()
+
+    async def aget(self, filter: dict):
+        return await self.data_interface.aget(filter)
+
+    async def acreate(self, data: dict, creator: Any = None):
+        return await self.data_interface.acreate(data, creator=creator)
+
+    async def abulk_create(
+        self, rows: Iterable[dict], creator: Any = None, batch_size: int | None = None
+    ):
+        return await self.data_interface.abulk_create(
+            rows, creator=creator, batch_size=batch_size
+        )
+
+    async def aupdate(self, id: int, data: dict, creator: Any = None):
+        return await self.data_interface.aupdate(id, data, creator=creator)
+
+    async def adelete(self, id: int):
+        return await self.data_interface.adelete(id)
+
+    def synchronize(
+        self, rows: Iterable[dict], creator: Any = None, delete_missing: bool = False
+    ):
+        session = DataBucketSession.getCurrent()
+        if session is not None:
+            session.flush()
+        result = Instrumentation.run(
+            self.data_interface,
+            "synchronize",
+            self.data_interface.synchronize,
+            rows,
+            creator=creator,
+            delete_missing=delete_missing,
+            count_rows=lambda result: sum(result.values()),
+        )
+        if session is not None:
+            session.recordWrite(self.data_interface, forget_all=True)
+        return result
 
 
 class DataBucketQuerryset:
 
-    def __getitem__(self, item):
-        return self[item]
+    ITERATOR_CHUNK_SIZE: int = 2000
+
+    def __init__(
+        self,
+        data_interface: type[DataInterface],
+        queryset: QuerySet,
+        operation: str = "all",
+    ):
+        self.data_interface = data_interface
+        self.queryset = queryset
+        self.operation = operation
+        self.__result_cache: list[DataBucket] | None = None
+        self.__select_related: tuple[str, ...] = ()
+        self.__prefetch_related: tuple[str, ...] = ()
+        self.__identity_map: IdentityMap | None = None
+
+    def __clone(
+        self,
+        queryset: QuerySet,
+        select_related: tuple[str, ...] | None = None,
+        prefetch_related: tuple[str, ...] | None = None,
+        identity_map: IdentityMap | None = None,
+    ) -> DataBucketQuerryset:
+        clone = DataBucketQuerryset(self.data_interface, queryset, self.operation)
+        clone.__select_related = (
+            self.__select_related if select_related is None else select_related
+        )
+        clone.__prefetch_related = (
+            self.__prefetch_related if prefetch_related is None else prefetch_related
+        )
+        clone.__identity_map = (
+            self.__identity_map if identity_map is None else identity_map
+        )
+        return clone
+
+    def select_related(
+        self, *field_names: str, identity_map: IdentityMap | None = None
+    ) -> DataBucketQuerryset:
+        return self.__clone(
+            self.queryset,
+            select_related=self.__select_related + field_names,
+            identity_map=identity_map,
+        )
+
+    def prefetch_related(
+        self, *lookups: str, identity_map: IdentityMap | None = None
+    ) -> DataBucketQuerryset:
+        return self.__clone(
+            self.queryset,
+            prefetch_related=self.__prefetch_related + lookups,
+            identity_map=identity_map,
+        )
+
+    def __prefetch(
+        self, records: list[DataBucket], copy_records: bool = False
+    ) -> list[DataBucket]:
+        if not records or not (self.__select_related or self.__prefetch_related):
+            return records
+        if copy_records:
+            records = [copy.copy(record) for record in records]
+        identity_map = self.__identity_map
+        if identity_map is None:
+            session = DataBucketSession.getCurrent()
+            identity_map = IdentityMap() if session is None else session.identity_map
+        if self.__select_related:
+            self.data_interface._prefetchConnections(
+                records, self.__select_related, identity_map, many_to_many=False
+            )
+        if self.__prefetch_related:
+            self.data_interface._prefetchConnections(
+                records, self.__prefetch_related, identity_map
+            )
+        return records
+
+    def __measure(
+        self,
+        operation: str,
+        function: Callable[..., Any],
+        *args: Any,
+        count_rows: Callable[[Any], int] | None = None,
+    ) -> Any:
+        return Instrumentation.run(
+            self.data_interface, operation, function, *args, count_rows=count_rows
+        )
+
+    def __fetchAll(self) -> list[DataBucket]:
+        if self.__result_cache is None:
+            self.__result_cache = self.__measure(
+                self.operation, self.__fetchResults, count_rows=len
+            )
+        return self.__result_cache
+
+    def __fetchResults(self) -> list[DataBucket]:
+        cache = self.data_interface.cache
+        cache_key = self.__getCacheKey() if cache is not None else None
+        if cache_key is None:
+            records = self.__fetchRecords()
+        else:
+            records = cache.getOrFetch(cache_key, self.__fetchRecords)
+        session = DataBucketSession.getCurrent()
+        if session is None:
+            return self.__prefetch(records, copy_records=cache_key is not None)
+        if cache_key is not None:
+            records = [copy.copy(record) for record in records]
+        return self.__prefetch(session.register(records))
+
+    def __fetchRecords(self) -> list[DataBucket]:
+        return [
+            self.data_interface._toRecord(model_object)
+            for model_object in self.queryset
+        ]
+
+    def __getCacheKey(self) -> Hashable | None:
+        try:
+            sql, params = self.queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        return ("querryset", sql, freezeCacheKey(params))
+
+    def __iter__(self) -> Iterator[DataBucket]:
+        return iter(self.__fetchAll())
+
+    def __len__(self) -> int:
+        return len(self.__fetchAll())
+
+    def __bool__(self) -> bool:
+        if self.__result_cache is not None:
+            return bool(self.__result_cache)
+        return self.exists()
+
+    def __getitem__(self, item: int | slice) -> DataBucket | DataBucketQuerryset:
+        if self.__result_cache is not None:
+            if isinstance(item, slice):
+                return self.__clone(self.queryset[item])
+            return self.__result_cache[item]
+        if isinstance(item, slice):
+            return self.__clone(self.queryset[item])
+        return self.__measure(
+            self.operation,
+            lambda: self.__prefetch(
+                [self.data_interface._toRecord(self.queryset[item])]
+            )[0],
+            count_rows=Instrumentation.countRecords,
+        )
+
+    async def __aiter__(self) -> AsyncIterator[DataBucket]:
+        if self.__select_related or self.__prefetch_related:
+            await self.alist()
+        if self.__result_cache is not None:
+            for record in self.__result_cache:
+                yield record
+            return
+        async for model_object in self.queryset.aiterator(
+            chunk_size=self.ITERATOR_CHUNK_SIZE
+        ):
+            yield self.data_interface._toRecord(model_object)
+
+    async def alist(self) -> list[DataBucket]:
+        if self.__result_cache is None:
+            cache = self.data_interface.cache
+            cache_key = self.__getCacheKey() if cache is not None else None
+            if cache_key is None:
+                records = await self.__afetchRecords()
+            else:
+                records = await cache.agetOrFetch(cache_key, self.__afetchRecords)
+            self.__result_cache = await sync_to_async(self.__prefetch)(
+                records, copy_records=cache_key is not None
+            )
+        return self.__result_cache
+
+    async def __afetchRecords(self) -> list[DataBucket]:
+        return [
+            self.data_interface._toRecord(model_object)
+            async for model_object in self.queryset
+        ]
+
+    async def acount(self) -> int:
+        if self.__result_cache is not None:
+            return len(self.__result_cache)
+        return await self.queryset.acount()
+
+    async def aexists(self) -> bool:
+        if self.__result_cache is not None:
+            return bool(self.__result_cache)
+        return await self.queryset.aexists()
+
+    async def afirst(self) -> DataBucket | None:
+        return await self.__aToRecordOrNone(await self.queryset.afirst())
+
+    async def alast(self) -> DataBucket | None:
+        return await self.__aToRecordOrNone(await self.queryset.alast())
+
+    async def __aToRecordOrNone(self, model_object: Any) -> DataBucket | None:
+        if model_object is None:
+            return None
+        records = [self.data_interface._toRecord(model_object)]
+        if self.__select_related or self.__prefetch_related:
+            records = await sync_to_async(self.__prefetch)(records)
+        return records[0]
+
+    def iterator(self, chunk_size: int | None = None) -> Iterator[DataBucket]:
+        chunk_size = chunk_size or self.ITERATOR_CHUNK_SIZE
+        chunk = []
+        for model_object in self.queryset.iterator(chunk_size=chunk_size):
+            chunk.append(self.data_interface._toRecord(model_object))
+            if len(chunk) == chunk_size:
+                yield from self.__prefetch(chunk)
+                chunk = []
+        yield from self.__prefetch(chunk)
+
+    def toArrowBatches(self, chunk_size: int | None = None) -> Iterator[RecordBatch]:
+        from DataBucket.src.database.arrow_export import ArrowExporter
+
+        return ArrowExporter(self.data_interface, chunk_size).iterBatches(self.queryset)
+
+    def toArrowTable(self, chunk_size: int | None = None) -> Table:
+        from DataBucket.src.database.arrow_export import ArrowExporter
+
+        return ArrowExporter(self.data_interface, chunk_size).toTable(self.queryset)
+
+    def toParquet(
+        self, where: Any, chunk_size: int | None = None, **writer_options: Any
+    ) -> int:
+        from DataBucket.src.database.arrow_export import ArrowExporter
+
+        return ArrowExporter(self.data_interface, chunk_size).writeParquet(
+            where, self.queryset, **writer_options
+        )
+
+    def filter(self, filter: dict) -> DataBucketQuerryset:
+        return self.__clone(
+            self.queryset.filter(**self.data_interface._translateFilter(filter))
+        )
+
+    def exclude(self, filter: dict) -> DataBucketQuerryset:
+        return self.__clone(
+            self.queryset.exclude(**self.data_interface._translateFilter(filter))
+        )
+
+    def order_by(self, *field_names: str) -> DataBucketQuerryset:
+        return self.__clone(
+            self.queryset.order_by(*self.data_interface._translateOrdering(field_names))
+        )
+
+    def aggregate(
+        self,
+        to_unit: Unit | CombinedUnit | dict[str, Unit | CombinedUnit] | None = None,
+        **aggregations: str | list[str],
+    ) -> dict[str, NumberValue | None]:
+        return self.__measure(
+            "aggregate",
+            self.data_interface._aggregate,
+            self.queryset,
+            aggregations,
+            to_unit,
+        )
+
+    def count(self) -> int:
+        if self.__result_cache is not None:
+            return len(self.__result_cache)
+        return self.__measure("count", self.queryset.count)
+
+    def exists(self) -> bool:
+        if self.__result_cache is not None:
+            return bool(self.__result_cache)
+        return self.__measure("exists", self.queryset.exists)
+
+    def first(self) -> DataBucket | None:
+        return self.__measure(
+            "first",
+            self.__toRecordOrNone,
+            self.queryset.first,
+            count_rows=Instrumentation.countRecords,
+        )
+
+    def last(self) -> DataBucket | None:
+        return self.__measure(
+            "last",
+            self.__toRecordOrNone,
+            self.queryset.last,
+            count_rows=Instrumentation.countRecords,
+        )
 
-    def first(self):
-        return self[0]
+    def __toRecordOrNone(self, fetch: Callable[[], Any]) -> DataBucket | None:
+        model_object = fetch()
+        if model_object is None:
+            return None
+        return self.__prefetch([self.data_interface._toRecord(model_object)])[0]
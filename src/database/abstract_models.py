@@ -1,6 +1,24 @@
 from django.conf import settings
 from django.db import models
 
+LINK_FIELD_NAME = "link_to_unchangeable"
+CHANGEABLE_RELATED_NAME = "changeable_set"
+CURRENT_VERSION_ORDERING = ("-updated_at", "-pk")
+
+
+class ChangeableQuerySet(models.QuerySet):
+
+    def current(self) -> "ChangeableQuerySet":
+        latest_version = (
+            self.model._default_manager.filter(
+                **{LINK_FIELD_NAME: models.OuterRef(LINK_FIELD_NAME)},
+                is_deleted=False,
+            )
+            .order_by(*CURRENT_VERSION_ORDERING)
+            .values("pk")[:1]
+        )
+        return self.filter(is_deleted=False, pk=models.Subquery(latest_version))
+
 
 class unchangeable(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -10,18 +28,25 @@ class unchangeable(models.Model):
 
     @property
     def get_current_changeable(self):
-        return self.__link_to_unchangeable_set.all().last()  # type: ignore
+        return (
+            getattr(self, CHANGEABLE_RELATED_NAME)
+            .filter(is_deleted=False)
+            .order_by(*CURRENT_VERSION_ORDERING)
+            .first()
+        )
 
 
 class changeable(models.Model):
-    __link_to_unchangeable: models.ForeignKey
+    link_to_unchangeable: models.ForeignKey
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     is_deleted = models.BooleanField(default=False)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ChangeableQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
     @property
     def get_current_unchangeable(self):
-        return self.__link_to_unchangeable
+        return getattr(self, LINK_FIELD_NAME)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.apps import apps
+from threading import Lock
+import os
+
+
+class AppLabelIndex:
+
+    __LOCK = Lock()
+    __LABELS_BY_PATH: dict[str, str] = {}
+    __BUILT_FOR: tuple[int, int] | None = None
+
+    @classmethod
+    def getAppLabel(cls, file_path: str) -> str | None:
+        labels_by_path = cls.__getLabelsByPath()
+        directory = os.path.dirname(os.path.abspath(file_path))
+        while True:
+            label = labels_by_path.get(directory)
+            if label is not None:
+                return label
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+            directory = parent
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls.__LOCK:
+            cls.__LABELS_BY_PATH = {}
+            cls.__BUILT_FOR = None
+
+    @classmethod
+    def __getLabelsByPath(cls) -> dict[str, str]:
+        app_configs = apps.app_configs
+        built_for = (id(app_configs), len(app_configs))
+        if cls.__BUILT_FOR == built_for:
+            return cls.__LABELS_BY_PATH
+        with cls.__LOCK:
+            if cls.__BUILT_FOR != built_for:
+                labels_by_path = {}
+                for app_config in apps.get_app_configs():
+                    labels_by_path.setdefault(
+                        os.path.abspath(app_config.path), app_config.label
+                    )
+                cls.__LABELS_BY_PATH = labels_by_path
+                cls.__BUILT_FOR = built_for
+            return cls.__LABELS_BY_PATH
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+from DataBucket.src.auxiliary.interface_definition import (
+    DataInterface,
+    FieldInformationDict,
+)
+from DataBucket.src.auxiliary.value import toDecimal
+from DataBucket.src.database.abstract_models import LINK_FIELD_NAME
+from DataBucket.src.database.db_field import Number
+from DataBucket.src.units.unit import Unit
+from decimal import Decimal
+from django.db import models
+from typing import Any, BinaryIO, Callable, Iterator
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class ArrowExporter:
+
+    CHUNK_SIZE: int = 10_000
+    ID_COLUMN: str = "id"
+
+    def __init__(
+        self, data_interface: type[DataInterface], chunk_size: int | None = None
+    ) -> None:
+        self.__data_interface = data_interface
+        self.__chunk_size = chunk_size or self.CHUNK_SIZE
+        if self.__chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        self.__fields = [
+            field
+            for field in data_interface.getFields()
+            if field.field_name != self.ID_COLUMN
+        ]
+        self.__schema = self.__buildSchema()
+
+    @property
+    def chunk_size(self) -> int:
+        return self.__chunk_size
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self.__schema
+
+    def iterBatches(
+        self, queryset: models.QuerySet | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        if queryset is None:
+            queryset = self.__data_interface.all().queryset
+        scalar_fields = [
+            field for field in self.__fields if not self.__isManyToMany(field)
+        ]
+        value_paths = [f"{LINK_FIELD_NAME}_id", "pk"] + [
+            self.__getValuePath(field) for field in scalar_fields
+        ]
+        converters = [self.__getConverter(field) for field in scalar_fields]
+        rows = queryset.values_list(*value_paths).iterator(chunk_size=self.__chunk_size)
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == self.__chunk_size:
+                yield self.__toBatch(chunk, scalar_fields, converters)
+                chunk = []
+        if chunk:
+            yield self.__toBatch(chunk, scalar_fields, converters)
+
+    def toTable(self, queryset: models.QuerySet | None = None) -> pa.Table:
+        return pa.Table.from_batches(list(self.iterBatches(queryset)), self.__schema)
+
+    def writeParquet(
+        self,
+        where: str | BinaryIO,
+        queryset: models.QuerySet | None = None,
+        **writer_options: Any,
+    ) -> int:
+        written = 0
+        with pq.ParquetWriter(where, self.__schema, **writer_options) as writer:
+            for batch in self.iterBatches(queryset):
+                writer.write_batch(batch)
+                written += batch.num_rows
+        return written
+
+    def writeStream(
+        self, sink: str | BinaryIO, queryset: models.QuerySet | None = None
+    ) -> int:
+        written = 0
+        with pa.ipc.new_stream(sink, self.__schema) as writer:
+            for batch in self.iterBatches(queryset):
+                writer.write_batch(batch)
+                written += batch.num_rows
+        return written
+
+    def __buildSchema(self) -> pa.Schema:
+        schema_fields = [
+            pa.field(
+                self.ID_COLUMN,
+                pa.int64(),
+                nullable=False,
+                metadata={"field_type": "id"},
+            )
+        ]
+        for field in self.__fields:
+            schema_fields.append(
+                pa.field(
+                    field.field_name,
+                    self.__getArrowType(field),
+                    nullable=not field.is_required,
+                    metadata=self.__getFieldMetadata(field),
+                )
+            )
+        registration = DataBucketRegistry.find(
+            self.__data_interface.data_bucket.__class__
+        )
+        bucket_name = (
+            registration.qualified_name
+            if registration is not None
+            else self.__data_interface.data_bucket.__class__.__name__
+        )
+        return pa.schema(schema_fields, metadata={"data_bucket": bucket_name})
+
+    @staticmethod
+    def __getArrowType(field: FieldInformationDict) -> pa.DataType:
+        if field.field_type == "DecimalField":
+            return pa.decimal128(Number.MAX_DIGITS, field.decimal_places)
+        if field.field_type == "ManyToManyField":
+            return pa.list_(pa.int64())
+        if field.field_type in ("ForeignKey", "OneToOneField"):
+            return pa.int64()
+        return pa.string()
+
+    @staticmethod
+    def __getFieldMetadata(field: FieldInformationDict) -> dict[str, str]:
+        metadata = {"field_type": field.field_type}
+        if field.decimal_places is not None:
+            metadata["decimal_places"] = str(field.decimal_places)
+        if isinstance(field.unit, Unit):
+            metadata["unit"] = field.unit.name
+            metadata["unit_symbol"] = field.unit.symbol
+            metadata["unit_type"] = field.unit.__class__.__name__
+        elif field.unit is not None:
+            metadata["unit_connection"] = field.unit.DataBucket
+            if field.unit.unit_field is not None:
+                metadata["unit_field"] = field.unit.unit_field
+        if field.connected_interface is not None:
+            metadata["connected_interface"] = field.connected_interface
+        return metadata
+
+    @staticmethod
+    def __isManyToMany(field: FieldInformationDict) -> bool:
+        return field.field_type == "ManyToManyField"
+
+    @staticmethod
+    def __getValuePath(field: FieldInformationDict) -> str:
+        if field.is_changeable:
+            return field.field_name
+        return f"{LINK_FIELD_NAME}__{field.field_name}"
+
+    @staticmethod
+    def __getConverter(field: FieldInformationDict) -> Callable[[Any], Any] | None:
+        if field.field_type != "DecimalField":
+            return None
+        quantizer = Decimal(1).scaleb(-field.decimal_places)
+        factor = None
+        if isinstance(field.unit, Unit) and field.unit != field.unit.DB_BASE_UNIT:
+            factor = toDecimal(field.unit.DB_BASE_UNIT.convert(field.unit)[0])
+
+        def convert(value: Any) -> Decimal | None:
+            if value is None:
+                return None
+            if factor is not None:
+                value = value * factor
+            return value.quantize(quantizer)
+
+        return convert
+
+    def __toBatch(
+        self,
+        chunk: list[tuple],
+        scalar_fields: list[FieldInformationDict],
+        converters: list[Callable[[Any], Any] | None],
+    ) -> pa.RecordBatch:
+        columns = list(zip(*chunk))
+        arrays = {self.ID_COLUMN: pa.array(columns[0], pa.int64())}
+        for field, converter, values in zip(scalar_fields, converters, columns[2:]):
+            if converter is not None:
+                values = [converter(value) for value in values]
+            arrays[field.field_name] = pa.array(
+                values, self.__schema.field(field.field_name).type
+            )
+        many_to_many_fields = [
+            field for field in self.__fields if self.__isManyToMany(field)
+        ]
+        for field in many_to_many_fields:
+            owner_ids = columns[1] if field.is_changeable else columns[0]
+            arrays[field.field_name] = self.__getManyToManyArray(field, owner_ids)
+        return pa.RecordBatch.from_arrays(
+            [arrays[name] for name in self.__schema.names], schema=self.__schema
+        )
+
+    def __getManyToManyArray(
+        self, field: FieldInformationDict, owner_ids: tuple[int, ...]
+    ) -> pa.Array:
+        unchangeable_model, changeable_model = self.__data_interface.model_tuple
+        model = changeable_model if field.is_changeable else unchangeable_model
+        model_field = model._meta.get_field(field.field_name)
+        through_model = model_field.remote_field.through
+        source_attname = f"{model_field.m2m_field_name()}_id"
+        target_attname = f"{model_field.m2m_reverse_field_name()}_id"
+        targets: dict[int, list[int]] = {owner_id: [] for owner_id in owner_ids}
+        for source_id, target_id in (
+            through_model.objects.filter(**{f"{source_attname}__in": owner_ids})
+            .order_by("pk")
+            .values_list(source_attname, target_attname)
+        ):
+            targets[source_id].append(target_id)
+        return pa.array(
+            [targets[owner_id] for owner_id in owner_ids], pa.list_(pa.int64())
+        )
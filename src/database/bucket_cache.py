@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+from DataBucket.src.auxiliary.lru_cache import CacheStatistics, LRUCache
+from DataBucket.src.auxiliary.value import Value
+from DataBucket.src.database.instrumentation import Instrumentation
+from concurrent.futures import Future, ThreadPoolExecutor
+from django.db import connections
+from functools import partial
+from threading import Event, Lock, RLock, Thread
+from typing import Any, Awaitable, Callable, Hashable, TYPE_CHECKING
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+import urllib.error
+import urllib.request
+
+if TYPE_CHECKING:
+    from DataBucket.src.auxiliary.interface_definition import DataInterface
+
+logger = logging.getLogger("DataBucket.cache")
+
+
+class RefetchSource:
+
+    def fetch(self) -> list[dict] | None:
+        raise NotImplementedError
+
+
+class FileRefetchSource(RefetchSource):
+
+    def __init__(self, file_path: str) -> None:
+        self.__file_path = file_path
+        self.__modified_at: int | None = None
+
+    @property
+    def file_path(self) -> str:
+        return self.__file_path
+
+    def fetch(self) -> list[dict] | None:
+        modified_at = os.stat(self.__file_path).st_mtime_ns
+        if modified_at == self.__modified_at:
+            return None
+        with open(self.__file_path) as file:
+            rows = json.load(file)
+        self.__modified_at = modified_at
+        return rows
+
+
+class HTTPRefetchSource(RefetchSource):
+
+    def __init__(self, url: str, timeout: float = 30) -> None:
+        self.__url = url
+        self.__timeout = timeout
+        self.__etag: str | None = None
+        self.__last_modified: str | None = None
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    def fetch(self) -> list[dict] | None:
+        headers = {"Accept": "application/json"}
+        if self.__etag is not None:
+            headers["If-None-Match"] = self.__etag
+        if self.__last_modified is not None:
+            headers["If-Modified-Since"] = self.__last_modified
+        request = urllib.request.Request(self.__url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.__timeout) as response:
+                rows = json.load(response)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as error:
+            if error.code == 304:
+                return None
+            raise
+        self.__etag = etag
+        self.__last_modified = last_modified
+        return rows
+
+
+def getRefetchSource(refetch_url: str | RefetchSource | None) -> RefetchSource | None:
+    if refetch_url is None or isinstance(refetch_url, RefetchSource):
+        return refetch_url
+    if refetch_url.startswith(("http://", "https://")):
+        return HTTPRefetchSource(refetch_url)
+    if refetch_url.startswith("file://"):
+        return FileRefetchSource(refetch_url[len("file://") :])
+    return FileRefetchSource(refetch_url)
+
+
+def freezeCacheKey(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, freezeCacheKey(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freezeCacheKey(item) for item in value)
+    if isinstance(value, Value):
+        return (
+            value.__class__.__name__,
+            freezeCacheKey(value.value),
+            str(getattr(value, "unit", None)),
+        )
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class BucketCache:
+
+    MAX_SIZE: int = 128
+    __MISSING = object()
+
+    def __init__(
+        self,
+        data_interface: type[DataInterface],
+        interval: float,
+        refetch_source: RefetchSource | None = None,
+        on_change: bool = True,
+        max_size: int | None = None,
+        spill_directory: str | None = None,
+        creator: Any = None,
+        delete_missing: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("cache_invalidation interval must be greater than 0")
+        if refetch_source is not None and creator is None:
+            raise ValueError(
+                "cache_invalidation with a refetch_url must define a creator"
+            )
+        self.__data_interface = data_interface
+        self.__interval = interval
+        self.__refetch_source = refetch_source
+        self.__on_change = bool(on_change)
+        self.__spill_directory = spill_directory
+        self.__creator = creator
+        self.__delete_missing = bool(delete_missing)
+        self.__spill_prefix = self.__getSpillPrefix(data_interface)
+        self.__clock = clock
+        self.__lock = RLock()
+        self.__refresh_lock = Lock()
+        self.__generation = 0
+        self.__entries = LRUCache(
+            self.MAX_SIZE if max_size is None else max_size, on_evict=self.__spill
+        )
+        self.__hits = 0
+        self.__misses = 0
+        self.__next_refresh = clock() + interval if refetch_source is not None else None
+        if spill_directory is not None:
+            os.makedirs(spill_directory, exist_ok=True)
+
+    @classmethod
+    def fromConfiguration(
+        cls, data_interface: type[DataInterface], configuration: dict
+    ) -> BucketCache:
+        if "interval" not in configuration:
+            raise ValueError("cache_invalidation must define an interval")
+        return cls(
+            data_interface,
+            interval=configuration["interval"],
+            refetch_source=getRefetchSource(configuration.get("refetch_url")),
+            on_change=configuration.get("on_change", True),
+            max_size=configuration.get("max_size"),
+            spill_directory=configuration.get("spill_directory"),
+            creator=configuration.get("creator"),
+            delete_missing=configuration.get("delete_missing", False),
+        )
+
+    @property
+    def interval(self) -> float:
+        return self.__interval
+
+    @property
+    def on_change(self) -> bool:
+        return self.__on_change
+
+    @property
+    def refetch_source(self) -> RefetchSource | None:
+        return self.__refetch_source
+
+    @property
+    def creator(self) -> Any:
+        return self.__creator
+
+    @property
+    def data_bucket_name(self) -> str:
+        return self.__data_interface.data_bucket.__class__.__name__
+
+    @property
+    def delete_missing(self) -> bool:
+        return self.__delete_missing
+
+    @property
+    def refresh_due(self) -> bool:
+        return self.__next_refresh is not None and self.__clock() >= self.__next_refresh
+
+    @property
+    def is_refreshing(self) -> bool:
+        return self.__refresh_lock.locked()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        entry_statistics = self.__entries.statistics
+        return CacheStatistics(
+            hits=self.__hits,
+            misses=self.__misses,
+            evictions=entry_statistics.evictions,
+            size=entry_statistics.size,
+            max_size=entry_statistics.max_size,
+        )
+
+    def getOrFetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        if self.refresh_due:
+            RefetchScheduler.getDefault().trigger(self)
+        value = self.get(key, self.__MISSING)
+        Instrumentation.recordCacheAccess(value is not self.__MISSING)
+        if value is self.__MISSING:
+            generation = self.__generation
+            value = fetch()
+            with self.__lock:
+                if generation == self.__generation:
+                    self.set(key, value)
+        return value
+
+    async def agetOrFetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.refresh_due:
+            RefetchScheduler.getDefault().trigger(self)
+        value = self.get(key, self.__MISSING)
+        Instrumentation.recordCacheAccess(value is not self.__MISSING)
+        if value is self.__MISSING:
+            generation = self.__generation
+            value = await fetch()
+            with self.__lock:
+                if generation == self.__generation:
+                    self.set(key, value)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.__lock:
+            entry = self.__entries.get(key, self.__MISSING)
+            if entry is self.__MISSING:
+                entry = self.__loadSpilled(key)
+            if entry is not None and entry is not self.__MISSING:
+                expires_at, value = entry
+                if self.__clock() < expires_at:
+                    self.__hits += 1
+                    return value
+                self.__entries.invalidate(key)
+            self.__misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.__entries.set(key, (self.__clock() + self.__interval, value))
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+            if self.__spill_directory is not None:
+                for file_name in os.listdir(self.__spill_directory):
+                    if file_name.startswith(self.__spill_prefix) and file_name.endswith(
+                        ".pickle"
+                    ):
+                        os.remove(os.path.join(self.__spill_directory, file_name))
+
+    def delayRefresh(self, delay: float) -> None:
+        if self.__next_refresh is not None:
+            self.__next_refresh = self.__clock() + delay
+
+    def refreshIfDue(self) -> dict[str, int] | None:
+        if not self.refresh_due:
+            return None
+        return self.refresh()
+
+    def refresh(self) -> dict[str, int]:
+        if self.__refetch_source is None:
+            raise ValueError("BucketCache has no refetch source to refresh from")
+        with self.__refresh_lock:
+            self.__next_refresh = self.__clock() + self.__interval
+            rows = self.__refetch_source.fetch()
+            if rows is None:
+                return {"created": 0, "updated": 0, "deleted": 0}
+            result = self.__data_interface.synchronize(
+                rows, creator=self.__creator, delete_missing=self.__delete_missing
+            )
+            if any(result.values()):
+                self.invalidate()
+            return result
+
+    @staticmethod
+    def __getSpillPrefix(data_interface: type[DataInterface]) -> str:
+        name = data_interface.data_bucket.__class__.__name__
+        return f"{data_interface.app_label}.{name}-"
+
+    def __getSpillPath(self, key: Hashable) -> str:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(
+            self.__spill_directory, f"{self.__spill_prefix}{digest}.pickle"
+        )
+
+    def __spill(self, key: Hashable, entry: tuple[float, Any]) -> None:
+        if self.__spill_directory is None:
+            return
+        with open(self.__getSpillPath(key), "wb") as file:
+            pickle.dump((key, entry), file)
+
+    def __loadSpilled(self, key: Hashable) -> tuple[float, Any] | None:
+        if self.__spill_directory is None:
+            return None
+        spill_path = self.__getSpillPath(key)
+        if not os.path.exists(spill_path):
+            return None
+        with open(spill_path, "rb") as file:
+            spilled_key, entry = pickle.load(file)
+        os.remove(spill_path)
+        if spilled_key != key:
+            return None
+        self.__entries.set(key, entry)
+        return entry
+
+
+class RefetchScheduler:
+
+    MAX_WORKERS: int = 4
+    STAGGER: float = 1.0
+    POLL_INTERVAL: float = 1.0
+    __default: RefetchScheduler | None = None
+    __default_lock = Lock()
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        stagger: float | None = None,
+        poll_interval: float | None = None,
+    ) -> None:
+        self.__executor = ThreadPoolExecutor(
+            max_workers or self.MAX_WORKERS, thread_name_prefix="DataBucketRefetch"
+        )
+        self.__stagger = self.STAGGER if stagger is None else stagger
+        self.__poll_interval = poll_interval or self.POLL_INTERVAL
+        self.__caches: list[BucketCache] = []
+        self.__pending: dict[int, Future] = {}
+        self.__errors: dict[int, BaseException] = {}
+        self.__last_error: BaseException | None = None
+        self.__lock = Lock()
+        self.__stop_event = Event()
+        self.__thread: Thread | None = None
+
+    @classmethod
+    def getDefault(cls) -> RefetchScheduler:
+        with cls.__default_lock:
+            if cls.__default is None:
+                cls.__default = cls()
+            return cls.__default
+
+    @classmethod
+    def startDefault(cls) -> RefetchScheduler | None:
+        data_buckets = [
+            registration.data_bucket
+            for registration in DataBucketRegistry.getRegistrations()
+            if registration.data_interface.cache is not None
+            and registration.data_interface.cache.refetch_source is not None
+        ]
+        if not data_buckets:
+            return None
+        scheduler = cls.getDefault()
+        scheduler.register(*data_buckets)
+        scheduler.start()
+        return scheduler
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def last_error(self) -> BaseException | None:
+        return self.__last_error
+
+    def getLastError(self, cache: BucketCache) -> BaseException | None:
+        return self.__errors.get(id(cache))
+
+    def register(self, *data_buckets: Any) -> None:
+        with self.__lock:
+            for data_bucket in data_buckets:
+                cache = data_bucket.DataInterface.cache
+                if cache is None or cache.refetch_source is None:
+                    raise ValueError(
+                        f"{data_bucket.__name__} has no cache_invalidation refetch_url"
+                    )
+                if any(cache is registered for registered in self.__caches):
+                    continue
+                cache.delayRefresh(cache.interval + len(self.__caches) * self.__stagger)
+                self.__caches.append(cache)
+
+    def trigger(self, cache: BucketCache) -> Future:
+        with self.__lock:
+            future = self.__pending.get(id(cache))
+            if future is None or future.done():
+                future = self.__executor.submit(self.__refresh, cache)
+                future.add_done_callback(partial(self.__onRefreshDone, cache))
+                self.__pending[id(cache)] = future
+            return future
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self.__stop_event.clear()
+        self.__thread = Thread(
+            target=self.__run, name="DataBucketRefetchScheduler", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        self.__stop_event.set()
+        if self.__thread is not None and wait:
+            self.__thread.join()
+        self.__thread = None
+        if wait:
+            for future in list(self.__pending.values()):
+                future.exception()
+
+    def __run(self) -> None:
+        while not self.__stop_event.is_set():
+            with self.__lock:
+                caches = list(self.__caches)
+            for cache in caches:
+                if cache.refresh_due:
+                    self.trigger(cache)
+            self.__stop_event.wait(self.__poll_interval)
+
+    def __onRefreshDone(self, cache: BucketCache, future: Future) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            self.__errors.pop(id(cache), None)
+            return
+        self.__errors[id(cache)] = error
+        self.__last_error = error
+        logger.error(
+            "Refetching %s failed",
+            cache.data_bucket_name,
+            exc_info=(type(error), error, error.__traceback__),
+        )
+
+    @staticmethod
+    def __refresh(cache: BucketCache) -> dict[str, int]:
+        try:
+            return cache.refresh()
+        finally:
+            connections.close_all()
@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+from DataBucket.src.auxiliary.interface_definition import (
+    DataInterface,
+    FieldInformationDict,
+)
+from DataBucket.src.units.unit import Unit
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field as dataclass_field
+from decimal import Decimal, InvalidOperation
+from django.db import transaction
+from fractions import Fraction
+from typing import Any, Iterable, Iterator, TextIO
+import csv
+import multiprocessing
+import os
+import re
+import time
+
+
+@dataclass(frozen=True)
+class ImportColumn:
+    field_name: str
+    kind: str
+    source: str
+    unit_source: str | None
+    unit_symbol: str | None
+    factors: dict[str, Fraction] | None
+    max_length: int | None
+    decimal_places: int | None
+    is_required: bool
+    has_default: bool
+
+
+@dataclass
+class ImportRowError:
+    row_number: int
+    field_name: str | None
+    message: str
+
+
+@dataclass
+class PreparedChunk:
+    length: int
+    rows: list[dict[str, Any]]
+    errors: list[ImportRowError]
+    seconds: float
+
+
+@dataclass
+class ImportReport:
+    rows_read: int = 0
+    rows_imported: int = 0
+    errors: list[ImportRowError] = dataclass_field(default_factory=list)
+    timings: dict[str, float] = dataclass_field(default_factory=dict)
+
+    @property
+    def seconds(self) -> float:
+        return self.timings.get("total", 0.0)
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.seconds:
+            return 0.0
+        return self.rows_imported / self.seconds
+
+
+class BulkImporter:
+
+    CHUNK_SIZE: int = 5_000
+    DB_DECIMAL_PLACES: int = 9
+    MAX_INTEGER_DIGITS: int = 15
+    UNIT_COLUMN_SUFFIX: str = "_unit"
+    UNIT_HEADER_PATTERN = re.compile(
+        r"^\s*(?P<name>[^\[\]]+?)\s*\[(?P<unit>[^\]]+)\]\s*$"
+    )
+    STAGES: tuple[str, ...] = ("read", "prepare", "insert")
+    PROCESS_START_METHOD: str = "spawn"
+
+    def __init__(
+        self,
+        data_interface: type[DataInterface],
+        chunk_size: int | None = None,
+        processes: int | None = None,
+        skip_invalid: bool = True,
+        creator: Any = None,
+    ) -> None:
+        self.__data_interface = data_interface
+        self.__chunk_size = chunk_size or self.CHUNK_SIZE
+        if self.__chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0")
+        if processes is not None and processes < 1:
+            raise ValueError("processes must be greater than 0")
+        self.__processes = processes
+        self.__skip_invalid = skip_invalid
+        self.__creator = creator
+        self.__fields = {
+            field.field_name: field for field in data_interface.getFields()
+        }
+
+    def importCsv(
+        self, source: str | os.PathLike | TextIO, **reader_options: Any
+    ) -> ImportReport:
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, newline="") as file:
+                return self.importCsv(file, **reader_options)
+        reader = csv.reader(source, **reader_options)
+        header = next(reader, None)
+        if header is None:
+            return ImportReport(timings={stage: 0.0 for stage in self.STAGES})
+        return self.__run(header, self.__iterCsvChunks(reader, len(header)))
+
+    def importParquet(self, source: Any) -> ImportReport:
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source)
+        header = parquet_file.schema_arrow.names
+        chunks = (
+            batch.to_pydict()
+            for batch in parquet_file.iter_batches(batch_size=self.__chunk_size)
+        )
+        return self.__run(header, chunks)
+
+    def getColumns(self, header: list[str]) -> list[ImportColumn]:
+        header_names = set(header)
+        columns = []
+        unit_sources = set()
+        for source in header:
+            match = self.UNIT_HEADER_PATTERN.match(source)
+            field_name, unit_symbol = (
+                (match["name"], match["unit"].strip()) if match else (source, None)
+            )
+            if field_name not in self.__fields:
+                continue
+            unit_source = f"{field_name}{self.UNIT_COLUMN_SUFFIX}"
+            if unit_source in header_names and unit_symbol is None:
+                unit_sources.add(unit_source)
+            else:
+                unit_source = None
+            columns.append(
+                self.__getColumn(
+                    self.__fields[field_name], source, unit_source, unit_symbol
+                )
+            )
+        unknown_sources = (
+            header_names - unit_sources - {column.source for column in columns}
+        )
+        if unknown_sources:
+            raise ValueError(
+                f"Unknown columns for {self.__data_interface.data_bucket.__class__.__name__}: {sorted(unknown_sources)}"
+            )
+        imported_names = {column.field_name for column in columns}
+        missing_names = [
+            name
+            for name, field in self.__fields.items()
+            if field.is_required
+            and field.default is None
+            and name not in imported_names
+        ]
+        if missing_names:
+            raise ValueError(f"Columns {missing_names} are required to import")
+        return columns
+
+    def __getColumn(
+        self,
+        field: FieldInformationDict,
+        source: str,
+        unit_source: str | None,
+        unit_symbol: str | None,
+    ) -> ImportColumn:
+        if field.field_type == "ManyToManyField":
+            raise ValueError(f"ManyToMany field {field.field_name} cannot be imported")
+        factors = None
+        if field.field_type == "DecimalField":
+            kind = "number"
+            if isinstance(field.unit, Unit):
+                factors = {
+                    unit.symbol: unit.convertExact(unit.DB_BASE_UNIT)[0]
+                    for unit in field.unit.FACTOR_DICT
+                }
+                unit_symbol = unit_symbol or field.unit.symbol
+                if unit_symbol not in factors:
+                    raise ValueError(
+                        f"Unknown unit {unit_symbol} for field {field.field_name}"
+                    )
+            elif unit_symbol is not None or unit_source is not None:
+                raise ValueError(f"Field {field.field_name} has no convertible unit")
+        elif field.field_type in ("ForeignKey", "OneToOneField"):
+            kind = "connection"
+        else:
+            kind = "string"
+        return ImportColumn(
+            field_name=field.field_name,
+            kind=kind,
+            source=source,
+            unit_source=unit_source,
+            unit_symbol=unit_symbol,
+            factors=factors,
+            max_length=field.max_length,
+            decimal_places=field.decimal_places,
+            is_required=field.is_required,
+            has_default=field.default is not None,
+        )
+
+    def __iterCsvChunks(
+        self, reader: Iterator[list[str]], width: int
+    ) -> Iterator[dict[str, list[Any]] | list[list[str]]]:
+        chunk = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) != width:
+                row = (row + [""] * width)[:width]
+            chunk.append(row)
+            if len(chunk) == self.__chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def __run(
+        self,
+        header: list[str],
+        chunks: Iterable[dict[str, list[Any]] | list[list[str]]],
+    ) -> ImportReport:
+        columns = self.getColumns(list(header))
+        report = ImportReport(timings={stage: 0.0 for stage in self.STAGES})
+        started_at = time.perf_counter()
+        with transaction.atomic():
+            for prepared in self.__prepareChunks(header, columns, chunks, report):
+                report.timings["prepare"] += prepared.seconds
+                report.rows_read += prepared.length
+                if prepared.errors:
+                    report.errors.extend(prepared.errors)
+                    if not self.__skip_invalid:
+                        error = prepared.errors[0]
+                        raise ValueError(
+                            f"Row {error.row_number}, field {error.field_name}: {error.message}"
+                        )
+                inserted_at = time.perf_counter()
+                report.rows_imported += self.__data_interface._bulkInsert(
+                    prepared.rows, creator=self.__creator
+                )
+                report.timings["insert"] += time.perf_counter() - inserted_at
+        report.timings["total"] = time.perf_counter() - started_at
+        return report
+
+    def __prepareChunks(
+        self,
+        header: list[str],
+        columns: list[ImportColumn],
+        chunks: Iterable[dict[str, list[Any]] | list[list[str]]],
+        report: ImportReport,
+    ) -> Iterator[PreparedChunk]:
+        chunks = self.__timeReads(chunks, report)
+        first_row_number = 1
+        if not self.__processes or self.__processes == 1:
+            for chunk in chunks:
+                prepared = ChunkPreparer.prepare(
+                    columns, header, chunk, first_row_number
+                )
+                first_row_number += prepared.length
+                yield prepared
+            return
+        with ProcessPoolExecutor(
+            max_workers=self.__processes,
+            mp_context=multiprocessing.get_context(self.PROCESS_START_METHOD),
+        ) as executor:
+            pending: deque[Future] = deque()
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(
+                        ChunkPreparer.prepare, columns, header, chunk, first_row_number
+                    )
+                )
+                first_row_number += ChunkPreparer.getLength(chunk)
+                if len(pending) >= 2 * self.__processes:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def __timeReads(
+        chunks: Iterable[dict[str, list[Any]] | list[list[str]]], report: ImportReport
+    ) -> Iterator[dict[str, list[Any]] | list[list[str]]]:
+        chunks = iter(chunks)
+        while True:
+            started_at = time.perf_counter()
+            chunk = next(chunks, None)
+            report.timings["read"] += time.perf_counter() - started_at
+            if chunk is None:
+                return
+            yield chunk
+
+
+class ChunkPreparer:
+
+    @staticmethod
+    def getLength(chunk: dict[str, list[Any]] | list[list[str]]) -> int:
+        if isinstance(chunk, dict):
+            return len(next(iter(chunk.values()), []))
+        return len(chunk)
+
+    @classmethod
+    def prepare(
+        cls,
+        columns: list[ImportColumn],
+        header: list[str],
+        chunk: dict[str, list[Any]] | list[list[str]],
+        first_row_number: int,
+    ) -> PreparedChunk:
+        started_at = time.perf_counter()
+        if not isinstance(chunk, dict):
+            chunk = dict(zip(header, map(list, zip(*chunk))))
+        length = cls.getLength(chunk)
+        errors: list[ImportRowError] = []
+        invalid_rows: set[int] = set()
+        converted: dict[str, list[Any]] = {}
+        for column in columns:
+            values = [
+                value.strip() if isinstance(value, str) else value
+                for value in chunk[column.source]
+            ]
+            column_errors = []
+            if column.kind == "number":
+                converted[column.field_name] = cls.__convertNumbers(
+                    column, values, chunk.get(column.unit_source), column_errors
+                )
+            elif column.kind == "connection":
+                converted[column.field_name] = cls.__convertConnections(
+                    values, column_errors
+                )
+            else:
+                converted[column.field_name] = cls.__convertStrings(
+                    column, values, column_errors
+                )
+            if column.is_required and not column.has_default:
+                failed_rows = {index for index, _ in column_errors}
+                column_errors.extend(
+                    (index, "value is required")
+                    for index, value in enumerate(converted[column.field_name])
+                    if value is None and index not in failed_rows
+                )
+            for index, message in column_errors:
+                invalid_rows.add(index)
+                errors.append(
+                    ImportRowError(first_row_number + index, column.field_name, message)
+                )
+        rows = []
+        for index in range(length):
+            if index in invalid_rows:
+                continue
+            row = {}
+            for column in columns:
+                value = converted[column.field_name][index]
+                if value is None and column.has_default:
+                    continue
+                row[column.field_name] = value
+            rows.append(row)
+        errors.sort(key=lambda error: error.row_number)
+        return PreparedChunk(length, rows, errors, time.perf_counter() - started_at)
+
+    @classmethod
+    def __parseDecimal(cls, value: Any) -> Decimal | None:
+        if value is None or value == "":
+            return None
+        if isinstance(value, float):
+            value = repr(value)
+        return Decimal(value)
+
+    @classmethod
+    def __convertNumbers(
+        cls,
+        column: ImportColumn,
+        values: list[Any],
+        unit_symbols: list[Any] | None,
+        errors: list[tuple[int, str]],
+    ) -> list[Decimal | None]:
+        numbers: list[Decimal | None] = []
+        for index, value in enumerate(values):
+            try:
+                number = cls.__parseDecimal(value)
+            except (InvalidOperation, TypeError, ValueError):
+                errors.append((index, f"{value!r} is not a number"))
+                numbers.append(None)
+                continue
+            if number is not None and not number.is_finite():
+                errors.append((index, f"{value!r} is not a number"))
+                number = None
+            elif (
+                number is not None
+                and -number.as_tuple().exponent > column.decimal_places
+            ):
+                errors.append(
+                    (
+                        index,
+                        f"{value!r} has more than {column.decimal_places} decimal places",
+                    )
+                )
+            numbers.append(number)
+
+        limit = 10**BulkImporter.MAX_INTEGER_DIGITS
+        converted: list[Decimal | None] = []
+        for index, number in enumerate(numbers):
+            if number is not None and column.factors is not None:
+                factor = cls.__getFactor(column, unit_symbols, index, errors)
+                number = cls.__toBaseUnit(number, factor)
+            if number is not None and abs(number) >= limit:
+                errors.append((index, f"{values[index]!r} is too large"))
+            converted.append(number)
+        return converted
+
+    @classmethod
+    def __getFactor(
+        cls,
+        column: ImportColumn,
+        unit_symbols: list[Any] | None,
+        index: int,
+        errors: list[tuple[int, str]],
+    ) -> Fraction:
+        if unit_symbols is None:
+            return column.factors[column.unit_symbol]
+        symbol = unit_symbols[index]
+        symbol = symbol.strip() if isinstance(symbol, str) else symbol
+        factor = column.factors.get(symbol or column.unit_symbol)
+        if factor is None:
+            errors.append((index, f"Unknown unit {symbol!r}"))
+            return Fraction(0)
+        return factor
+
+    @staticmethod
+    def __toBaseUnit(number: Decimal, factor: Fraction) -> Decimal:
+        scale = 10**BulkImporter.DB_DECIMAL_PLACES
+        scaled = round(Fraction(number) * factor * scale)
+        return Decimal(scaled).scaleb(-BulkImporter.DB_DECIMAL_PLACES)
+
+    @classmethod
+    def __convertConnections(
+        cls, values: list[Any], errors: list[tuple[int, str]]
+    ) -> list[int | None]:
+        ids: list[int | None] = []
+        for index, value in enumerate(values):
+            if value is None or value == "":
+                ids.append(None)
+                continue
+            try:
+                ids.append(int(value))
+            except (TypeError, ValueError):
+                errors.append((index, f"{value!r} is not an id"))
+                ids.append(None)
+        return ids
+
+    @classmethod
+    def __convertStrings(
+        cls, column: ImportColumn, values: list[Any], errors: list[tuple[int, str]]
+    ) -> list[str | None]:
+        strings: list[str | None] = []
+        for index, value in enumerate(values):
+            if value is None or value == "":
+                strings.append(None)
+                continue
+            value = str(value)
+            if column.max_length is not None and len(value) > column.max_length:
+                errors.append(
+                    (index, f"value is longer than {column.max_length} characters")
+                )
+            strings.append(value)
+        return strings
@@ -1,26 +1,81 @@
 from __future__ import annotations
 
-from DataBucket.src.database.abstract_models import unchangeable, changeable
+from DataBucket.src.database.abstract_models import (
+    unchangeable,
+    changeable,
+    LINK_FIELD_NAME,
+    CHANGEABLE_RELATED_NAME,
+)
 from DataBucket.src.auxiliary.interface_definition import (
     DataInterface,
     FieldInformationDict,
 )
-from DataBucket.src.database.db_field import dbField, Number
+from DataBucket.src.auxiliary.identity_map import IdentityMap
+from DataBucket.src.auxiliary.value import (
+    Value,
+    ConnectionValue,
+    NumberValue,
+    FixedPointNumberValue,
+    StringValue,
+    toDecimal,
+)
+from DataBucket.src.data_bucket import DataBucketQuerryset
+from DataBucket.src.database.app_label_index import AppLabelIndex
+from DataBucket.src.database.bucket_cache import freezeCacheKey
+from DataBucket.src.database.db_field import dbField, Number, DataBucketConnection
+from DataBucket.src.database.deletion import DeletionCollector
+from DataBucket.src.units.unit import Unit, CombinedUnit
+from DataBucket.src.units.currency_unit import CurrencyUnit
+from asgiref.sync import sync_to_async
+from decimal import Decimal
+from fractions import Fraction
 from django.apps import apps
-from django.db import models
-import os
+from django.db import connection, models, transaction
+from threading import RLock
+import hashlib
+import logging
 import sys
-from typing import TYPE_CHECKING
+from typing import Any, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from DataBucket.src.units.unit import Unit
     from DataBucket.src.data_bucket import DataBucket
 
+logger = logging.getLogger("DataBucket.database")
+
+
+class LazyModelTuple:
+
+    def __get__(
+        self, instance: Database | None, owner: type[Database]
+    ) -> tuple[type[unchangeable], type[changeable]]:
+        owner.materialize()
+        return owner.__dict__["model_tuple"]
+
 
 class Database(DataInterface):
     data_bucket: DataBucket
+    model_tuple: tuple[type[unchangeable], type[changeable]] = LazyModelTuple()
+
+    __MATERIALIZE_LOCK = RLock()
 
-    def getFields(self) -> list[FieldInformationDict]:
+    BULK_BATCH_SIZE: int = 1000
+    RAW_VALUE_LOOKUPS: tuple[str, ...] = ("isnull",)
+    AGGREGATE_FUNCTIONS: dict[str, type[models.Aggregate]] = {
+        "sum": models.Sum,
+        "avg": models.Avg,
+        "min": models.Min,
+        "max": models.Max,
+    }
+    HISTORY_FIELD_NAMES: tuple[str, ...] = (
+        "id",
+        LINK_FIELD_NAME,
+        "creator",
+        "is_deleted",
+        "updated_at",
+    )
+
+    @classmethod
+    def getFields(cls) -> list[FieldInformationDict]:
         return [
             FieldInformationDict(
                 field_name=field_name,
@@ -38,16 +93,579 @@ class Database(DataInterface):
                     field.DataBucket if hasattr(field, "DataBucket") else None
                 ),
             )
-            for field_name, field in self.__getFields().items()
+            for field_name, field in cls.__getFields().items()
         ]
 
     @classmethod
-    def initialize_class(cls):
-        defined_fields = cls.__getFields()
+    def initialize_class(cls, lazy: bool = False):
         file_path = cls.__getFilePath()
-        model_tuple = cls.__createModels(defined_fields)
-        cls.model_tuple = model_tuple
-        cls.__registerModels(model_tuple, file_path)
+        cls.app_label = cls.__getAppLabelFromFile(file_path)
+        if not lazy:
+            cls.materialize()
+
+    @classmethod
+    def materialize(cls) -> None:
+        with cls.__MATERIALIZE_LOCK:
+            if cls.is_materialized():
+                return
+            defined_fields = cls.__getFields()
+            model_tuple = cls.__createModels(defined_fields, cls.app_label)
+            cls.model_tuple = model_tuple
+            cls.__registerModels(model_tuple, cls.app_label)
+        for field in defined_fields.values():
+            if isinstance(field, DataBucketConnection) and field.is_resolved:
+                field.data_bucket.DataInterface.materialize()
+
+    @classmethod
+    def is_materialized(cls) -> bool:
+        return "model_tuple" in cls.__dict__
+
+    @classmethod
+    def create(cls, data: dict, creator: Any = None) -> DataBucket:
+        return cls.bulk_create([data], creator=creator)[0]
+
+    @classmethod
+    def bulk_create(
+        cls, rows: Iterable[dict], creator: Any = None, batch_size: int | None = None
+    ) -> list[DataBucket]:
+        rows = list(rows)
+        batch_size = batch_size or cls.BULK_BATCH_SIZE
+        records = []
+        with transaction.atomic():
+            for start in range(0, len(rows), batch_size):
+                records.extend(
+                    cls.__createBatch(rows[start : start + batch_size], creator)
+                )
+        cls._invalidateCache()
+        return records
+
+    @classmethod
+    def update(cls, id: int, data: dict, creator: Any = None) -> DataBucket:
+        return cls.bulk_update([id], [data], creator=creator)[0]
+
+    @classmethod
+    def bulk_update(
+        cls,
+        ids: Iterable[int],
+        rows: Iterable[dict],
+        creator: Any = None,
+        batch_size: int | None = None,
+    ) -> list[DataBucket]:
+        ids = list(ids)
+        rows = list(rows)
+        if len(ids) != len(rows):
+            raise ValueError(
+                f"bulk_update got {len(ids)} ids but {len(rows)} rows of data"
+            )
+        batch_size = batch_size or cls.BULK_BATCH_SIZE
+        records = []
+        with transaction.atomic():
+            for start in range(0, len(ids), batch_size):
+                records.extend(
+                    cls.__updateBatch(
+                        ids[start : start + batch_size],
+                        rows[start : start + batch_size],
+                        creator,
+                    )
+                )
+        cls._invalidateCache()
+        return records
+
+    @classmethod
+    def all(cls) -> DataBucketQuerryset:
+        return DataBucketQuerryset(cls, cls.__getCurrentQuerySet())
+
+    @classmethod
+    def filter(cls, filter: dict) -> DataBucketQuerryset:
+        return DataBucketQuerryset(
+            cls,
+            cls.__getCurrentQuerySet().filter(**cls._translateFilter(filter)),
+            "filter",
+        )
+
+    @classmethod
+    def exclude(cls, filter: dict) -> DataBucketQuerryset:
+        return DataBucketQuerryset(
+            cls,
+            cls.__getCurrentQuerySet().exclude(**cls._translateFilter(filter)),
+            "exclude",
+        )
+
+    @classmethod
+    def get(cls, filter: dict) -> DataBucket | None:
+        if cls.cache is None:
+            return cls.filter(filter).first()
+        return cls.cache.getOrFetch(
+            ("get", freezeCacheKey(filter)), lambda: cls.filter(filter).first()
+        )
+
+    @classmethod
+    def delete(cls, id: int) -> DataBucket:
+        with transaction.atomic():
+            record = cls.filter({"id": id}).first()
+            if record is None:
+                raise ValueError(
+                    f"{cls.data_bucket.__class__.__name__} with id {id} does not exist"
+                )
+            cls.__deleteCascading([id])
+        return record
+
+    @classmethod
+    def bulk_delete(cls, ids: Iterable[int]) -> int:
+        ids = list(ids)
+        with transaction.atomic():
+            deleted = (
+                cls.__getCurrentQuerySet()
+                .filter(**{f"{LINK_FIELD_NAME}__in": ids})
+                .count()
+            )
+            cls.__deleteCascading(ids)
+        return deleted
+
+    @classmethod
+    def __deleteCascading(cls, ids: list[int]) -> None:
+        collector = DeletionCollector()
+        collector.collect(cls, ids)
+        collector.apply()
+
+    @classmethod
+    def synchronize(
+        cls, rows: Iterable[dict], creator: Any = None, delete_missing: bool = False
+    ) -> dict[str, int]:
+        fields = cls.__getFields()
+        key_names = [name for name, field in fields.items() if field.is_unique]
+        if not key_names:
+            raise ValueError(
+                f"{cls.data_bucket.__class__.__name__} needs a unique field to synchronize"
+            )
+        compared_names = [
+            name
+            for name, field in fields.items()
+            if field.is_changeable
+            and not field.is_unique
+            and not cls.__isManyToMany(field)
+        ]
+        incoming = {
+            cls.__getSynchronizeKey(fields, key_names, row): row for row in rows
+        }
+        with transaction.atomic():
+            existing = {
+                cls.__getSynchronizeKey(
+                    fields,
+                    key_names,
+                    {name: getattr(record, name) for name in key_names},
+                ): record
+                for record in cls.__fetchUncached()
+            }
+            created_rows = [row for key, row in incoming.items() if key not in existing]
+            updated_ids = []
+            updated_rows = []
+            for key, row in incoming.items():
+                record = existing.get(key)
+                if record is None:
+                    continue
+                changes = {
+                    name: row[name]
+                    for name in compared_names
+                    if name in row
+                    and cls.__toDatabaseValue(fields[name], row[name])
+                    != cls.__toDatabaseValue(fields[name], getattr(record, name))
+                }
+                if changes:
+                    updated_ids.append(record.id)
+                    updated_rows.append(changes)
+            deleted_ids = (
+                [record.id for key, record in existing.items() if key not in incoming]
+                if delete_missing
+                else []
+            )
+            if created_rows:
+                cls.bulk_create(created_rows, creator=creator)
+            if updated_ids:
+                cls.bulk_update(updated_ids, updated_rows, creator=creator)
+            if deleted_ids:
+                cls.bulk_delete(deleted_ids)
+        return {
+            "created": len(created_rows),
+            "updated": len(updated_ids),
+            "deleted": len(deleted_ids),
+        }
+
+    @classmethod
+    async def aall(cls) -> list[DataBucket]:
+        return await cls.all().alist()
+
+    @classmethod
+    async def afilter(cls, filter: dict) -> list[DataBucket]:
+        return await cls.filter(filter).alist()
+
+    @classmethod
+    async def aget(cls, filter: dict) -> DataBucket | None:
+        if cls.cache is None:
+            return await cls.filter(filter).afirst()
+        return await cls.cache.agetOrFetch(
+            ("get", freezeCacheKey(filter)), cls.filter(filter).afirst
+        )
+
+    @classmethod
+    async def acreate(cls, data: dict, creator: Any = None) -> DataBucket:
+        return await sync_to_async(cls.create)(data, creator=creator)
+
+    @classmethod
+    async def abulk_create(
+        cls, rows: Iterable[dict], creator: Any = None, batch_size: int | None = None
+    ) -> list[DataBucket]:
+        return await sync_to_async(cls.bulk_create)(
+            list(rows), creator=creator, batch_size=batch_size
+        )
+
+    @classmethod
+    async def aupdate(cls, id: int, data: dict, creator: Any = None) -> DataBucket:
+        return await sync_to_async(cls.update)(id, data, creator=creator)
+
+    @classmethod
+    async def adelete(cls, id: int) -> DataBucket:
+        return await sync_to_async(cls.delete)(id)
+
+    @classmethod
+    def _resolveIds(
+        cls, ids: Iterable[int], identity_map: IdentityMap
+    ) -> dict[int, DataBucket]:
+        data_bucket = cls.data_bucket.__class__
+        ids = set(ids)
+        records = identity_map.getMany(data_bucket, ids)
+        missing_ids = [id for id in ids if id not in records]
+        if missing_ids:
+            for changeable_object in cls.__getCurrentQuerySet().filter(
+                **{f"{LINK_FIELD_NAME}__in": missing_ids}
+            ):
+                record = identity_map.add(cls._toRecord(changeable_object))
+                records[record.id] = record
+        return records
+
+    @classmethod
+    def _prefetchConnections(
+        cls,
+        records: list[DataBucket],
+        lookups: Iterable[str],
+        identity_map: IdentityMap,
+        many_to_many: bool = True,
+    ) -> None:
+        nested_lookups: dict[str, list[str]] = {}
+        for lookup in lookups:
+            field_name, _, nested_lookup = lookup.partition("__")
+            nested_lookups.setdefault(field_name, [])
+            if nested_lookup:
+                nested_lookups[field_name].append(nested_lookup)
+        fields = cls.__getFields()
+        for field_name, nested in nested_lookups.items():
+            field = fields.get(field_name)
+            if not isinstance(field, DataBucketConnection):
+                raise ValueError(
+                    f"{field_name} is not a DataBucketConnection of {cls.data_bucket.__class__.__name__}"
+                )
+            is_many_to_many = cls.__isManyToMany(field)
+            if is_many_to_many and not many_to_many:
+                raise ValueError(
+                    f"{field_name} is a ManyToMany connection, use prefetch_related"
+                )
+            if is_many_to_many:
+                target_ids = cls.__getManyToManyTargets(
+                    field, [record.id for record in records]
+                )
+            else:
+                target_ids = {
+                    record.id: getattr(record, field_name).value
+                    for record in records
+                    if getattr(record, field_name, None) is not None
+                }
+            target_interface = field.data_bucket.DataInterface
+            targets = target_interface._resolveIds(
+                (
+                    id
+                    for ids in target_ids.values()
+                    for id in (ids if is_many_to_many else [ids])
+                ),
+                identity_map,
+            )
+            for record in records:
+                if record.id not in target_ids:
+                    continue
+                ids = target_ids[record.id]
+                instance = (
+                    [targets[id] for id in ids if id in targets]
+                    if is_many_to_many
+                    else targets.get(ids)
+                )
+                setattr(
+                    record,
+                    field_name,
+                    ConnectionValue(
+                        ids, connected_interface=field.DataBucket, instance=instance
+                    ),
+                )
+            if nested and targets:
+                target_interface._prefetchConnections(
+                    list(targets.values()), nested, identity_map, many_to_many
+                )
+
+    @classmethod
+    def __getManyToManyTargets(
+        cls, field: DataBucketConnection, ids: list[int]
+    ) -> dict[int, list[int]]:
+        through_model = field.field.remote_field.through
+        source_name = field.field.m2m_field_name()
+        target_attname = f"{field.field.m2m_reverse_field_name()}_id"
+        if field.is_changeable:
+            _, changeable_model = cls.model_tuple
+            owners = (
+                changeable_model.objects.current()
+                .filter(**{f"{LINK_FIELD_NAME}__in": ids})
+                .values("pk")
+            )
+            through_objects = through_model.objects.filter(
+                **{f"{source_name}__in": owners}
+            )
+            owner_path = f"{source_name}__{LINK_FIELD_NAME}"
+        else:
+            through_objects = through_model.objects.filter(
+                **{f"{source_name}__in": ids}
+            )
+            owner_path = f"{source_name}_id"
+        targets: dict[int, list[int]] = {id: [] for id in ids}
+        for owner_id, target_id in through_objects.order_by("pk").values_list(
+            owner_path, target_attname
+        ):
+            targets[owner_id].append(target_id)
+        return targets
+
+    @classmethod
+    def __fetchUncached(cls) -> list[DataBucket]:
+        return [
+            cls._toRecord(changeable_object)
+            for changeable_object in cls.__getCurrentQuerySet()
+        ]
+
+    @classmethod
+    def __getSynchronizeKey(
+        cls, fields: dict[str, dbField], key_names: list[str], row: dict
+    ) -> tuple:
+        missing_names = [name for name in key_names if name not in row]
+        if missing_names:
+            raise ValueError(f"Fields {missing_names} are required to synchronize")
+        return tuple(
+            cls.__toDatabaseValue(fields[name], row[name]) for name in key_names
+        )
+
+    @classmethod
+    def _invalidateCache(cls) -> None:
+        cache = cls.cache
+        if cache is None or not cache.on_change:
+            return
+        cache.invalidate()
+        transaction.on_commit(cache.invalidate)
+
+    @classmethod
+    def _toRecord(cls, changeable_object: changeable) -> DataBucket:
+        return cls.__toRecord(
+            getattr(changeable_object, LINK_FIELD_NAME), changeable_object
+        )
+
+    @classmethod
+    def __getCurrentQuerySet(cls) -> models.QuerySet:
+        _, changeable_model = cls.model_tuple
+        return changeable_model.objects.current().select_related(LINK_FIELD_NAME)
+
+    @classmethod
+    def _translateFilter(cls, filter: dict) -> dict[str, Any]:
+        fields = cls.__getFields()
+        translated_filter = {}
+        for lookup, value in filter.items():
+            field_name, separator, suffix = lookup.partition("__")
+            path = cls.__getFieldPath(field_name)
+            if suffix not in cls.RAW_VALUE_LOOKUPS:
+                value = cls.__toFilterValue(fields.get(field_name), value)
+            translated_filter[f"{path}{separator}{suffix}"] = value
+        return translated_filter
+
+    @classmethod
+    def __getFieldPath(cls, field_name: str) -> str:
+        if field_name in ("id", "pk"):
+            return LINK_FIELD_NAME
+        fields = cls.__getFields()
+        if field_name not in fields:
+            raise ValueError(
+                f"Unknown field for {cls.data_bucket.__class__.__name__}: {field_name}"
+            )
+        if fields[field_name].is_changeable:
+            return field_name
+        return f"{LINK_FIELD_NAME}__{field_name}"
+
+    @classmethod
+    def _aggregate(
+        cls,
+        queryset: models.QuerySet,
+        aggregations: dict[str, str | list[str]],
+        to_unit: Unit | CombinedUnit | dict[str, Unit | CombinedUnit] | None = None,
+    ) -> dict[str, NumberValue | None]:
+        fields = cls.__getFields()
+        requests = []
+        for function, field_names in aggregations.items():
+            if function not in cls.AGGREGATE_FUNCTIONS:
+                raise ValueError(
+                    f"aggregate function must be one of {list(cls.AGGREGATE_FUNCTIONS)}, not {function}"
+                )
+            if isinstance(field_names, str):
+                field_names = [field_names]
+            for field_name in field_names:
+                field = fields.get(field_name)
+                if not isinstance(field, Number):
+                    raise ValueError(f"Field {field_name} is not a Number field")
+                target_unit = (
+                    to_unit.get(field_name) if isinstance(to_unit, dict) else to_unit
+                )
+                requests.append((function, field_name, field, target_unit))
+
+        results: dict[str, NumberValue | None] = {}
+        unit_requests = [
+            request
+            for request in requests
+            if not isinstance(request[2].unit, DataBucketConnection)
+        ]
+        if unit_requests:
+            raw_results = queryset.order_by().aggregate(
+                **{
+                    f"{field_name}__{function}": cls.AGGREGATE_FUNCTIONS[function](
+                        cls.__getFieldPath(field_name)
+                    )
+                    for function, field_name, _, _ in unit_requests
+                }
+            )
+            for function, field_name, field, target_unit in unit_requests:
+                results[f"{field_name}__{function}"] = cls.__toAggregateValue(
+                    field, raw_results[f"{field_name}__{function}"], target_unit
+                )
+        for function, field_name, field, target_unit in requests:
+            if isinstance(field.unit, DataBucketConnection):
+                results[f"{field_name}__{function}"] = cls.__aggregateConnectedUnit(
+                    queryset, function, field_name, field, target_unit
+                )
+        return results
+
+    @classmethod
+    def __toAggregateValue(
+        cls, field: Number, value: Any, to_unit: Unit | CombinedUnit | None
+    ) -> NumberValue | None:
+        if value is None:
+            return None
+        if not isinstance(field.unit, Unit):
+            return NumberValue(value, decimal_places=field.decimal_places)
+        value = NumberValue(value, unit=field.unit.DB_BASE_UNIT).convert(
+            to_unit or field.unit
+        )
+        return NumberValue(
+            value.value, unit=value.unit, decimal_places=field.decimal_places
+        )
+
+    @classmethod
+    def __aggregateConnectedUnit(
+        cls,
+        queryset: models.QuerySet,
+        function: str,
+        field_name: str,
+        field: Number,
+        to_unit: Unit | None,
+    ) -> NumberValue | None:
+        connection_name = next(
+            name for name, other in cls.__getFields().items() if other is field.unit
+        )
+        if field.unit.unit_field is None:
+            raise ValueError(
+                f"DataBucketConnection {connection_name} must declare unit_field to aggregate {field_name}"
+            )
+        to_unit = to_unit or CurrencyUnit.DB_BASE_UNIT
+        if not isinstance(to_unit, Unit):
+            raise ValueError(
+                f"to_unit for {field_name} must be a Unit, not {to_unit.__class__.__name__}"
+            )
+        units_by_symbol = {unit.symbol: unit for unit in to_unit.__class__.UNITS}
+        group_path = f"{cls.__getFieldPath(connection_name)}__{field.unit.unit_field}"
+        path = cls.__getFieldPath(field_name)
+        groups = (
+            queryset.order_by()
+            .values(group_path)
+            .annotate(
+                total=models.Sum(path),
+                number=models.Count(path),
+                minimum=models.Min(path),
+                maximum=models.Max(path),
+            )
+        )
+        converted = []
+        for group in groups:
+            if group["number"] == 0:
+                continue
+            unit = units_by_symbol.get(group[group_path])
+            if unit is None:
+                logger.warning(
+                    "Skipping %d %s values of %s without a known %s unit (%r)",
+                    group["number"],
+                    field_name,
+                    cls.data_bucket.__class__.__name__,
+                    to_unit.__class__.__name__,
+                    group[group_path],
+                )
+                continue
+            factor = toDecimal(unit.convert(to_unit)[0])
+            converted.append(
+                {
+                    "total": group["total"] * factor,
+                    "minimum": group["minimum"] * factor,
+                    "maximum": group["maximum"] * factor,
+                    "number": group["number"],
+                }
+            )
+        if not converted:
+            return None
+        if function == "sum":
+            value = sum(group["total"] for group in converted)
+        elif function == "avg":
+            value = sum(group["total"] for group in converted) / sum(
+                group["number"] for group in converted
+            )
+        elif function == "min":
+            value = min(group["minimum"] for group in converted)
+        else:
+            value = max(group["maximum"] for group in converted)
+        return NumberValue(value, unit=to_unit, decimal_places=field.decimal_places)
+
+    @classmethod
+    def _translateOrdering(cls, field_names: Iterable[str]) -> list[str]:
+        ordering = []
+        for field_name in field_names:
+            prefix = "-" if field_name.startswith("-") else ""
+            ordering.append(f"{prefix}{cls.__getFieldPath(field_name.lstrip('-'))}")
+        return ordering
+
+    @classmethod
+    def __toFilterValue(cls, field: dbField | None, value: Any) -> Any:
+        if isinstance(value, (list, tuple, set)):
+            return [cls.__toFilterValue(field, item) for item in value]
+        if field is None or isinstance(field, DataBucketConnection):
+            return cls.__toPrimaryKey(value)
+        if isinstance(field, Number):
+            return cls.__toBaseUnitValue(field, value)
+        if isinstance(value, Value):
+            return value.value
+        return value
+
+    @classmethod
+    def _getConnections(cls) -> dict[str, DataBucketConnection]:
+        return {
+            field_name: field
+            for field_name, field in cls.__getFields().items()
+            if isinstance(field, DataBucketConnection)
+        }
 
     @classmethod
     def __getFields(cls) -> dict[str, dbField]:
@@ -65,22 +683,117 @@ class Database(DataInterface):
 
     @classmethod
     def __createModels(
-        cls, defined_fields: dict[str, dbField]
+        cls, defined_fields: dict[str, dbField], app_label: str | None
     ) -> tuple[unchangeable, changeable]:
         unchangeable_fields, changeable_fields = cls.__sortFields(defined_fields)
-        unchangeable_model = cls.__createModel(unchangeable_fields, unchangeable)
-        changeable_model = cls.__createModel(changeable_fields, changeable)
-        changeable_model.__link_to_unchangeable = models.ForeignKey(
-            unchangeable_model, on_delete=models.CASCADE
+        constraints = cls.__getUniqueConstraints(defined_fields)
+        unchangeable_model = cls.__createModel(
+            unchangeable_fields,
+            unchangeable,
+            app_label,
+            {"is_deleted": models.BooleanField(default=False)} if constraints else None,
+            meta_options={
+                "indexes": cls.__getFieldIndexes(unchangeable_fields, unchangeable),
+                "constraints": constraints,
+            },
+        )
+        changeable_model = cls.__createModel(
+            changeable_fields,
+            changeable,
+            app_label,
+            {
+                LINK_FIELD_NAME: models.ForeignKey(
+                    unchangeable_model,
+                    on_delete=models.CASCADE,
+                    related_name=CHANGEABLE_RELATED_NAME,
+                )
+            },
+            meta_options={
+                "indexes": [
+                    cls.__createIndex(
+                        changeable,
+                        "current",
+                        [LINK_FIELD_NAME, "-updated_at", "-id"],
+                        condition=models.Q(is_deleted=False),
+                    ),
+                    *cls.__getFieldIndexes(changeable_fields, changeable),
+                ]
+            },
         )
         return unchangeable_model, changeable_model
 
+    @classmethod
+    def __getFieldIndexes(
+        cls,
+        fields: dict[str, dbField],
+        model_base: type[unchangeable] | type[changeable],
+    ) -> list[models.Index]:
+        condition = models.Q(is_deleted=False) if model_base is changeable else None
+        return [
+            cls.__createIndex(model_base, field_name, [field_name], condition)
+            for field_name, field in fields.items()
+            if field.db_index and not cls.__isManyToMany(field)
+        ]
+
+    @classmethod
+    def __getUniqueConstraints(
+        cls, defined_fields: dict[str, dbField]
+    ) -> list[models.UniqueConstraint]:
+        meta = cls.__dict__.get("Meta")
+        constraints = []
+        for field_names in getattr(meta, "unique_together", []):
+            field_names = list(field_names)
+            for field_name in field_names:
+                field = defined_fields.get(field_name)
+                if field is None:
+                    raise ValueError(
+                        f"unique_together of {cls.data_bucket.__class__.__name__} references unknown field {field_name}"
+                    )
+                if field.is_changeable or cls.__isManyToMany(field):
+                    raise ValueError(
+                        f"unique_together of {cls.data_bucket.__class__.__name__} can only use fields with is_changeable=False that are not ManyToMany, not {field_name}"
+                    )
+            constraints.append(
+                models.UniqueConstraint(
+                    fields=field_names,
+                    condition=models.Q(is_deleted=False),
+                    name=cls.__getIndexName(
+                        unchangeable, "unique_" + "_".join(field_names)
+                    ),
+                )
+            )
+        return constraints
+
+    @classmethod
+    def __createIndex(
+        cls,
+        model_base: type[unchangeable] | type[changeable],
+        suffix: str,
+        fields: list[str],
+        condition: models.Q | None = None,
+    ) -> models.Index:
+        return models.Index(
+            fields=fields,
+            name=cls.__getIndexName(model_base, suffix),
+            condition=condition,
+        )
+
+    @classmethod
+    def __getIndexName(
+        cls, model_base: type[unchangeable] | type[changeable], suffix: str
+    ) -> str:
+        class_name = f"{cls.data_bucket.__class__.__name__}_{model_base.__name__}"
+        digest = hashlib.md5(
+            f"{cls.app_label}.{class_name}.{suffix}".encode(), usedforsecurity=False
+        ).hexdigest()[:8]
+        return f"db_{suffix[:16]}_{digest}"
+
     @classmethod
     def __sortFields(cls, defined_fields: dict[str, dbField]) -> tuple[dict, dict]:
         unchangeable_fields = {}
         changeable_fields = {}
         for field_name, field in defined_fields.items():
-            if isinstance(field, Number) and field.unit is not None:
+            if isinstance(field, Number) and isinstance(field.unit, Unit):
                 field.related_name = f"{field_name}_{field.unit.name}"
             if field.is_changeable:
                 changeable_fields[field_name] = field
@@ -94,29 +807,367 @@ class Database(DataInterface):
         cls,
         fields: dict[str, dbField],
         model_base: type[unchangeable] | type[changeable],
+        app_label: str | None,
+        extra_attributes: dict[str, models.Field] | None = None,
+        meta_options: dict[str, Any] | None = None,
     ) -> unchangeable | changeable:
         attributes = {field_name: field.field for field_name, field in fields.items()}
+        attributes.update(extra_attributes or {})
         attributes["__module__"] = cls.__module__.split(".")[0]
-        class_name = f"{cls.data_bucket.__name__}_{model_base.__name__}"
+        meta_options = dict(meta_options or {})
+        if app_label is not None:
+            meta_options["app_label"] = app_label
+        if meta_options:
+            attributes["Meta"] = type("Meta", (), meta_options)
+        class_name = f"{cls.data_bucket.__class__.__name__}_{model_base.__name__}"
         model_class = type(class_name, (model_base,), attributes)
         return model_class
 
     @classmethod
     def __registerModels(
-        cls, model_tuple: tuple[unchangeable, changeable], file_path: str
+        cls, model_tuple: tuple[unchangeable, changeable], app_label: str | None
     ) -> None:
-        app_label = cls.__getAppLabelFromFile(file_path)
         app_config = apps.get_app_config(app_label)
         for model_class in model_tuple:
+            model_name = model_class.__name__.lower()
+            if app_config.models.get(model_name) is model_class:
+                continue
             model_class._meta.app_label = app_label
-            app_config.models[model_class.__name__.lower()] = model_class
+            app_config.models[model_name] = model_class
             models.signals.class_prepared.send(sender=model_class)
 
     @staticmethod
     def __getAppLabelFromFile(file_path: str) -> str | None:
-        abs_file_path = os.path.abspath(file_path)
-        for app_config in apps.get_app_configs():
-            app_path = os.path.abspath(app_config.path)
-            if abs_file_path.startswith(app_path):
-                return app_config.label
-        return None
+        return AppLabelIndex.getAppLabel(file_path)
+
+    @classmethod
+    def _bulkInsert(
+        cls,
+        rows: Iterable[dict[str, Any]],
+        creator: Any = None,
+        batch_size: int | None = None,
+    ) -> int:
+        fields = cls.__getFields()
+        rows = list(rows)
+        batch_size = batch_size or cls.BULK_BATCH_SIZE
+        with transaction.atomic():
+            for start in range(0, len(rows), batch_size):
+                split_rows = []
+                for row in rows[start : start + batch_size]:
+                    unchangeable_data = {}
+                    changeable_data = {}
+                    for field_name, value in row.items():
+                        field = fields[field_name]
+                        target_data = (
+                            changeable_data
+                            if field.is_changeable
+                            else unchangeable_data
+                        )
+                        target_data[field.field.attname] = value
+                    split_rows.append((unchangeable_data, changeable_data))
+                cls.__insertObjects(split_rows, creator)
+        cls._invalidateCache()
+        return len(rows)
+
+    @classmethod
+    def __insertObjects(
+        cls, split_rows: list[tuple[dict[str, Any], dict[str, Any]]], creator: Any
+    ) -> tuple[list[unchangeable], list[changeable]]:
+        unchangeable_model, changeable_model = cls.model_tuple
+        unchangeable_objects = [
+            unchangeable_model(**unchangeable_data)
+            for unchangeable_data, _ in split_rows
+        ]
+        if connection.features.can_return_rows_from_bulk_insert:
+            unchangeable_model.objects.bulk_create(unchangeable_objects)
+        else:
+            for unchangeable_object in unchangeable_objects:
+                unchangeable_object.save()
+        changeable_objects = changeable_model.objects.bulk_create(
+            [
+                changeable_model(
+                    **changeable_data,
+                    **cls.__getCreatorAttributes(creator),
+                    **{LINK_FIELD_NAME: unchangeable_object},
+                )
+                for unchangeable_object, (_, changeable_data) in zip(
+                    unchangeable_objects, split_rows
+                )
+            ]
+        )
+        return unchangeable_objects, changeable_objects
+
+    @classmethod
+    def __createBatch(cls, rows: list[dict], creator: Any) -> list[DataBucket]:
+        split_rows = [cls.__splitData(row) for row in rows]
+        unchangeable_objects, changeable_objects = cls.__insertObjects(
+            [
+                (unchangeable_data, changeable_data)
+                for unchangeable_data, changeable_data, _ in split_rows
+            ],
+            creator,
+        )
+        many_to_many_rows = [
+            many_to_many_data for _, _, many_to_many_data in split_rows
+        ]
+        cls.__setManyToMany(unchangeable_objects, changeable_objects, many_to_many_rows)
+        return [
+            cls.__toRecord(*objects)
+            for objects in zip(
+                unchangeable_objects, changeable_objects, many_to_many_rows
+            )
+        ]
+
+    @classmethod
+    def __updateBatch(
+        cls, ids: list[int], rows: list[dict], creator: Any
+    ) -> list[DataBucket]:
+        unchangeable_model, changeable_model = cls.model_tuple
+        split_rows = []
+        for row in rows:
+            unchangeable_data, changeable_data, many_to_many_data = cls.__splitData(
+                row, partial=True
+            )
+            if unchangeable_data:
+                raise ValueError(
+                    f"Fields {list(unchangeable_data)} of {cls.data_bucket.__class__.__name__} are not changeable"
+                )
+            split_rows.append((changeable_data, many_to_many_data))
+
+        unchangeable_objects = unchangeable_model.objects.in_bulk(ids)
+        current_objects = cls.__getCurrentChangeables(ids)
+        for id in ids:
+            if id not in unchangeable_objects or id not in current_objects:
+                raise ValueError(
+                    f"{cls.data_bucket.__class__.__name__} with id {id} does not exist"
+                )
+
+        history_fields = [
+            field.attname
+            for field in changeable_model._meta.concrete_fields
+            if field.name not in cls.HISTORY_FIELD_NAMES
+        ]
+        changeable_objects = changeable_model.objects.bulk_create(
+            [
+                changeable_model(
+                    **{
+                        **{
+                            attname: getattr(current_objects[id], attname)
+                            for attname in history_fields
+                        },
+                        **changeable_data,
+                    },
+                    **cls.__getCreatorAttributes(creator),
+                    **{LINK_FIELD_NAME: unchangeable_objects[id]},
+                )
+                for id, (changeable_data, _) in zip(ids, split_rows)
+            ]
+        )
+        many_to_many_rows = cls.__carryManyToManyForward(
+            [current_objects[id] for id in ids],
+            [many_to_many_data for _, many_to_many_data in split_rows],
+        )
+        cls.__setManyToMany(
+            [unchangeable_objects[id] for id in ids],
+            changeable_objects,
+            many_to_many_rows,
+            changeable_only=True,
+        )
+        return [
+            cls.__toRecord(unchangeable_objects[id], changeable_object, many_to_many)
+            for id, changeable_object, many_to_many in zip(
+                ids, changeable_objects, many_to_many_rows
+            )
+        ]
+
+    @classmethod
+    def __getCurrentChangeables(cls, ids: list[int]) -> dict[int, changeable]:
+        _, changeable_model = cls.model_tuple
+        link_attname = f"{LINK_FIELD_NAME}_id"
+        return {
+            getattr(changeable_object, link_attname): changeable_object
+            for changeable_object in changeable_model.objects.current().filter(
+                **{f"{link_attname}__in": ids}
+            )
+        }
+
+    @staticmethod
+    def __getCreatorAttributes(creator: Any) -> dict[str, Any]:
+        if isinstance(creator, models.Model):
+            return {"creator": creator}
+        return {"creator_id": creator}
+
+    @classmethod
+    def __splitData(
+        cls, data: dict, partial: bool = False
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, list[int]]]:
+        fields = cls.__getFields()
+        unknown_fields = set(data) - set(fields)
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown fields for {cls.data_bucket.__class__.__name__}: {sorted(unknown_fields)}"
+            )
+        unchangeable_data = {}
+        changeable_data = {}
+        many_to_many_data = {}
+        for field_name, field in fields.items():
+            if field_name not in data:
+                if not partial and field.is_required and field.default is None:
+                    raise ValueError(f"Field {field_name} is required")
+                continue
+            value = data[field_name]
+            if cls.__isManyToMany(field):
+                many_to_many_data[field_name] = [
+                    cls.__toPrimaryKey(item) for item in value
+                ]
+                continue
+            target_data = changeable_data if field.is_changeable else unchangeable_data
+            target_data[field.field.attname] = cls.__toDatabaseValue(field, value)
+        return unchangeable_data, changeable_data, many_to_many_data
+
+    @staticmethod
+    def __isManyToMany(field: dbField) -> bool:
+        return isinstance(field, DataBucketConnection) and field.type == "ManyToMany"
+
+    @classmethod
+    def __toDatabaseValue(cls, field: dbField, value: Any) -> Any:
+        if isinstance(field, Number):
+            return cls.__toBaseUnitValue(field, value)
+        if isinstance(field, DataBucketConnection):
+            return cls.__toPrimaryKey(value)
+        if isinstance(value, Value):
+            return value.value
+        return value
+
+    @staticmethod
+    def __toBaseUnitValue(field: Number, value: Any) -> Any:
+        if value is None:
+            return None
+        if not isinstance(field.unit, Unit):
+            return value.value if isinstance(value, Value) else value
+        if not isinstance(value, NumberValue):
+            value = NumberValue(value, unit=field.unit)
+        elif value.unit is None or value.unit.is_none:
+            return value.value
+        return value.convert(field.unit.DB_BASE_UNIT).value
+
+    @staticmethod
+    def __toPrimaryKey(value: Any) -> Any:
+        if isinstance(value, Value):
+            return value.value
+        if hasattr(value, "id") and not isinstance(value, int):
+            return value.id
+        return value
+
+    @classmethod
+    def __toValue(cls, field: dbField, value: Any) -> Value | None:
+        if value is None:
+            return None
+        if isinstance(field, Number):
+            unit = field.unit if isinstance(field.unit, Unit) else None
+            if field.fixed_point:
+                return cls.__toFixedPointValue(field, unit, value)
+            if not isinstance(value, Decimal):
+                value = toDecimal(value)
+            if unit is not None:
+                factor, _ = unit.DB_BASE_UNIT.convert(unit)
+                value = value * toDecimal(factor)
+            return NumberValue._fromDecimal(value, unit, field.decimal_places)
+        if isinstance(field, DataBucketConnection):
+            return Value(value, connected_interface=field.DataBucket)
+        return StringValue(value)
+
+    @staticmethod
+    def __toFixedPointValue(
+        field: Number, unit: Unit | None, value: Any
+    ) -> FixedPointNumberValue:
+        scaled = Fraction(value) * 10**field.decimal_places
+        if unit is not None:
+            factor, _ = unit.DB_BASE_UNIT.convertExact(unit)
+            scaled *= factor
+        return FixedPointNumberValue._fromScaled(
+            round(scaled), unit, field.decimal_places
+        )
+
+    @classmethod
+    def __setManyToMany(
+        cls,
+        unchangeable_objects: list[unchangeable],
+        changeable_objects: list[changeable],
+        many_to_many_rows: list[dict[str, list[int]]],
+        changeable_only: bool = False,
+    ) -> None:
+        for field_name, field in cls.__getFields().items():
+            if not cls.__isManyToMany(field):
+                continue
+            if changeable_only and not field.is_changeable:
+                continue
+            owners = changeable_objects if field.is_changeable else unchangeable_objects
+            through_model = field.field.remote_field.through
+            source_attname = f"{field.field.m2m_field_name()}_id"
+            target_attname = f"{field.field.m2m_reverse_field_name()}_id"
+            through_model.objects.bulk_create(
+                [
+                    through_model(
+                        **{source_attname: owner.pk, target_attname: target_id}
+                    )
+                    for owner, many_to_many_data in zip(owners, many_to_many_rows)
+                    for target_id in many_to_many_data.get(field_name, [])
+                ]
+            )
+
+    @classmethod
+    def __carryManyToManyForward(
+        cls,
+        current_objects: list[changeable],
+        many_to_many_rows: list[dict[str, list[int]]],
+    ) -> list[dict[str, list[int]]]:
+        carried_rows = [
+            dict(many_to_many_data) for many_to_many_data in many_to_many_rows
+        ]
+        for field_name, field in cls.__getFields().items():
+            if not cls.__isManyToMany(field) or not field.is_changeable:
+                continue
+            missing_pks = [
+                current_object.pk
+                for current_object, carried in zip(current_objects, carried_rows)
+                if field_name not in carried
+            ]
+            if not missing_pks:
+                continue
+            through_model = field.field.remote_field.through
+            source_attname = f"{field.field.m2m_field_name()}_id"
+            target_attname = f"{field.field.m2m_reverse_field_name()}_id"
+            previous_targets: dict[int, list[int]] = {}
+            for source_id, target_id in through_model.objects.filter(
+                **{f"{source_attname}__in": missing_pks}
+            ).values_list(source_attname, target_attname):
+                previous_targets.setdefault(source_id, []).append(target_id)
+            for current_object, carried in zip(current_objects, carried_rows):
+                if field_name not in carried:
+                    carried[field_name] = previous_targets.get(current_object.pk, [])
+        return carried_rows
+
+    @classmethod
+    def __toRecord(
+        cls,
+        unchangeable_object: unchangeable,
+        changeable_object: changeable,
+        many_to_many_data: dict[str, list[int]] | None = None,
+    ) -> DataBucket:
+        values = {}
+        for field_name, field in cls.__getFields().items():
+            if cls.__isManyToMany(field):
+                if many_to_many_data is not None and field_name in many_to_many_data:
+                    values[field_name] = Value(
+                        many_to_many_data[field_name],
+                        connected_interface=field.DataBucket,
+                    )
+                continue
+            model_object = (
+                changeable_object if field.is_changeable else unchangeable_object
+            )
+            values[field_name] = cls.__toValue(
+                field, getattr(model_object, field.field.attname)
+            )
+        return cls.data_bucket.__class__(id=unchangeable_object.pk, **values)
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from django.conf import settings
 from django.db import models
+from DataBucket.src.auxiliary.data_bucket_registry import (
+    DataBucketRegistry,
+    DataBucketRegistration,
+)
 from DataBucket.src.units.unit import Unit
-from typing import Any
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from DataBucket.src.data_bucket import DataBucket as DataBucketClass
+    from DataBucket.src.database.database_interface import Database
+    from DataBucket.src.database.deletion import DeletionCollector
 
 
 class dbField:
@@ -10,6 +20,7 @@ class dbField:
     IS_CHANGEABLE: bool = True
     IS_REQUIRED: bool = False
     IS_UNIQUE: bool = False
+    DB_INDEX: bool = False
     DEFAULT: Any = None
 
     unit: Unit | None
@@ -24,10 +35,12 @@ class dbField:
         is_required: bool | None = None,
         is_unique: bool | None = None,
         default: Any | None = None,
+        db_index: bool | None = None,
     ):
         self.__is_changeable = self.__checkAndGetBool(is_changeable, self.IS_CHANGEABLE)
         self.__is_required = self.__checkAndGetBool(is_required, self.IS_REQUIRED)
         self.__is_unique = self.__checkAndGetBool(is_unique, self.IS_UNIQUE)
+        self.__db_index = self.__checkAndGetBool(db_index, self.DB_INDEX)
         self.__default: Any = default
 
     def __checkAndGetBool(self, value: bool | None, default: bool) -> bool:
@@ -53,26 +66,45 @@ class dbField:
     def default(self) -> Any:
         return self.__default
 
+    @property
+    def db_index(self) -> bool:
+        return self.__db_index
+
     @property
     def field(self) -> models.Field:
         raise NotImplementedError
 
-    def DO_NOTHING(self):
+    def DO_NOTHING(
+        self,
+        collector: DeletionCollector,
+        data_interface: type[Database],
+        field_name: str,
+        ids: list[int],
+    ) -> None:
         if not isinstance(self, DataBucketConnection):
-            raise ValueError("CASCADE is only valid for DataBucketConnection")
-        return
+            raise ValueError("DO_NOTHING is only valid for DataBucketConnection")
 
-    def CASCADE(self):
+    def CASCADE(
+        self,
+        collector: DeletionCollector,
+        data_interface: type[Database],
+        field_name: str,
+        ids: list[int],
+    ) -> None:
         if not isinstance(self, DataBucketConnection):
             raise ValueError("CASCADE is only valid for DataBucketConnection")
-        raise NotImplementedError
-        # TODO: Implement CASCADE
+        collector.cascade(data_interface, field_name, self, ids)
 
-    def SET_NULL(self):
+    def SET_NULL(
+        self,
+        collector: DeletionCollector,
+        data_interface: type[Database],
+        field_name: str,
+        ids: list[int],
+    ) -> None:
         if not isinstance(self, DataBucketConnection):
             raise ValueError("SET_NULL is only valid for DataBucketConnection")
-        raise NotImplementedError
-        # TODO: Implement SET_NULL
+        collector.setNull(data_interface, field_name, self, ids)
 
 
 class String(dbField):
@@ -89,6 +121,7 @@ class String(dbField):
         is_required: bool | None = None,
         is_unique: bool | None = None,
         default: Any | None = None,
+        db_index: bool | None = None,
     ):
         self.__max_length = max_length
 
@@ -103,6 +136,7 @@ class String(dbField):
             default=default,
             is_unique=is_unique,
             is_changeable=is_changeable,
+            db_index=db_index,
         )
 
         attributes = {
@@ -130,26 +164,43 @@ class DataBucketConnection(dbField):
         "ManyToMany": models.ManyToManyField,
     }
 
-    def __init__(self, DataBucket: str, type: str, on_delete: dbField, **kwargs: dict):
+    def __init__(
+        self,
+        DataBucket: str,
+        type: str,
+        on_delete: dbField,
+        unit_field: str | None = None,
+        **kwargs: dict,
+    ):
         self.__DataBucket = DataBucket
         self.__type = type
         self.__on_delete = on_delete
+        self.__unit_field = unit_field
+        self.__registration: DataBucketRegistration | None = None
 
         if type not in self.TYPE_CHOICES_DICT:
             raise ValueError(f"Invalid type: {type}")
 
+        super().__init__(**kwargs)
+
+        if on_delete not in (dbField.DO_NOTHING, dbField.CASCADE, dbField.SET_NULL):
+            raise ValueError(
+                "on_delete must be dbField.DO_NOTHING, dbField.CASCADE or dbField.SET_NULL"
+            )
+        if on_delete is dbField.SET_NULL and self.is_required and type != "ManyToMany":
+            raise ValueError("SET_NULL requires a connection that is not required")
+
         self.field_representation = self.TYPE_CHOICES_DICT[type]
         attributes = self.getFieldAttributes(type)
 
-        super().__init__(**kwargs)
-
         self.__field = self.field_representation(
             self.__getDataBucketModelByName(self.DataBucket),
             **attributes,
         )
+        DataBucketRegistry.whenRegistered(self.DataBucket, self.__setRegistration)
 
     def getFieldAttributes(self, type):
-        attributes = {}
+        attributes = {"related_name": "+"}
         if type != "ManyToMany":
 
             attributes["on_delete"] = models.DO_NOTHING
@@ -161,6 +212,20 @@ class DataBucketConnection(dbField):
     def DataBucket(self) -> str:
         return self.__DataBucket
 
+    @property
+    def is_resolved(self) -> bool:
+        return self.__registration is not None
+
+    @property
+    def data_bucket(self) -> type[DataBucketClass]:
+        if self.__registration is None:
+            raise ValueError(f"DataBucket '{self.DataBucket}' is not registered yet")
+        return self.__registration.data_bucket
+
+    @property
+    def unit_field(self) -> str | None:
+        return self.__unit_field
+
     @property
     def type(self) -> str:
         return self.__type
@@ -173,15 +238,16 @@ class DataBucketConnection(dbField):
     def field(self) -> models.Field:
         return self.__field
 
-    def __getDataBucketModelByName(self, name: str) -> models.Model:
-        from DataBucket.src.database.database_interface import Database
+    def __setRegistration(self, registration: DataBucketRegistration) -> None:
+        self.__registration = registration
 
-        for subclass in Database.__subclasses__():
-            if subclass.__name__ == f"{name}__unchangeable__" and issubclass(
-                subclass, models.Model
-            ):
-                return subclass
-        raise ValueError(f"DataBucket '{name}' not found")
+    def __getDataBucketModelByName(self, name: str) -> type[models.Model] | str:
+        registration = DataBucketRegistry.find(name)
+        if registration is None:
+            return f"{name}_unchangeable"
+        if not registration.data_interface.is_materialized():
+            return f"{registration.qualified_name}_unchangeable"
+        return registration.unchangeable_model
 
 
 class Number(dbField):
@@ -195,12 +261,18 @@ class Number(dbField):
         is_changeable: bool | None = None,
         is_required: bool | None = None,
         default: Any = None,
+        fixed_point: bool | None = None,
+        db_index: bool | None = None,
     ):
         self.__decimal_places = decimal_places
         self.__unit = self.__getDefinedUnit(unit)
+        self.__fixed_point = self.__getFixedPoint(fixed_point)
 
         super().__init__(
-            is_changeable=is_changeable, is_required=is_required, default=default
+            is_changeable=is_changeable,
+            is_required=is_required,
+            default=default,
+            db_index=db_index,
         )
 
         if decimal_places < 0:
@@ -224,12 +296,30 @@ class Number(dbField):
         return self.__decimal_places
 
     @property
-    def unit(self) -> Unit | None:
+    def unit(self) -> Unit | DataBucketConnection | None:
         return self.__unit
 
+    @property
+    def fixed_point(self) -> bool:
+        return self.__fixed_point
+
+    @staticmethod
+    def __getFixedPoint(fixed_point: bool | None) -> bool:
+        if fixed_point is None:
+            return bool(getattr(settings, "DATA_BUCKET_FIXED_POINT", False))
+        if not isinstance(fixed_point, bool):
+            raise ValueError("fixed_point must be a boolean")
+        return fixed_point
+
     @property
     def field(self) -> models.Field:
         return self.__field
 
-    def __getDefinedUnit(self, unit: Unit | DataBucketConnection | None) -> Unit | None:
-        pass
\ No newline at end of file
+    def __getDefinedUnit(
+        self, unit: Unit | DataBucketConnection | None
+    ) -> Unit | DataBucketConnection | None:
+        if unit is None or isinstance(unit, (Unit, DataBucketConnection)):
+            return unit
+        raise TypeError(
+            f"Invalid type for unit: {type(unit)}, must be Unit or DataBucketConnection"
+        )
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+from DataBucket.src.database.abstract_models import (
+    LINK_FIELD_NAME,
+    CHANGEABLE_RELATED_NAME,
+)
+from DataBucket.src.database.db_field import DataBucketConnection
+from DataBucket.src.database.session import DataBucketSession
+from django.db import models
+from functools import partial
+from typing import Callable, Iterable, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from DataBucket.src.database.database_interface import Database
+
+
+class DeletionCollector:
+
+    BATCH_SIZE: int = 5000
+
+    def __init__(self) -> None:
+        self.__deleted: dict[type[Database], set[int]] = {}
+        self.__queue: list[tuple[type[Database], list[int]]] = []
+        self.__updates: list[tuple[type[Database], Callable[[], int]]] = []
+
+    def collect(self, data_interface: type[Database], ids: Iterable[int]) -> None:
+        self.__addDeleted(data_interface, ids)
+        while self.__queue:
+            target_interface, target_ids = self.__queue.pop(0)
+            for owner_interface, field_name, field in self.__getReferences(
+                target_interface
+            ):
+                field.on_delete(field, self, owner_interface, field_name, target_ids)
+
+    def cascade(
+        self,
+        data_interface: type[Database],
+        field_name: str,
+        field: DataBucketConnection,
+        ids: list[int],
+    ) -> None:
+        if field.type == "ManyToMany":
+            self.setNull(data_interface, field_name, field, ids)
+            return
+        unchangeable_model, changeable_model = data_interface.model_tuple
+        if field.is_changeable:
+            queryset = changeable_model.objects.current()
+            owner_path = f"{LINK_FIELD_NAME}_id"
+        else:
+            queryset = unchangeable_model.objects.filter(
+                **{f"{CHANGEABLE_RELATED_NAME}__is_deleted": False}
+            ).distinct()
+            owner_path = "pk"
+        owner_ids = []
+        for chunk in self.__chunks(ids):
+            owner_ids.extend(
+                queryset.filter(**{f"{field_name}__in": chunk}).values_list(
+                    owner_path, flat=True
+                )
+            )
+        self.__addDeleted(data_interface, owner_ids)
+
+    def setNull(
+        self,
+        data_interface: type[Database],
+        field_name: str,
+        field: DataBucketConnection,
+        ids: list[int],
+    ) -> None:
+        if field.type == "ManyToMany":
+            update = self.__removeLinks
+        elif field.is_changeable:
+            update = self.__nullChangeable
+        else:
+            update = self.__nullUnchangeable
+        for chunk in self.__chunks(ids):
+            self.__updates.append(
+                (
+                    data_interface,
+                    partial(update, data_interface, field_name, field, chunk),
+                )
+            )
+
+    def apply(self) -> None:
+        for data_interface, ids in self.__deleted.items():
+            unchangeable_model, changeable_model = data_interface.model_tuple
+            for chunk in self.__chunks(sorted(ids)):
+                changeable_model.objects.filter(
+                    **{f"{LINK_FIELD_NAME}__in": chunk}, is_deleted=False
+                ).update(is_deleted=True)
+                if hasattr(unchangeable_model, "is_deleted"):
+                    unchangeable_model.objects.filter(pk__in=chunk).update(
+                        is_deleted=True
+                    )
+        for _, update in self.__updates:
+            update()
+        affected = {
+            **dict.fromkeys(self.__deleted),
+            **dict.fromkeys(data_interface for data_interface, _ in self.__updates),
+        }
+        for data_interface in affected:
+            data_interface._invalidateCache()
+        self.__updateSession()
+
+    def __updateSession(self) -> None:
+        session = DataBucketSession.getCurrent()
+        if session is None:
+            return
+        updated = dict.fromkeys(data_interface for data_interface, _ in self.__updates)
+        for data_interface, ids in self.__deleted.items():
+            if data_interface not in updated:
+                session.recordWrite(data_interface, deleted_ids=ids)
+        for data_interface in updated:
+            session.recordWrite(data_interface, forget_all=True)
+
+    @staticmethod
+    def __removeLinks(
+        data_interface: type[Database],
+        field_name: str,
+        field: DataBucketConnection,
+        ids: list[int],
+    ) -> int:
+        _, changeable_model = data_interface.model_tuple
+        through_model = field.field.remote_field.through
+        filter = {f"{field.field.m2m_reverse_field_name()}_id__in": ids}
+        if field.is_changeable:
+            filter[f"{field.field.m2m_field_name()}_id__in"] = (
+                changeable_model.objects.current().values("pk")
+            )
+        return through_model.objects.filter(**filter).delete()[0]
+
+    @staticmethod
+    def __nullChangeable(
+        data_interface: type[Database],
+        field_name: str,
+        field: DataBucketConnection,
+        ids: list[int],
+    ) -> int:
+        _, changeable_model = data_interface.model_tuple
+        current = (
+            changeable_model.objects.current()
+            .filter(**{f"{field_name}__in": ids})
+            .values("pk")
+        )
+        return changeable_model.objects.filter(pk__in=models.Subquery(current)).update(
+            **{field_name: None}
+        )
+
+    @staticmethod
+    def __nullUnchangeable(
+        data_interface: type[Database],
+        field_name: str,
+        field: DataBucketConnection,
+        ids: list[int],
+    ) -> int:
+        unchangeable_model, _ = data_interface.model_tuple
+        return unchangeable_model.objects.filter(**{f"{field_name}__in": ids}).update(
+            **{field_name: None}
+        )
+
+    def __addDeleted(self, data_interface: type[Database], ids: Iterable[int]) -> None:
+        deleted = self.__deleted.setdefault(data_interface, set())
+        new_ids = [id for id in dict.fromkeys(ids) if id not in deleted]
+        if not new_ids:
+            return
+        deleted.update(new_ids)
+        self.__queue.append((data_interface, new_ids))
+
+    def __chunks(self, ids: list[int]) -> Iterator[list[int]]:
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            yield ids[start : start + self.BATCH_SIZE]
+
+    @staticmethod
+    def __getReferences(
+        target_interface: type[Database],
+    ) -> Iterator[tuple[type[Database], str, DataBucketConnection]]:
+        target_bucket = target_interface.data_bucket.__class__
+        for registration in DataBucketRegistry.getRegistrations():
+            get_connections = getattr(
+                registration.data_interface, "_getConnections", None
+            )
+            if get_connections is None:
+                continue
+            for field_name, field in get_connections().items():
+                if field.is_resolved and field.data_bucket is target_bucket:
+                    yield registration.data_interface, field_name, field
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+from django.db import connections
+from threading import Lock
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+import logging
+import time
+
+if TYPE_CHECKING:
+    from DataBucket.src.auxiliary.interface_definition import DataInterface
+
+
+@dataclass
+class OperationSample:
+    data_bucket: str
+    operation: str
+    queries: int = 0
+    rows: int = 0
+    sql_seconds: float = 0.0
+    total_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def python_seconds(self) -> float:
+        return max(self.total_seconds - self.sql_seconds, 0.0)
+
+
+@dataclass
+class OperationMetrics:
+    data_bucket: str
+    operation: str
+    calls: int = 0
+    queries: int = 0
+    rows: int = 0
+    sql_seconds: float = 0.0
+    python_seconds: float = 0.0
+    total_seconds: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def add(self, sample: OperationSample) -> None:
+        self.calls += 1
+        self.queries += sample.queries
+        self.rows += sample.rows
+        self.sql_seconds += sample.sql_seconds
+        self.python_seconds += sample.python_seconds
+        self.total_seconds += sample.total_seconds
+        self.cache_hits += sample.cache_hits
+        self.cache_misses += sample.cache_misses
+
+
+class MetricsSink:
+
+    def record(self, sample: OperationSample) -> None:
+        raise NotImplementedError
+
+
+class AggregatingSink(MetricsSink):
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__metrics: dict[tuple[str, str], OperationMetrics] = {}
+
+    def record(self, sample: OperationSample) -> None:
+        key = (sample.data_bucket, sample.operation)
+        with self.__lock:
+            metrics = self.__metrics.get(key)
+            if metrics is None:
+                metrics = self.__metrics[key] = OperationMetrics(*key)
+            metrics.add(sample)
+
+    def getMetrics(
+        self, data_bucket: str | None = None, operation: str | None = None
+    ) -> list[OperationMetrics]:
+        with self.__lock:
+            return [
+                OperationMetrics(**vars(metrics))
+                for (bucket_name, operation_name), metrics in sorted(
+                    self.__metrics.items()
+                )
+                if data_bucket in (None, bucket_name)
+                and operation in (None, operation_name)
+            ]
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__metrics.clear()
+
+
+class MemorySink(AggregatingSink):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__samples: list[OperationSample] = []
+
+    @property
+    def samples(self) -> list[OperationSample]:
+        return list(self.__samples)
+
+    def record(self, sample: OperationSample) -> None:
+        self.__samples.append(sample)
+        super().record(sample)
+
+    def reset(self) -> None:
+        self.__samples.clear()
+        super().reset()
+
+
+class PrometheusSink(AggregatingSink):
+
+    METRIC_PREFIX: str = "databucket_operation"
+    COUNTERS: dict[str, str] = {
+        "calls": "Number of DataBucket operations",
+        "queries": "SQL queries executed by DataBucket operations",
+        "rows": "Rows returned by DataBucket operations",
+        "sql_seconds": "Seconds spent executing SQL",
+        "python_seconds": "Seconds spent outside SQL, mostly building Values",
+        "cache_hits": "BucketCache hits",
+        "cache_misses": "BucketCache misses",
+    }
+
+    def render(self) -> str:
+        metrics = self.getMetrics()
+        lines = []
+        for name, help_text in self.COUNTERS.items():
+            metric_name = f"{self.METRIC_PREFIX}_{name}_total"
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} counter")
+            for operation_metrics in metrics:
+                labels = (
+                    f'data_bucket="{operation_metrics.data_bucket}",'
+                    f'operation="{operation_metrics.operation}"'
+                )
+                lines.append(
+                    f"{metric_name}{{{labels}}} {getattr(operation_metrics, name)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+class LoggingSink(MetricsSink):
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.DEBUG
+    ) -> None:
+        self.__logger = logger or logging.getLogger("DataBucket.instrumentation")
+        self.__level = level
+
+    def record(self, sample: OperationSample) -> None:
+        if not self.__logger.isEnabledFor(self.__level):
+            return
+        self.__logger.log(
+            self.__level,
+            "%s.%s queries=%d rows=%d sql=%.6fs python=%.6fs cache_hits=%d cache_misses=%d",
+            sample.data_bucket,
+            sample.operation,
+            sample.queries,
+            sample.rows,
+            sample.sql_seconds,
+            sample.python_seconds,
+            sample.cache_hits,
+            sample.cache_misses,
+        )
+
+
+class QueryCounter:
+
+    def __init__(self, sample: OperationSample) -> None:
+        self.__sample = sample
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: dict
+    ) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.__sample.queries += 1
+            self.__sample.sql_seconds += time.perf_counter() - started_at
+
+
+class Instrumentation:
+
+    enabled: bool = False
+
+    SINK_TYPES: dict[str, type[MetricsSink]] = {
+        "log": LoggingSink,
+        "memory": MemorySink,
+        "prometheus": PrometheusSink,
+    }
+
+    __sinks: tuple[MetricsSink, ...] = ()
+    __current: ContextVar[OperationSample | None] = ContextVar(
+        "data_bucket_operation", default=None
+    )
+
+    @classmethod
+    def enable(cls, *sinks: MetricsSink | str) -> tuple[MetricsSink, ...]:
+        cls.__sinks = tuple(cls.__getSink(sink) for sink in sinks)
+        cls.enabled = bool(cls.__sinks)
+        return cls.__sinks
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.enabled = False
+        cls.__sinks = ()
+
+    @classmethod
+    def getSinks(cls) -> tuple[MetricsSink, ...]:
+        return cls.__sinks
+
+    @classmethod
+    def __getSink(cls, sink: MetricsSink | str) -> MetricsSink:
+        if isinstance(sink, MetricsSink):
+            return sink
+        if sink not in cls.SINK_TYPES:
+            raise ValueError(
+                f"sink must be a MetricsSink or one of {list(cls.SINK_TYPES)}, not {sink}"
+            )
+        return cls.SINK_TYPES[sink]()
+
+    @classmethod
+    def run(
+        cls,
+        data_interface: type[DataInterface],
+        operation: str,
+        function: Callable[..., Any],
+        *args: Any,
+        count_rows: Callable[[Any], int] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        if not cls.enabled or cls.__current.get() is not None:
+            return function(*args, **kwargs)
+        sample = OperationSample(
+            data_interface.data_bucket.__class__.__name__, operation
+        )
+        token = cls.__current.set(sample)
+        started_at = time.perf_counter()
+        try:
+            with connections["default"].execute_wrapper(QueryCounter(sample)):
+                result = function(*args, **kwargs)
+            if count_rows is not None:
+                sample.rows = count_rows(result)
+            return result
+        finally:
+            sample.total_seconds = time.perf_counter() - started_at
+            cls.__current.reset(token)
+            for sink in cls.__sinks:
+                sink.record(sample)
+
+    @classmethod
+    def recordCacheAccess(cls, hit: bool) -> None:
+        if not cls.enabled:
+            return
+        sample = cls.__current.get()
+        if sample is None:
+            return
+        if hit:
+            sample.cache_hits += 1
+        else:
+            sample.cache_misses += 1
+
+    @staticmethod
+    def countRecords(result: Iterable | Any) -> int:
+        if result is None:
+            return 0
+        if isinstance(result, (list, tuple)):
+            return len(result)
+        return 1
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from DataBucket.src.auxiliary.identity_map import IdentityMap
+from DataBucket.src.database.bucket_cache import freezeCacheKey
+from DataBucket.src.database.instrumentation import OperationSample, QueryCounter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from django.db import connections, transaction
+from typing import Any, Callable, Hashable, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from DataBucket.src.auxiliary.interface_definition import DataInterface
+    from DataBucket.src.data_bucket import DataBucket
+
+
+@dataclass
+class SessionStatistics:
+    reads_from_memory: int = 0
+    reads_from_database: int = 0
+    buffered_writes: int = 0
+    write_batches: int = 0
+    flush_queries: int = 0
+    queries_saved: int = 0
+
+
+@dataclass
+class PendingCreate:
+    data: dict
+    record: DataBucket | None = None
+
+
+@dataclass
+class PendingOperations:
+    creates: list[PendingCreate] = field(default_factory=list)
+    updates: dict[int, dict] = field(default_factory=dict)
+    deletes: dict[int, None] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+
+class DataBucketSession:
+
+    __current: ContextVar[DataBucketSession | None] = ContextVar(
+        "data_bucket_session", default=None
+    )
+    __MISSING = object()
+
+    def __init__(self, creator: Any = None) -> None:
+        self.__creator = creator
+        self.__identity_map = IdentityMap()
+        self.__lookups: dict[tuple[type[DataInterface], Hashable], int | None] = {}
+        self.__pending: dict[type[DataInterface], PendingOperations] = {}
+        self.__statistics = SessionStatistics()
+        self.__token: Token | None = None
+
+    @classmethod
+    def getCurrent(cls) -> DataBucketSession | None:
+        return cls.__current.get()
+
+    def __enter__(self) -> DataBucketSession:
+        self.__token = self.__current.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+            else:
+                self.__pending.clear()
+        finally:
+            self.__current.reset(self.__token)
+            self.__token = None
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        return self.__identity_map
+
+    @property
+    def statistics(self) -> SessionStatistics:
+        return SessionStatistics(**vars(self.__statistics))
+
+    @property
+    def has_pending(self) -> bool:
+        return any(self.__pending.values())
+
+    def get(
+        self,
+        data_interface: type[DataInterface],
+        filter: dict,
+        fetch: Callable[[], DataBucket | None],
+    ) -> DataBucket | None:
+        self.flush()
+        data_bucket = data_interface.data_bucket.__class__
+        id = self.__getFilterId(filter)
+        if id is not None:
+            record = self.__identity_map.get(data_bucket, id)
+            if record is not None:
+                self.__readFromMemory()
+                return record
+        lookup_key = (data_interface, freezeCacheKey(filter))
+        known_id = self.__lookups.get(lookup_key, self.__MISSING)
+        if known_id is not self.__MISSING:
+            record = (
+                None
+                if known_id is None
+                else self.__identity_map.get(data_bucket, known_id)
+            )
+            if known_id is None or record is not None:
+                self.__readFromMemory()
+                return record
+        record = fetch()
+        self.__statistics.reads_from_database += 1
+        if record is not None:
+            record = self.__identity_map.add(record)
+        self.__lookups[lookup_key] = None if record is None else record.id
+        return record
+
+    def register(self, records: Iterable[DataBucket]) -> list[DataBucket]:
+        return [self.__identity_map.add(record) for record in records]
+
+    def create(self, data_bucket: type[DataBucket], data: dict) -> PendingCreate:
+        pending_create = PendingCreate(dict(data))
+        self.__getPending(data_bucket).creates.append(pending_create)
+        self.__bufferWrite()
+        return pending_create
+
+    def update(self, data_bucket: type[DataBucket], id: int, data: dict) -> None:
+        pending = self.__getPending(data_bucket)
+        if id in pending.deletes:
+            raise ValueError(f"{data_bucket.__name__} with id {id} is pending deletion")
+        self.__bufferWrite()
+        pending.updates.setdefault(id, {}).update(data)
+
+    def delete(self, data_bucket: type[DataBucket], id: int) -> None:
+        pending = self.__getPending(data_bucket)
+        if id in pending.deletes:
+            return
+        pending.updates.pop(id, None)
+        pending.deletes[id] = None
+        self.__bufferWrite()
+
+    def recordWrite(
+        self,
+        data_interface: type[DataInterface],
+        records: Iterable[DataBucket] = (),
+        deleted_ids: Iterable[int] = (),
+        forget_all: bool = False,
+    ) -> None:
+        data_bucket = data_interface.data_bucket.__class__
+        self.__lookups = {
+            key: value
+            for key, value in self.__lookups.items()
+            if key[0] is not data_interface
+        }
+        if forget_all:
+            self.__identity_map.discardAll(data_bucket)
+        for id in deleted_ids:
+            self.__identity_map.discard(data_bucket, id)
+        for record in records:
+            self.__identity_map.discard(data_bucket, record.id)
+            self.__identity_map.add(record)
+
+    def flush(self) -> None:
+        if not self.has_pending:
+            return
+        pending_operations = self.__pending
+        self.__pending = {}
+        sample = OperationSample("DataBucketSession", "flush")
+        with connections["default"].execute_wrapper(QueryCounter(sample)):
+            with transaction.atomic():
+                for data_interface, pending in pending_operations.items():
+                    self.__flushOperations(data_interface, pending)
+        self.__statistics.flush_queries += sample.queries
+
+    def __flushOperations(
+        self, data_interface: type[DataInterface], pending: PendingOperations
+    ) -> None:
+        if pending.creates:
+            records = data_interface.bulk_create(
+                [pending_create.data for pending_create in pending.creates],
+                creator=self.__creator,
+            )
+            for pending_create, record in zip(pending.creates, records):
+                pending_create.record = record
+            self.recordWrite(data_interface, records)
+            self.__statistics.write_batches += 1
+        if pending.updates:
+            records = data_interface.bulk_update(
+                list(pending.updates),
+                list(pending.updates.values()),
+                creator=self.__creator,
+            )
+            self.recordWrite(data_interface, records)
+            self.__statistics.write_batches += 1
+        if pending.deletes:
+            data_interface.bulk_delete(list(pending.deletes))
+            self.recordWrite(data_interface, deleted_ids=pending.deletes)
+            self.__statistics.write_batches += 1
+
+    def __getPending(self, data_bucket: type[DataBucket]) -> PendingOperations:
+        return self.__pending.setdefault(data_bucket.DataInterface, PendingOperations())
+
+    def __readFromMemory(self) -> None:
+        self.__statistics.reads_from_memory += 1
+        self.__statistics.queries_saved += 1
+
+    def __bufferWrite(self) -> None:
+        self.__statistics.buffered_writes += 1
+
+    @staticmethod
+    def __getFilterId(filter: dict) -> int | None:
+        if len(filter) != 1:
+            return None
+        key, value = next(iter(filter.items()))
+        if key not in ("id", "pk"):
+            return None
+        return getattr(value, "value", value)
+
+    def __repr__(self) -> str:
+        return f"DataBucketSession({len(self.__identity_map)} records)"
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from DataBucket.src.auxiliary.lru_cache import CacheStatistics, LRUCache
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, TYPE_CHECKING
+import csv
+
+if TYPE_CHECKING:
+    from DataBucket.src.units.currency_unit import CurrencyUnit
+
+
+RateRow = tuple[str, "datetime | date | str", float]
+
+
+def toTimestamp(value: datetime | date | str) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class CurrencyRateLoader:
+
+    def load(self) -> Iterable[RateRow]:
+        raise NotImplementedError
+
+
+class StaticCurrencyRateLoader(CurrencyRateLoader):
+
+    def __init__(self, rates: dict[str, dict[datetime | date | str, float]]) -> None:
+        self.__rates = rates
+
+    def load(self) -> Iterable[RateRow]:
+        for currency, rates in self.__rates.items():
+            for valid_from, rate in rates.items():
+                yield currency, valid_from, rate
+
+
+class CSVCurrencyRateLoader(CurrencyRateLoader):
+
+    def __init__(
+        self,
+        file_path: str,
+        currency_column: str = "currency",
+        date_column: str = "date",
+        rate_column: str = "rate",
+        delimiter: str = ",",
+    ) -> None:
+        self.__file_path = file_path
+        self.__currency_column = currency_column
+        self.__date_column = date_column
+        self.__rate_column = rate_column
+        self.__delimiter = delimiter
+
+    def load(self) -> Iterable[RateRow]:
+        with open(self.__file_path, newline="") as file:
+            for row in csv.DictReader(file, delimiter=self.__delimiter):
+                yield (
+                    row[self.__currency_column],
+                    row[self.__date_column],
+                    float(row[self.__rate_column]),
+                )
+
+
+class DatabaseCurrencyRateLoader(CurrencyRateLoader):
+
+    def __init__(
+        self,
+        model: Any,
+        currency_field: str = "currency",
+        date_field: str = "date",
+        rate_field: str = "rate",
+    ) -> None:
+        self.__model = model
+        self.__currency_field = currency_field
+        self.__date_field = date_field
+        self.__rate_field = rate_field
+
+    def load(self) -> Iterable[RateRow]:
+        queryset = self.__model._default_manager.values_list(
+            self.__currency_field, self.__date_field, self.__rate_field
+        )
+        for currency, valid_from, rate in queryset.iterator():
+            yield currency, valid_from, float(rate)
+
+
+class CurrencyRateStore:
+
+    CACHE_SIZE: int = 4096
+
+    def __init__(self, loader: CurrencyRateLoader | None = None) -> None:
+        self.__loader = loader
+        self.__timestamps: dict[str, array] = {}
+        self.__rates: dict[str, array] = {}
+        self.__cache = LRUCache(self.CACHE_SIZE)
+        if loader is not None:
+            self.refresh()
+
+    @property
+    def currencies(self) -> list[str]:
+        return list(self.__timestamps)
+
+    @property
+    def cache_statistics(self) -> CacheStatistics:
+        return self.__cache.statistics
+
+    def refresh(self) -> None:
+        if self.__loader is None:
+            raise ValueError("CurrencyRateStore has no loader to refresh from")
+        self.load(self.__loader.load())
+
+    def load(self, rows: Iterable[RateRow]) -> None:
+        collected: dict[str, list[tuple[float, float]]] = {}
+        for currency, valid_from, rate in rows:
+            collected.setdefault(currency, []).append(
+                (toTimestamp(valid_from), float(rate))
+            )
+        timestamps = {}
+        rates = {}
+        for currency, entries in collected.items():
+            entries.sort()
+            timestamps[currency] = array("d", (entry[0] for entry in entries))
+            rates[currency] = array("d", (entry[1] for entry in entries))
+        self.__timestamps = timestamps
+        self.__rates = rates
+        self.__cache.clear()
+        from DataBucket.src.units.currency_unit import CurrencyUnit
+
+        if CurrencyUnit.RATE_STORE is self:
+            CurrencyUnit.refreshFactors()
+
+    def rate_at(self, unit: CurrencyUnit | str, at: datetime | date | str) -> float:
+        currency = self.__getCurrency(unit)
+        timestamp = toTimestamp(at)
+        return self.__cache.getOrCompute(
+            (currency, timestamp), lambda: self.__lookup(currency, timestamp, at)
+        )
+
+    def rates_at(
+        self, unit: CurrencyUnit | str, dates: Iterable[datetime | date | str]
+    ) -> list[float]:
+        currency = self.__getCurrency(unit)
+        return [self.__lookup(currency, toTimestamp(at), at) for at in dates]
+
+    @staticmethod
+    def __getCurrency(unit: CurrencyUnit | str) -> str:
+        return unit if isinstance(unit, str) else unit.symbol
+
+    def __lookup(
+        self, currency: str, timestamp: float, at: datetime | date | str
+    ) -> float:
+        if currency not in self.__timestamps:
+            raise KeyError(f"No rates found for currency {currency}")
+        index = bisect_right(self.__timestamps[currency], timestamp) - 1
+        if index < 0:
+            raise KeyError(f"No rate for currency {currency} at {at}")
+        return self.__rates[currency][index]
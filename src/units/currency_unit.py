@@ -1,5 +1,6 @@
 from __future__ import annotations
-from DataBucket.src.units.unit import Unit
+from DataBucket.src.units.unit import Unit, CombinedUnit
+from DataBucket.src.units.currency_rate_store import CurrencyRateStore
 from datetime import datetime, timezone
 from typing import Callable
 
@@ -16,6 +17,7 @@ def getCurrentUnitFactorFunction(lamda_function: Callable | None = None) -> Call
 class CurrencyUnit(Unit):
 
     date: Callable = lambda: datetime.now(tz=timezone.utc)
+    RATE_STORE: CurrencyRateStore | None = None
 
     @classmethod
     def initialize_class(cls):
@@ -30,6 +32,20 @@ class CurrencyUnit(Unit):
         cls.SEK = cls("Swedish Krona", "SEK")
         cls.NZD = cls("New Zealand Dollar", "NZD")
 
+        cls.refreshFactors()
+
+    @classmethod
+    def setRateStore(cls, rate_store: CurrencyRateStore | None) -> None:
+        previous_rate_store = cls.RATE_STORE
+        cls.RATE_STORE = rate_store
+        try:
+            cls.refreshFactors()
+        except ValueError:
+            cls.RATE_STORE = previous_rate_store
+            raise
+
+    @classmethod
+    def refreshFactors(cls) -> None:
         cls.FACTOR_DICT = {
             cls.USD: cls.__getCurrentFactor(cls.USD),
             cls.EUR: cls.__getCurrentFactor(cls.EUR),
@@ -44,6 +60,20 @@ class CurrencyUnit(Unit):
         }
 
         cls.DB_BASE_UNIT = cls.USD
+        cls.buildFactorMatrix()
+        CombinedUnit.clearOperationCache()
+
+    def convert(
+        self, to_unit: Unit, date: datetime | None = None
+    ) -> tuple[float, Unit]:
+        if date is None or self.RATE_STORE is None:
+            return super().convert(to_unit)
+        if self.__class__ is not to_unit.__class__:
+            raise TypeError("Units must be of the same type")
+        factor = self.RATE_STORE.rate_at(self, date) / self.RATE_STORE.rate_at(
+            to_unit, date
+        )
+        return factor, to_unit
 
     @classmethod
     def __getCurrentFactor(cls, unit: CurrencyUnit) -> float:
@@ -59,10 +89,16 @@ class CurrencyUnit(Unit):
             CurrencyUnit.SEK: 0.12,
             CurrencyUnit.NZD: 0.72,
         }
+        rate_function = cls.RATE_STORE.rate_at if cls.RATE_STORE else None
+        date = cls.date()
         try:
-            return getCurrentUnitFactorFunction()(unit, cls.date())
+            return getCurrentUnitFactorFunction(rate_function)(unit, date)
         except NotImplementedError:
             return default_factor_dict[unit]
+        except KeyError:
+            raise ValueError(
+                f"CurrencyRateStore has no rate for {unit.symbol} at {date.isoformat()}"
+            )
 
 
 CurrencyUnit.initialize_class()
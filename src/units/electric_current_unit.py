@@ -22,6 +22,7 @@ class ElectricCurrentUnit(Unit):
         }
 
         cls.DB_BASE_UNIT = cls.AMPERE
+        cls.buildFactorMatrix()
 
 
 ElectricCurrentUnit.initialize_class()
@@ -28,6 +28,7 @@ class LengthUnit(Unit):
         }
 
         cls.DB_BASE_UNIT = cls.MILLIMETER
+        cls.buildFactorMatrix()
 
 
 LengthUnit.initialize_class()
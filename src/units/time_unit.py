@@ -30,6 +30,7 @@ class TimeUnit(Unit):
         }
 
         cls.DB_BASE_UNIT = cls.SECOND
+        cls.buildFactorMatrix()
 
 
 TimeUnit.initialize_class()
@@ -1,8 +1,31 @@
 from __future__ import annotations
 
+from DataBucket.src.auxiliary.lru_cache import CacheStatistics, LRUCache
+from datetime import datetime
+from fractions import Fraction
+from typing import Callable, Hashable, Iterable
+import weakref
+
+
+class UnitSignature:
+
+    __slots__ = ("units", "__weakref__")
+
+    def __init__(self, units: tuple[tuple[Unit, int], ...]) -> None:
+        self.units = units
+
+    def __repr__(self) -> str:
+        return f"UnitSignature({self.units})"
+
 
 class CombinedUnit:
 
+    OPERATION_CACHE_SIZE: int = 1024
+    __OPERATION_CACHE = LRUCache(OPERATION_CACHE_SIZE)
+    __SIGNATURES: weakref.WeakValueDictionary[
+        tuple[tuple[Unit, int], ...], UnitSignature
+    ] = weakref.WeakValueDictionary()
+
     def __init__(
         self,
         numerator: list[Unit] = [],
@@ -22,38 +45,107 @@ class CombinedUnit:
             self.__total_factor /= factor
             self.__denominator.append(unit)
 
+        self.__signature = self.__internSignature(self.__numerator, self.__denominator)
+
+    @classmethod
+    def configureOperationCache(cls, max_size: int) -> None:
+        cls.__OPERATION_CACHE.resize(max_size)
+        cls.OPERATION_CACHE_SIZE = max_size
+
+    @classmethod
+    def getOperationCacheStatistics(cls) -> CacheStatistics:
+        return cls.__OPERATION_CACHE.statistics
+
+    @classmethod
+    def clearOperationCache(cls) -> None:
+        cls.__OPERATION_CACHE.clear()
+        cls.__OPERATION_CACHE.resetStatistics()
+
+    @classmethod
+    def getSignatureCount(cls) -> int:
+        return len(cls.__SIGNATURES)
+
+    @classmethod
+    def cachedOperation(
+        cls,
+        operation: str,
+        unit: Unit | CombinedUnit,
+        other: Unit | CombinedUnit,
+        compute: Callable[[], CombinedUnit],
+    ) -> CombinedUnit:
+        key = (operation, cls.__getCacheKey(unit), cls.__getCacheKey(other))
+        return cls.__OPERATION_CACHE.getOrCompute(key, compute)
+
+    @staticmethod
+    def __getCacheKey(unit: Unit | CombinedUnit) -> Hashable:
+        if isinstance(unit, CombinedUnit):
+            return unit.__signature, unit.__total_factor
+        return unit
+
+    @classmethod
+    def __internSignature(
+        cls, numerator: list[Unit], denominator: list[Unit]
+    ) -> UnitSignature:
+        exponents: dict[Unit, int] = {}
+        for unit in numerator:
+            exponents[unit] = exponents.get(unit, 0) + 1
+        for unit in denominator:
+            exponents[unit] = exponents.get(unit, 0) - 1
+        signature = tuple(
+            sorted(
+                ((unit, exponent) for unit, exponent in exponents.items() if exponent),
+                key=lambda item: (item[0].__class__.__name__, item[0].name),
+            )
+        )
+        interned = cls.__SIGNATURES.get(signature)
+        if interned is None:
+            interned = cls.__SIGNATURES.setdefault(signature, UnitSignature(signature))
+        return interned
+
     def __str__(self) -> str:
         def formatUnitList(unit_list: list[Unit]) -> str:
-            str_unit_list = [str(unit) for unit in unit_list]
-            new_unit_list = []
-            unit_set = set(str_unit_list)
-            for unit in unit_set:
-                if str_unit_list.count(unit) > 1:
-                    new_unit_list.append(f"{unit}^{str_unit_list.count(unit)}")
-                else:
-                    new_unit_list.append(unit)
-            unit_text = " * ".join(new_unit_list)
+            unit_counts: dict[str, int] = {}
+            for unit in unit_list:
+                unit_text = str(unit)
+                unit_counts[unit_text] = unit_counts.get(unit_text, 0) + 1
+            unit_text = " * ".join(
+                f"{unit}^{count}" if count > 1 else unit
+                for unit, count in unit_counts.items()
+            )
             if unit_text == "":
                 unit_text = "1"
             return unit_text
 
-        return f"{formatUnitList(self.numerator)}{"/" + formatUnitList(self.denominator) if self.denominator else ''}"
+        denominator_text = (
+            "/" + formatUnitList(self.denominator) if self.denominator else ""
+        )
+        return f"{formatUnitList(self.numerator)}{denominator_text}"
 
     def __repr__(self) -> str:
         return f"{self.numerator}/{self.denominator}"
 
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.numerator, self.denominator, self.total_factor)
+
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, CombinedUnit):
             return False
-        return str(self) == str(value)
+        return self.__signature is value.__signature
+
+    def __hash__(self) -> int:
+        return id(self.__signature)
+
+    @property
+    def signature(self) -> tuple[tuple[Unit, int], ...]:
+        return self.__signature.units
 
     @property
     def numerator(self) -> list[Unit]:
-        return self.__numerator
+        return list(self.__numerator)
 
     @property
     def denominator(self) -> list[Unit]:
-        return self.__denominator
+        return list(self.__denominator)
 
     @property
     def total_factor(self) -> float:
@@ -101,7 +193,7 @@ class CombinedUnit:
         factor, denominator, numerator = self.__adjustUnits(unit, "denominator")
         return CombinedUnit(numerator, denominator, self.total_factor / factor)
 
-    def __truediv__(self, other: Unit | CombinedUnit) -> CombinedUnit:
+    def _divide(self, other: Unit | CombinedUnit) -> CombinedUnit:
         if isinstance(other, Unit):
             return self.__addDenominator(other)
         elif isinstance(other, CombinedUnit):
@@ -112,7 +204,7 @@ class CombinedUnit:
 
             return self
 
-    def __mul__(self, other: Unit | CombinedUnit) -> CombinedUnit:
+    def _multiply(self, other: Unit | CombinedUnit) -> CombinedUnit:
         if isinstance(other, Unit):
             return self.__addNumerator(other)
         elif isinstance(other, CombinedUnit):
@@ -122,6 +214,14 @@ class CombinedUnit:
                 self = self.__addDenominator(unit)
             return self
 
+    def __truediv__(self, other: Unit | CombinedUnit) -> CombinedUnit:
+        return self.cachedOperation(
+            "truediv", self, other, lambda: self._divide(other)
+        )
+
+    def __mul__(self, other: Unit | CombinedUnit) -> CombinedUnit:
+        return self.cachedOperation("mul", self, other, lambda: self._multiply(other))
+
     def __rtruediv__(self, other: Unit) -> CombinedUnit:
         return CombinedUnit([other]) / self
     
@@ -134,13 +234,24 @@ class CombinedUnit:
     def __mod__(self, other: Unit | CombinedUnit) -> CombinedUnit:
         return self.__truediv__(other)
 
-    def convert(self, to_unit: Unit | CombinedUnit) -> CombinedUnit:
+    def convert(
+        self, to_unit: Unit | CombinedUnit, date: datetime | None = None
+    ) -> CombinedUnit:
+        if date is not None:
+            return self.__convert(to_unit, date)
+        return self.cachedOperation(
+            "convert", self, to_unit, lambda: self.__convert(to_unit)
+        )
+
+    def __convert(
+        self, to_unit: Unit | CombinedUnit, date: datetime | None = None
+    ) -> CombinedUnit:
         def adjustUnits(units: list[Unit], to_unit: Unit) -> tuple[list[Unit], float]:
             new_units = []
             adjust_factor = 1
             for unit in units:
                 try:
-                    new_factor, new_unit = unit.convert(to_unit)
+                    new_factor, new_unit = unit.convert(to_unit, date)
                     adjust_factor *= new_factor
                     new_units.append(new_unit)
                 except TypeError:
@@ -165,10 +276,37 @@ class CombinedUnit:
 
 class Unit:
     FACTOR_DICT: dict[Unit, float]
+    FACTOR_MATRIX: tuple[tuple[float, ...], ...]
+    EXACT_FACTOR_MATRIX: tuple[tuple[Fraction, ...], ...] | None = None
+    UNITS: tuple[Unit, ...]
 
     def __init__(self, name: str, symbol: str):
         self.__name = name
         self.__symbol = symbol
+        self.__index: int | None = None
+
+    @classmethod
+    def buildFactorMatrix(cls) -> None:
+        cls.UNITS = tuple(cls.FACTOR_DICT)
+        for index, unit in enumerate(cls.UNITS):
+            unit.__index = index
+        cls.FACTOR_MATRIX = tuple(
+            tuple(
+                cls.FACTOR_DICT[from_unit] / cls.FACTOR_DICT[to_unit]
+                for to_unit in cls.UNITS
+            )
+            for from_unit in cls.UNITS
+        )
+        cls.EXACT_FACTOR_MATRIX = None
+
+    @classmethod
+    def __buildExactFactorMatrix(cls) -> tuple[tuple[Fraction, ...], ...]:
+        exact_factors = [Fraction(str(cls.FACTOR_DICT[unit])) for unit in cls.UNITS]
+        cls.EXACT_FACTOR_MATRIX = tuple(
+            tuple(from_factor / to_factor for to_factor in exact_factors)
+            for from_factor in exact_factors
+        )
+        return cls.EXACT_FACTOR_MATRIX
 
     def __str__(self):
         return f"{self.symbol}"
@@ -186,6 +324,16 @@ class Unit:
     def __hash__(self):
         return hash(self.name)
 
+    def __reduce__(self) -> tuple:
+        return self.__class__.getUnitByName, (self.name,)
+
+    @classmethod
+    def getUnitByName(cls, name: str) -> Unit:
+        for unit in cls.UNITS:
+            if unit.name == name:
+                return unit
+        raise ValueError(f"{cls.__name__} has no unit named {name}")
+
     @property
     def name(self) -> str:
         return self.__name
@@ -197,16 +345,44 @@ class Unit:
     @property
     def is_none(self) -> bool:
         return False
-    
+
+    @property
+    def index(self) -> int | None:
+        return self.__index
+
     def convert(
-        self, to_unit: Unit
+        self, to_unit: Unit, date: datetime | None = None
     ) -> tuple[float, Unit]:
-        if self.__class__ != to_unit.__class__:
+        if self.__class__ is not to_unit.__class__:
             raise TypeError("Units must be of the same type")
-        return self.FACTOR_DICT[self] / self.FACTOR_DICT[to_unit], to_unit
+        return self.FACTOR_MATRIX[self.__index][to_unit.__index], to_unit
+
+    def convertExact(self, to_unit: Unit) -> tuple[Fraction, Unit]:
+        if self.__class__ is not to_unit.__class__:
+            raise TypeError("Units must be of the same type")
+        exact_factor_matrix = self.EXACT_FACTOR_MATRIX
+        if exact_factor_matrix is None:
+            exact_factor_matrix = self.__class__.__buildExactFactorMatrix()
+        return exact_factor_matrix[self.__index][to_unit.__index], to_unit
+
+    @classmethod
+    def convertMany(cls, units: Iterable[Unit], to_unit: Unit) -> list[float]:
+        if to_unit.__class__ is not cls:
+            raise TypeError("Units must be of the same type")
+        to_index = to_unit.__index
+        factors = []
+        for unit in units:
+            if unit.__class__ is not cls:
+                raise TypeError("Units must be of the same type")
+            factors.append(cls.FACTOR_MATRIX[unit.__index][to_index])
+        return factors
 
     def __truediv__(self, other: Unit | CombinedUnit) -> CombinedUnit:
-        return CombinedUnit([self]) / other
-    
+        return CombinedUnit.cachedOperation(
+            "truediv", self, other, lambda: CombinedUnit([self])._divide(other)
+        )
+
     def __mul__(self, other: Unit | CombinedUnit) -> CombinedUnit:
-        return CombinedUnit([self]) * other
+        return CombinedUnit.cachedOperation(
+            "mul", self, other, lambda: CombinedUnit([self])._multiply(other)
+        )
@@ -22,6 +22,7 @@ class WeightUnit(Unit):
         }
 
         cls.DB_BASE_UNIT = cls.KILOGRAM
+        cls.buildFactorMatrix()
 
 
 WeightUnit.initialize_class()
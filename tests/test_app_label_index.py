@@ -0,0 +1,31 @@
+from DataBucket.src.database.app_label_index import AppLabelIndex
+
+from django.apps import apps
+from django.test import SimpleTestCase
+import os
+
+
+class TestAppLabelIndex(SimpleTestCase):
+    def setUp(self):
+        self.app_path = os.path.abspath(apps.get_app_config("DataBucket").path)
+
+    def test_resolves_nested_module(self):
+        file_path = os.path.join(self.app_path, "src", "database", "models.py")
+        self.assertEqual(AppLabelIndex.getAppLabel(file_path), "DataBucket")
+
+    def test_ignores_sibling_directory(self):
+        file_path = os.path.join(f"{self.app_path}_sibling", "models.py")
+        self.assertIsNone(AppLabelIndex.getAppLabel(file_path))
+
+    def test_longest_prefix_wins(self):
+        nested_path = os.path.join(self.app_path, "contrib", "nested")
+        auth_config = apps.get_app_config("auth")
+        original_path = auth_config.path
+        auth_config.path = nested_path
+        AppLabelIndex.clear()
+        try:
+            file_path = os.path.join(nested_path, "models.py")
+            self.assertEqual(AppLabelIndex.getAppLabel(file_path), "auth")
+        finally:
+            auth_config.path = original_path
+            AppLabelIndex.clear()
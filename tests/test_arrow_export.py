@@ -0,0 +1,114 @@
+from DataBucket.src.auxiliary.value import NumberValue
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.arrow_export import ArrowExporter
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import (
+    DataBucketConnection,
+    Number,
+    String,
+    dbField,
+)
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+import io
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class ExportWarehouse(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+
+
+class ExportPallet(DataBucket):
+
+    class DataInterface(Database):
+        label = String(max_length=100, is_required=True, is_changeable=False)
+        weight = Number(decimal_places=2, unit=WeightUnit.TON)
+        warehouse = DataBucketConnection(
+            DataBucket="ExportWarehouse",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+        stored_in = DataBucketConnection(
+            DataBucket="ExportWarehouse",
+            type="ManyToMany",
+            on_delete=dbField.DO_NOTHING,
+        )
+
+
+class TestArrowExport(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        self.warehouses = ExportWarehouse.objects.bulk_create(
+            [{"name": "north"}, {"name": "south"}], creator=self.user
+        )
+        self.pallets = ExportPallet.objects.bulk_create(
+            [
+                {
+                    "label": f"pallet {index}",
+                    "weight": NumberValue(index * 250, WeightUnit.KILOGRAM),
+                    "warehouse": self.warehouses[index % 2],
+                    "stored_in": [warehouse.id for warehouse in self.warehouses],
+                }
+                for index in range(5)
+            ],
+            creator=self.user,
+        )
+        ExportPallet.objects.update(
+            self.pallets[0].id, {"weight": 3}, creator=self.user
+        )
+        ExportPallet.objects.delete(self.pallets[4].id)
+
+    def test_schema_metadata(self):
+        schema = ArrowExporter(ExportPallet.DataInterface).schema
+        self.assertEqual(
+            schema.names, ["id", "label", "weight", "warehouse", "stored_in"]
+        )
+        self.assertEqual(schema.field("weight").type, pa.decimal128(24, 2))
+        self.assertEqual(schema.field("stored_in").type, pa.list_(pa.int64()))
+        metadata = schema.field("weight").metadata
+        self.assertEqual(metadata[b"unit"], WeightUnit.TON.name.encode())
+        self.assertEqual(metadata[b"decimal_places"], b"2")
+        self.assertEqual(schema.metadata[b"data_bucket"], b"DataBucket.ExportPallet")
+
+    def test_batches_follow_current_versions(self):
+        with self.assertNumQueries(3):
+            batches = list(
+                ExportPallet.objects.all()
+                .order_by("label")
+                .toArrowBatches(chunk_size=2)
+            )
+        self.assertEqual([batch.num_rows for batch in batches], [2, 2])
+        table = pa.Table.from_batches(batches)
+        self.assertEqual(
+            table.column("label").to_pylist(),
+            ["pallet 0", "pallet 1", "pallet 2", "pallet 3"],
+        )
+        self.assertEqual(
+            table.column("weight").to_pylist(),
+            [Decimal("3.00"), Decimal("0.25"), Decimal("0.50"), Decimal("0.75")],
+        )
+        self.assertEqual(
+            table.column("warehouse").to_pylist()[:2],
+            [self.warehouses[0].id, self.warehouses[1].id],
+        )
+        self.assertEqual(
+            table.column("stored_in").to_pylist()[0],
+            [warehouse.id for warehouse in self.warehouses],
+        )
+
+    def test_parquet_round_trip(self):
+        buffer = io.BytesIO()
+        written = ExportPallet.objects.filter({"weight__gte": 0.5}).toParquet(buffer)
+        self.assertEqual(written, 3)
+        table = pq.read_table(io.BytesIO(buffer.getvalue()))
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(
+            table.schema.field("weight").metadata[b"unit"],
+            WeightUnit.TON.name.encode(),
+        )
@@ -0,0 +1,86 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import Number, String
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from asgiref.sync import sync_to_async
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+import asyncio
+
+
+class AsyncCrate(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True, is_changeable=False)
+        weight = Number(decimal_places=2, unit=WeightUnit.KILOGRAM, default=0)
+
+
+class CachedAsyncCrate(DataBucket):
+
+    cache_invalidation = {"interval": 60, "on_change": True}
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+
+
+class TestAsyncInterface(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+
+    async def test_crud(self):
+        crates = await AsyncCrate.objects.abulk_create(
+            [{"name": f"crate {index}", "weight": index} for index in range(4)],
+            creator=self.user,
+        )
+        created = await AsyncCrate.objects.acreate(
+            {"name": "extra", "weight": 9}, creator=self.user
+        )
+        updated = await AsyncCrate.objects.aupdate(
+            crates[0].id, {"weight": 7}, creator=self.user
+        )
+        self.assertEqual(updated.weight.value, Decimal("7.00"))
+        await AsyncCrate.objects.adelete(crates[1].id)
+
+        records = await AsyncCrate.objects.aall()
+        self.assertEqual(
+            sorted(record.id for record in records),
+            sorted([crates[0].id, crates[2].id, crates[3].id, created.id]),
+        )
+        heavy = await AsyncCrate.objects.afilter({"weight__gte": 3})
+        self.assertEqual(
+            sorted(record.name.value for record in heavy),
+            ["crate 0", "crate 3", "extra"],
+        )
+        record = await AsyncCrate.objects.aget({"name": "crate 0"})
+        self.assertEqual(record.weight.value, Decimal("7.00"))
+        self.assertIsNone(await AsyncCrate.objects.aget({"name": "crate 1"}))
+
+    async def test_querryset_iteration(self):
+        await AsyncCrate.objects.abulk_create(
+            [{"name": f"crate {index}", "weight": index} for index in range(5)],
+            creator=self.user,
+        )
+        querryset = AsyncCrate.objects.filter({"weight__lt": 3}).order_by("-weight")
+        names = [record.name.value async for record in querryset]
+        self.assertEqual(names, ["crate 2", "crate 1", "crate 0"])
+        count, exists, first = await asyncio.gather(
+            querryset.acount(), querryset.aexists(), querryset.afirst()
+        )
+        self.assertEqual((count, exists, first.name.value), (3, True, "crate 2"))
+        self.assertEqual((await querryset.alast()).name.value, "crate 0")
+
+    async def test_cached_get(self):
+        await CachedAsyncCrate.objects.acreate({"name": "cached"}, creator=self.user)
+        statistics = CachedAsyncCrate.DataInterface.cache.statistics
+        await CachedAsyncCrate.objects.aget({"name": "cached"})
+        record = await CachedAsyncCrate.objects.aget({"name": "cached"})
+        self.assertEqual(record.name.value, "cached")
+        self.assertEqual(
+            CachedAsyncCrate.DataInterface.cache.statistics.hits, statistics.hits + 1
+        )
+        self.assertEqual(
+            await sync_to_async(CachedAsyncCrate.objects.get)({"name": "cached"}),
+            record,
+        )
@@ -0,0 +1,195 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.bucket_cache import (
+    BucketCache,
+    FileRefetchSource,
+    HTTPRefetchSource,
+    getRefetchSource,
+)
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import Number, String
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import os
+import tempfile
+import threading
+
+
+class CachedProject(DataBucket):
+
+    cache_invalidation = {"interval": 60, "on_change": True}
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_unique=True, is_required=True)
+        budget = Number(decimal_places=2, unit=WeightUnit.KILOGRAM, default=0)
+
+
+class OtherProject(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_unique=True, is_required=True)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBucketCache(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        CachedProject.DataInterface.cache.invalidate()
+
+    def test_hit_miss_and_expiry(self):
+        clock = FakeClock()
+        cache = BucketCache(CachedProject.DataInterface, interval=10, clock=clock)
+        calls = []
+        fetch = lambda: calls.append(1) or len(calls)
+
+        self.assertEqual(cache.getOrFetch("key", fetch), 1)
+        self.assertEqual(cache.getOrFetch("key", fetch), 1)
+        clock.now = 10
+        self.assertEqual(cache.getOrFetch("key", fetch), 2)
+        statistics = cache.statistics
+        self.assertEqual((statistics.hits, statistics.misses), (1, 2))
+
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BucketCache(
+                CachedProject.DataInterface,
+                interval=10,
+                max_size=1,
+                spill_directory=directory,
+            )
+            cache.set("first", [1, 2])
+            cache.set("second", [3])
+            self.assertEqual(cache.statistics.evictions, 1)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            self.assertEqual(cache.get("first"), [1, 2])
+            cache.invalidate()
+            self.assertEqual(os.listdir(directory), [])
+            self.assertIsNone(cache.get("first"))
+
+    def test_spill_files_are_namespaced(self):
+        with tempfile.TemporaryDirectory() as directory:
+            caches = [
+                BucketCache(
+                    data_interface,
+                    interval=10,
+                    max_size=1,
+                    spill_directory=directory,
+                )
+                for data_interface in (
+                    CachedProject.DataInterface,
+                    OtherProject.DataInterface,
+                )
+            ]
+            for cache in caches:
+                cache.set("first", [1])
+                cache.set("second", [2])
+            self.assertEqual(len(os.listdir(directory)), 2)
+            caches[0].invalidate()
+            self.assertIsNone(caches[0].get("first"))
+            self.assertEqual(caches[1].get("first"), [1])
+
+    def test_refetch_configuration(self):
+        with self.assertRaises(ValueError):
+            BucketCache.fromConfiguration(
+                CachedProject.DataInterface,
+                {"interval": 10, "refetch_url": "https://www.example.com/"},
+            )
+        clock = FakeClock()
+        cache = BucketCache(
+            CachedProject.DataInterface,
+            interval=10,
+            refetch_source=getRefetchSource("https://www.example.com/"),
+            creator=self.user,
+            clock=clock,
+        )
+        self.assertFalse(cache.delete_missing)
+        self.assertFalse(cache.refresh_due)
+        clock.now = 10
+        self.assertTrue(cache.refresh_due)
+
+    def test_read_through_and_invalidation_on_write(self):
+        CachedProject.objects.create({"name": "alpha"}, creator=self.user)
+        self.assertEqual(len(CachedProject.objects.all()), 1)
+        project = CachedProject.objects.get({"name": "alpha"})
+        with self.assertNumQueries(0):
+            self.assertEqual(len(CachedProject.objects.all()), 1)
+            self.assertIs(CachedProject.objects.get({"name": "alpha"}), project)
+
+        CachedProject.objects.create({"name": "beta"}, creator=self.user)
+        self.assertEqual(len(CachedProject.objects.all()), 2)
+
+    def test_refresh_from_file_source(self):
+        project = CachedProject.objects.create(
+            {"name": "alpha", "budget": 1}, creator=self.user
+        )
+        CachedProject.objects.create({"name": "gone"}, creator=self.user)
+        rows = [{"name": "alpha", "budget": 2}, {"name": "new", "budget": 3}]
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as file:
+            json.dump(rows, file)
+        try:
+            cache = BucketCache(
+                CachedProject.DataInterface,
+                interval=10,
+                refetch_source=getRefetchSource(file.name),
+                creator=self.user,
+                delete_missing=True,
+            )
+            self.assertIsInstance(cache.refetch_source, FileRefetchSource)
+            result = cache.refresh()
+        finally:
+            os.remove(file.name)
+
+        self.assertEqual(result, {"created": 1, "updated": 1, "deleted": 1})
+        names = sorted(record.name.value for record in CachedProject.objects.all())
+        self.assertEqual(names, ["alpha", "new"])
+        self.assertEqual(
+            CachedProject.objects.get({"id": project.id}).budget.value, Decimal("2.00")
+        )
+
+    def test_synchronize_keeps_missing_rows_by_default(self):
+        CachedProject.objects.create({"name": "local"}, creator=self.user)
+        rows = [{"name": "remote"}]
+        result = CachedProject.objects.synchronize(rows, creator=self.user)
+        self.assertEqual(result, {"created": 1, "updated": 0, "deleted": 0})
+        result = CachedProject.objects.synchronize(
+            rows, creator=self.user, delete_missing=True
+        )
+        self.assertEqual(result, {"created": 0, "updated": 0, "deleted": 1})
+        names = [record.name.value for record in CachedProject.objects.all()]
+        self.assertEqual(names, ["remote"])
+
+    def test_http_source(self):
+        rows = [{"name": "remote"}]
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(rows).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            source = getRefetchSource(f"http://127.0.0.1:{server.server_port}/")
+            self.assertIsInstance(source, HTTPRefetchSource)
+            self.assertEqual(source.fetch(), rows)
+        finally:
+            server.shutdown()
+            server.server_close()
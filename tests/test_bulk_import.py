@@ -0,0 +1,133 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.bulk_import import BulkImporter, ChunkPreparer
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import Number, String
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+import io
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class ImportedShipment(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=10, is_required=True, is_changeable=False)
+        weight = Number(decimal_places=2, unit=WeightUnit.TON, is_required=True)
+        note = String(max_length=100)
+        pieces = Number(decimal_places=0, unit=None)
+
+
+class TestBulkImport(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+
+    def getWeights(self) -> dict[str, Decimal]:
+        return {
+            record.name.value: record.weight.value
+            for record in ImportedShipment.objects.all()
+        }
+
+    def test_csv_with_unit_column(self):
+        source = io.StringIO(
+            "name,weight,weight_unit,note\n"
+            "a,2000,lb,\n"
+            "b,1500,kg,fragile\n"
+            "c,2,t,\n"
+            "d,3,,\n"
+        )
+        report = BulkImporter(
+            ImportedShipment.DataInterface, chunk_size=2, creator=self.user
+        ).importCsv(source)
+        self.assertEqual((report.rows_read, report.rows_imported), (4, 4))
+        self.assertEqual(report.errors, [])
+        self.assertEqual(set(report.timings), {"read", "prepare", "insert", "total"})
+        self.assertGreater(report.rows_per_second, 0)
+        self.assertEqual(
+            self.getWeights(),
+            {
+                "a": Decimal("0.91"),
+                "b": Decimal("1.50"),
+                "c": Decimal("2.00"),
+                "d": Decimal("3.00"),
+            },
+        )
+        self.assertEqual(
+            ImportedShipment.objects.get({"name": "b"}).note.value, "fragile"
+        )
+
+    def test_validation_errors(self):
+        source = io.StringIO(
+            "name,weight[kg]\n"
+            "ok,10\n"
+            "much too long,10\n"
+            "empty,\n"
+            "precise,1.234\n"
+            "text,heavy\n"
+        )
+        importer = BulkImporter(ImportedShipment.DataInterface, creator=self.user)
+        report = importer.importCsv(source)
+        self.assertEqual(report.rows_imported, 1)
+        self.assertEqual(
+            [(error.row_number, error.field_name) for error in report.errors],
+            [(2, "name"), (3, "weight"), (4, "weight"), (5, "weight")],
+        )
+        self.assertEqual(self.getWeights(), {"ok": Decimal("0.01")})
+
+        strict = BulkImporter(
+            ImportedShipment.DataInterface, skip_invalid=False, creator=self.user
+        )
+        with self.assertRaises(ValueError):
+            strict.importCsv(io.StringIO("name,weight\nnew,1\nempty,\n"))
+        self.assertFalse(ImportedShipment.objects.filter({"name": "new"}).exists())
+        with self.assertRaises(ValueError):
+            importer.importCsv(io.StringIO("name,weight,unknown\nx,1,2\n"))
+        with self.assertRaises(ValueError):
+            importer.importCsv(io.StringIO("name,weight[m]\nx,1\n"))
+
+    def test_parquet_in_process_pool(self):
+        table = pa.table(
+            {
+                "name": [f"row {index}" for index in range(20)],
+                "weight": [float(index) for index in range(20)],
+                "weight_unit": ["kg" if index % 2 else "t" for index in range(20)],
+            }
+        )
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer)
+        buffer.seek(0)
+        report = BulkImporter(
+            ImportedShipment.DataInterface,
+            chunk_size=6,
+            processes=2,
+            creator=self.user,
+        ).importParquet(buffer)
+        self.assertEqual(report.rows_imported, 20)
+        weights = self.getWeights()
+        self.assertEqual(weights["row 4"], Decimal("4.00"))
+        self.assertEqual(weights["row 7"], Decimal("0.01"))
+
+    def test_exact_conversion_and_overflow(self):
+        header = ["name", "weight", "weight_unit", "pieces"]
+        columns = BulkImporter(
+            ImportedShipment.DataInterface, creator=self.user
+        ).getColumns(header)
+        chunk = ChunkPreparer.prepare(
+            columns,
+            header,
+            [
+                ["exact", "123456789012.34", "lb", "1"],
+                ["many", "1", "t", "1000000000000000"],
+            ],
+            1,
+        )
+        self.assertEqual(
+            [(error.row_number, error.field_name) for error in chunk.errors],
+            [(2, "pieces")],
+        )
+        self.assertEqual(
+            [row["weight"] for row in chunk.rows], [Decimal("55999057520.697259846")]
+        )
@@ -0,0 +1,106 @@
+from DataBucket.src.auxiliary.number_array import NumberArray
+from DataBucket.src.auxiliary.value import NumberValue
+from DataBucket.src.units.currency_rate_store import (
+    CSVCurrencyRateLoader,
+    CurrencyRateStore,
+    StaticCurrencyRateLoader,
+)
+from DataBucket.src.units.currency_unit import CurrencyUnit
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from django.test import TestCase
+import os
+import tempfile
+
+
+class TestCurrencyRateStore(TestCase):
+    def setUp(self):
+        self.store = CurrencyRateStore(
+            StaticCurrencyRateLoader(
+                {
+                    "USD": {"2024-01-01": 1},
+                    "EUR": {"2024-01-01": 1.1, "2024-02-01": 1.2},
+                }
+            )
+        )
+
+    def tearDown(self):
+        CurrencyUnit.setRateStore(None)
+
+    def test_rate_at(self):
+        self.assertEqual(self.store.rate_at(CurrencyUnit.EUR, date(2024, 1, 15)), 1.1)
+        self.assertEqual(self.store.rate_at("EUR", date(2024, 2, 1)), 1.2)
+        self.assertEqual(
+            self.store.rate_at(
+                CurrencyUnit.EUR, datetime(2025, 1, 1, tzinfo=timezone.utc)
+            ),
+            1.2,
+        )
+        with self.assertRaises(KeyError):
+            self.store.rate_at(CurrencyUnit.EUR, date(2023, 12, 31))
+        with self.assertRaises(KeyError):
+            self.store.rate_at(CurrencyUnit.GBP, date(2024, 1, 1))
+
+        self.store.rate_at(CurrencyUnit.EUR, date(2024, 1, 15))
+        self.assertEqual(self.store.cache_statistics.hits, 1)
+
+    def test_rates_at(self):
+        self.assertEqual(
+            self.store.rates_at(
+                CurrencyUnit.EUR, [date(2024, 3, 1), date(2024, 1, 2), "2024-02-01"]
+            ),
+            [1.2, 1.1, 1.2],
+        )
+
+    def test_csv_loader(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as file:
+            file.write("currency,date,rate\nEUR,2024-01-01,1.1\nEUR,2024-02-01,1.2\n")
+        try:
+            store = CurrencyRateStore(CSVCurrencyRateLoader(file.name))
+        finally:
+            os.remove(file.name)
+        self.assertEqual(store.rate_at("EUR", date(2024, 1, 31)), 1.1)
+
+    def loadAllCurrencies(self, eur_rates):
+        self.store.load(
+            [
+                (unit.symbol, "2024-01-01", 1)
+                for unit in CurrencyUnit.UNITS
+                if unit is not CurrencyUnit.EUR
+            ]
+            + [("EUR", valid_from, rate) for valid_from, rate in eur_rates.items()]
+        )
+
+    def test_missing_currency(self):
+        with self.assertRaises(ValueError):
+            CurrencyUnit.setRateStore(self.store)
+        self.assertIsNone(CurrencyUnit.RATE_STORE)
+
+    def test_refresh_updates_current_factors(self):
+        self.loadAllCurrencies({"2024-01-01": 1.1, "2024-02-01": 1.2})
+        CurrencyUnit.setRateStore(self.store)
+        value = NumberValue(100, CurrencyUnit.EUR, decimal_places=2)
+        self.assertEqual(value.convert(CurrencyUnit.USD).value, Decimal("120.00"))
+
+        self.loadAllCurrencies({"2024-01-01": 1.1, "2024-03-01": 1.3})
+        self.assertEqual(value.convert(CurrencyUnit.USD).value, Decimal("130.00"))
+        self.assertAlmostEqual(CurrencyUnit.EUR.convert(CurrencyUnit.USD)[0], 1.3)
+
+    def test_historical_conversion(self):
+        self.loadAllCurrencies({"2024-01-01": 1.1, "2024-02-01": 1.2})
+        CurrencyUnit.setRateStore(self.store)
+        value = NumberValue(100, CurrencyUnit.EUR, decimal_places=2)
+
+        self.assertEqual(
+            value.convert(CurrencyUnit.USD, date(2024, 1, 15)).value, Decimal("110.00")
+        )
+        self.assertEqual(
+            value.convert(CurrencyUnit.USD, date(2024, 2, 15)).value, Decimal("120.00")
+        )
+
+        values = NumberArray([100, 100], CurrencyUnit.EUR, decimal_places=2)
+        converted = values.convert(
+            CurrencyUnit.USD, [date(2024, 1, 15), date(2024, 2, 15)]
+        )
+        self.assertEqual(converted.values.tolist(), [110, 120])
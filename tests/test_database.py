@@ -0,0 +1,243 @@
+from DataBucket.src.auxiliary.value import FixedPointNumberValue, NumberValue
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import (
+    DataBucketConnection,
+    Number,
+    String,
+    dbField,
+)
+from DataBucket.src.units.currency_unit import CurrencyUnit
+from DataBucket.src.units.length_unit import LengthUnit
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+
+class Shipment(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True, is_changeable=False)
+        weight = Number(decimal_places=2, unit=WeightUnit.TON, default=0)
+        note = String(max_length=100)
+
+
+class TestDatabase(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        self.unchangeable_model, self.changeable_model = (
+            Shipment.DataInterface.model_tuple
+        )
+
+    def test_create(self):
+        shipment = Shipment.objects.create(
+            {"name": "first", "weight": NumberValue(1500, WeightUnit.KILOGRAM)},
+            creator=self.user,
+        )
+        self.assertEqual(shipment.name.value, "first")
+        self.assertEqual(shipment.weight.unit, WeightUnit.TON)
+        self.assertEqual(shipment.weight.value, Decimal("1.50"))
+        self.assertEqual(self.changeable_model.objects.get().weight, Decimal(1500))
+
+        with self.assertRaises(ValueError):
+            Shipment.objects.create({"weight": 1}, creator=self.user)
+        with self.assertRaises(ValueError):
+            Shipment.objects.create({"name": "x", "unknown": 1}, creator=self.user)
+
+    def test_bulk_create_query_count(self):
+        rows = [{"name": f"row {index}", "weight": index} for index in range(50)]
+        with self.assertNumQueries(4):
+            shipments = Shipment.objects.bulk_create(
+                rows, creator=self.user, batch_size=100
+            )
+        self.assertEqual(len(shipments), 50)
+        self.assertEqual(self.unchangeable_model.objects.count(), 50)
+        self.assertEqual(
+            sorted(
+                self.changeable_model.objects.values_list(
+                    "link_to_unchangeable_id", flat=True
+                )
+            ),
+            sorted(shipment.id for shipment in shipments),
+        )
+        self.assertEqual(shipments[3].weight.value, Decimal("3.00"))
+
+    def test_bulk_update(self):
+        shipments = Shipment.objects.bulk_create(
+            [{"name": "a", "weight": 1, "note": "keep"}, {"name": "b", "weight": 2}],
+            creator=self.user,
+        )
+        ids = [shipment.id for shipment in shipments]
+        with self.assertNumQueries(5):
+            updated = Shipment.objects.bulk_update(
+                ids, [{"weight": 3}, {"note": "new"}], creator=self.user
+            )
+
+        self.assertEqual(updated[0].weight.value, Decimal("3.00"))
+        self.assertEqual(updated[0].note.value, "keep")
+        self.assertEqual(updated[1].weight.value, Decimal("2.00"))
+        self.assertEqual(updated[1].note.value, "new")
+        self.assertEqual(self.changeable_model.objects.count(), 4)
+
+        with self.assertRaises(ValueError):
+            Shipment.objects.update(ids[0], {"name": "renamed"}, creator=self.user)
+
+    def test_current_version_resolution(self):
+        shipments = Shipment.objects.bulk_create(
+            [{"name": f"row {index}", "weight": index} for index in range(5)],
+            creator=self.user,
+        )
+        Shipment.objects.update(shipments[0].id, {"weight": 10}, creator=self.user)
+        Shipment.objects.update(shipments[0].id, {"weight": 20}, creator=self.user)
+        Shipment.objects.delete(shipments[1].id)
+
+        with self.assertNumQueries(1):
+            records = list(Shipment.objects.all())
+        self.assertEqual(len(records), 4)
+        weights = {record.id: record.weight.value for record in records}
+        self.assertEqual(weights[shipments[0].id], Decimal("20.00"))
+        self.assertNotIn(shipments[1].id, weights)
+
+        self.assertEqual(
+            Shipment.objects.get({"name": "row 0"}).weight.value, Decimal("20.00")
+        )
+        self.assertIsNone(Shipment.objects.get({"id": shipments[1].id}))
+        self.assertEqual(
+            Shipment.objects.filter({"name__in": ["row 0", "row 1", "row 2"]}).count(),
+            2,
+        )
+        self.assertEqual(Shipment.objects.exclude({"name": "row 2"}).count(), 3)
+
+    def test_lazy_querryset(self):
+        Shipment.objects.bulk_create(
+            [{"name": f"row {index}", "weight": index} for index in range(10)],
+            creator=self.user,
+        )
+        with self.assertNumQueries(0):
+            querryset = Shipment.objects.filter({"name__startswith": "row"}).order_by(
+                "-name"
+            )
+        with self.assertNumQueries(1):
+            page = list(querryset[2:5])
+        self.assertEqual(
+            [record.name.value for record in page], ["row 7", "row 6", "row 5"]
+        )
+        self.assertIn("LIMIT 3 OFFSET 2", str(querryset[2:5].queryset.query))
+
+        with self.assertNumQueries(1):
+            names = [record.name.value for record in querryset.iterator(chunk_size=3)]
+        self.assertEqual(len(names), 10)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(len(querryset), 10)
+            self.assertEqual(querryset[0].name.value, "row 9")
+
+    def test_unit_aware_filter(self):
+        Shipment.objects.bulk_create(
+            [{"name": f"row {index}", "weight": index} for index in range(5)],
+            creator=self.user,
+        )
+        querryset = Shipment.objects.filter(
+            {"weight__gt": NumberValue(2500, WeightUnit.KILOGRAM)}
+        )
+        self.assertIn("2500", str(querryset.queryset.query))
+        self.assertEqual(
+            sorted(record.name.value for record in querryset), ["row 3", "row 4"]
+        )
+        self.assertEqual(
+            Shipment.objects.exclude(
+                {"weight__range": (NumberValue(1, WeightUnit.TON), 3)}
+            ).count(),
+            2,
+        )
+        self.assertEqual(Shipment.objects.filter({"weight__lte": 1}).count(), 2)
+        with self.assertRaises(TypeError):
+            Shipment.objects.filter({"weight__gt": NumberValue(1, LengthUnit.METER)})
+
+    def test_aggregate(self):
+        Shipment.objects.bulk_create(
+            [{"name": f"row {index}", "weight": index} for index in range(1, 5)],
+            creator=self.user,
+        )
+        querryset = Shipment.objects.filter({"weight__gt": 1})
+        with self.assertNumQueries(1):
+            results = querryset.aggregate(sum="weight", avg="weight", max="weight")
+        self.assertEqual(results["weight__sum"].value, Decimal("9.00"))
+        self.assertEqual(results["weight__sum"].unit, WeightUnit.TON)
+        self.assertEqual(results["weight__avg"].value, Decimal("3.00"))
+        self.assertEqual(results["weight__max"].value, Decimal("4.00"))
+
+        results = querryset.aggregate(min="weight", to_unit=WeightUnit.KILOGRAM)
+        self.assertEqual(results["weight__min"].value, Decimal("2000.00"))
+        self.assertEqual(results["weight__min"].unit, WeightUnit.KILOGRAM)
+
+        self.assertIsNone(
+            Shipment.objects.filter({"name": "missing"}).aggregate(sum="weight")[
+                "weight__sum"
+            ]
+        )
+        with self.assertRaises(ValueError):
+            querryset.aggregate(sum="name")
+
+
+class AggregateCurrency(DataBucket):
+
+    class DataInterface(Database):
+        code = String(max_length=3, is_required=True, is_changeable=False)
+
+
+class AggregateInvoice(DataBucket):
+
+    class DataInterface(Database):
+        currency = DataBucketConnection(
+            DataBucket="AggregateCurrency",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+            unit_field="code",
+        )
+        amount = Number(decimal_places=2, unit=currency, default=0)
+
+
+class TestConnectedUnitAggregate(TestCase):
+    def test_skips_groups_without_known_unit(self):
+        user = get_user_model().objects.create(username="creator")
+        usd, unknown = AggregateCurrency.objects.bulk_create(
+            [{"code": "USD"}, {"code": "XXX"}], creator=user
+        )
+        AggregateInvoice.objects.bulk_create(
+            [
+                {"currency": usd, "amount": 10},
+                {"currency": usd, "amount": 5},
+                {"currency": unknown, "amount": 100},
+                {"amount": 1000},
+            ],
+            creator=user,
+        )
+        querryset = AggregateInvoice.objects.all()
+        with self.assertLogs("DataBucket.database", "WARNING"):
+            results = querryset.aggregate(sum="amount", to_unit=CurrencyUnit.USD)
+        self.assertEqual(results["amount__sum"].value, Decimal("15.00"))
+        with self.assertRaises(ValueError):
+            querryset.aggregate(
+                sum="amount", to_unit=CurrencyUnit.USD / WeightUnit.KILOGRAM
+            )
+
+
+class FixedPointShipment(DataBucket):
+
+    class DataInterface(Database):
+        weight = Number(decimal_places=3, unit=WeightUnit.POUND, fixed_point=True)
+
+
+class TestFixedPointField(TestCase):
+    def test_load_fixed_point_values(self):
+        user = get_user_model().objects.create(username="creator")
+        FixedPointShipment.objects.create(
+            {"weight": NumberValue(1, WeightUnit.KILOGRAM)}, creator=user
+        )
+        weight = FixedPointShipment.objects.all()[0].weight
+        self.assertIsInstance(weight, FixedPointNumberValue)
+        self.assertEqual(weight.unit, WeightUnit.POUND)
+        self.assertEqual(weight.value, Decimal("2.205"))
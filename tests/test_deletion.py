@@ -0,0 +1,146 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import DataBucketConnection, String, dbField
+from DataBucket.src.database.session import DataBucketSession
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+
+class DeletionCustomer(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+
+
+class DeletionProject(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+        customer = DataBucketConnection(
+            DataBucket="DeletionCustomer",
+            type="ForeignKey",
+            on_delete=dbField.CASCADE,
+            is_changeable=False,
+        )
+        contact = DataBucketConnection(
+            DataBucket="DeletionCustomer",
+            type="ForeignKey",
+            on_delete=dbField.SET_NULL,
+        )
+        partners = DataBucketConnection(
+            DataBucket="DeletionCustomer",
+            type="ManyToMany",
+            on_delete=dbField.SET_NULL,
+        )
+
+
+class DeletionTask(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+        project = DataBucketConnection(
+            DataBucket="DeletionProject",
+            type="ForeignKey",
+            on_delete=dbField.CASCADE,
+        )
+        reviewer = DataBucketConnection(
+            DataBucket="DeletionCustomer",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+
+
+class TestOnDelete(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        self.north, self.south = DeletionCustomer.objects.bulk_create(
+            [{"name": "north"}, {"name": "south"}], creator=self.user
+        )
+
+    def createProjects(self, count):
+        projects = DeletionProject.objects.bulk_create(
+            [
+                {
+                    "name": f"project {index}",
+                    "customer": self.north if index % 2 == 0 else self.south,
+                    "contact": self.north,
+                    "partners": [self.north.id, self.south.id],
+                }
+                for index in range(count)
+            ],
+            creator=self.user,
+        )
+        DeletionTask.objects.bulk_create(
+            [
+                {
+                    "name": f"task {project.id}",
+                    "project": project,
+                    "reviewer": self.north,
+                }
+                for project in projects
+            ],
+            creator=self.user,
+        )
+        return projects
+
+    def test_cascade_and_set_null(self):
+        self.createProjects(6)
+        DeletionCustomer.objects.delete(self.north.id)
+
+        remaining = list(
+            DeletionProject.objects.all().order_by("name").prefetch_related("partners")
+        )
+        self.assertEqual(
+            [project.name.value for project in remaining],
+            ["project 1", "project 3", "project 5"],
+        )
+        for project in remaining:
+            self.assertIsNone(project.contact)
+            self.assertEqual(
+                [partner.id for partner in project.partners.instance], [self.south.id]
+            )
+        tasks = list(DeletionTask.objects.all())
+        self.assertEqual(
+            sorted(task.project.value for task in tasks),
+            sorted(project.id for project in remaining),
+        )
+        self.assertEqual({task.reviewer.value for task in tasks}, {self.north.id})
+
+    def test_session_forgets_cascaded_records(self):
+        cascaded, nulled = self.createProjects(2)
+        with DataBucketSession():
+            DeletionProject.objects.get({"id": cascaded.id})
+            self.assertEqual(
+                DeletionProject.objects.get({"id": nulled.id}).contact.value,
+                self.north.id,
+            )
+            DeletionCustomer.objects.delete(self.north.id)
+            self.assertIsNone(DeletionProject.objects.get({"id": cascaded.id}))
+            self.assertIsNone(DeletionProject.objects.get({"id": nulled.id}).contact)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.createProjects(4)
+        with self.assertNumQueries(10) as small:
+            DeletionCustomer.objects.delete(self.north.id)
+        DeletionCustomer.objects.bulk_delete([self.south.id])
+        self.north, self.south = DeletionCustomer.objects.bulk_create(
+            [{"name": "north"}, {"name": "south"}], creator=self.user
+        )
+        self.createProjects(40)
+        with self.assertNumQueries(len(small.captured_queries)):
+            DeletionCustomer.objects.delete(self.north.id)
+        self.assertEqual(DeletionProject.objects.all().count(), 20)
+
+    def test_invalid_on_delete(self):
+        with self.assertRaises(ValueError):
+            DataBucketConnection(
+                DataBucket="DeletionCustomer",
+                type="ForeignKey",
+                on_delete=dbField.SET_NULL,
+                is_required=True,
+            )
+        with self.assertRaises(ValueError):
+            DataBucketConnection(
+                DataBucket="DeletionCustomer", type="ForeignKey", on_delete=None
+            )
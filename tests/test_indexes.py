@@ -0,0 +1,84 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import DataBucketConnection, String, dbField
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+
+
+class IndexedCustomer(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+
+
+class IndexedProject(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True, is_changeable=False)
+        customer = DataBucketConnection(
+            DataBucket="IndexedCustomer",
+            type="ForeignKey",
+            on_delete=dbField.CASCADE,
+            is_changeable=False,
+        )
+        status = String(max_length=20, db_index=True)
+
+        class Meta:
+            unique_together = [["name", "customer"]]
+
+
+class TestGeneratedIndexes(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+
+    def test_meta_indexes(self):
+        unchangeable_model, changeable_model = IndexedProject.DataInterface.model_tuple
+        current, status = changeable_model._meta.indexes
+        self.assertEqual(current.fields, ["link_to_unchangeable", "-updated_at", "-id"])
+        self.assertEqual(status.fields, ["status"])
+        for index in (current, status):
+            self.assertIn(("is_deleted", False), index.condition.children)
+        (constraint,) = unchangeable_model._meta.constraints
+        self.assertEqual(constraint.fields, ("name", "customer"))
+        self.assertIn(("is_deleted", False), constraint.condition.children)
+        with connection.cursor() as cursor:
+            table_indexes = connection.introspection.get_constraints(
+                cursor, changeable_model._meta.db_table
+            )
+        self.assertIn(current.name, table_indexes)
+
+    def test_unique_together(self):
+        customer = IndexedCustomer.objects.create({"name": "north"}, creator=self.user)
+        IndexedProject.objects.create(
+            {"name": "bridge", "customer": customer}, creator=self.user
+        )
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            IndexedProject.objects.create(
+                {"name": "bridge", "customer": customer}, creator=self.user
+            )
+
+    def test_unique_together_after_delete(self):
+        customer = IndexedCustomer.objects.create({"name": "north"}, creator=self.user)
+        project = IndexedProject.objects.create(
+            {"name": "bridge", "customer": customer}, creator=self.user
+        )
+        IndexedProject.objects.delete(project.id)
+        recreated = IndexedProject.objects.create(
+            {"name": "bridge", "customer": customer}, creator=self.user
+        )
+        self.assertEqual(
+            [record.id for record in IndexedProject.objects.all()], [recreated.id]
+        )
+
+    def test_unique_together_requires_unchangeable_fields(self):
+        with self.assertRaises(ValueError):
+
+            class InvalidIndexedProject(DataBucket):
+
+                class DataInterface(Database):
+                    name = String(max_length=100, is_required=True)
+
+                    class Meta:
+                        unique_together = [["name"]]
@@ -0,0 +1,69 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import Number, String
+from DataBucket.src.database.instrumentation import (
+    Instrumentation,
+    MemorySink,
+    PrometheusSink,
+)
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+
+class InstrumentedParcel(DataBucket):
+
+    cache_invalidation = {"interval": 60, "on_change": True}
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+        weight = Number(decimal_places=2, unit=WeightUnit.KILOGRAM, default=0)
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        self.sink, self.prometheus = Instrumentation.enable(MemorySink(), "prometheus")
+
+    def tearDown(self):
+        Instrumentation.disable()
+
+    def test_records_operations(self):
+        InstrumentedParcel.objects.bulk_create(
+            [{"name": f"parcel {index}", "weight": index} for index in range(3)],
+            creator=self.user,
+        )
+        records = list(InstrumentedParcel.objects.filter({"weight__gte": 1}))
+        InstrumentedParcel.objects.get({"name": "parcel 0"})
+        InstrumentedParcel.objects.get({"name": "parcel 0"})
+
+        samples = self.sink.samples
+        self.assertEqual(
+            [sample.operation for sample in samples],
+            ["bulk_create", "filter", "get", "get"],
+        )
+        bulk_create, filter, first_get, second_get = samples
+        self.assertEqual(bulk_create.rows, 3)
+        self.assertGreater(bulk_create.queries, 0)
+        self.assertEqual((filter.queries, filter.rows), (1, len(records)))
+        self.assertEqual((filter.cache_hits, filter.cache_misses), (0, 1))
+        self.assertEqual((first_get.queries, first_get.cache_misses), (1, 1))
+        self.assertEqual((second_get.queries, second_get.cache_hits), (0, 1))
+        self.assertLessEqual(filter.sql_seconds, filter.total_seconds)
+
+        (metrics,) = self.sink.getMetrics("InstrumentedParcel", "get")
+        self.assertEqual((metrics.calls, metrics.rows, metrics.queries), (2, 2, 1))
+        self.assertIsInstance(self.prometheus, PrometheusSink)
+        self.assertIn(
+            'databucket_operation_calls_total{data_bucket="InstrumentedParcel",operation="get"} 2',
+            self.prometheus.render(),
+        )
+
+    def test_disabled(self):
+        Instrumentation.disable()
+        InstrumentedParcel.objects.create({"name": "quiet"}, creator=self.user)
+        self.assertEqual(self.sink.samples, [])
+        self.assertFalse(Instrumentation.enabled)
+        with self.assertRaises(ValueError):
+            Instrumentation.enable("unknown")
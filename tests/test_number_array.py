@@ -0,0 +1,69 @@
+from DataBucket.src.auxiliary.number_array import NumberArray
+from DataBucket.src.auxiliary.value import NumberValue
+from DataBucket.src.units.unit import CombinedUnit
+from DataBucket.src.units.length_unit import LengthUnit
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from decimal import Decimal
+from django.test import TestCase
+
+
+class TestNumberArray(TestCase):
+    def test_add_and_sub(self):
+        a = NumberArray([1, 2, 3], unit=WeightUnit.TON, decimal_places=2)
+        b = NumberArray([500, 1000, 1500], unit=WeightUnit.KILOGRAM, decimal_places=2)
+
+        c = a + b
+        self.assertEqual(c.unit, WeightUnit.KILOGRAM)
+        self.assertEqual(c.values.tolist(), [1500, 3000, 4500])
+
+        d = a - NumberValue(1, WeightUnit.TON)
+        self.assertEqual(d.unit, WeightUnit.TON)
+        self.assertEqual(d.values.tolist(), [0, 1, 2])
+
+        with self.assertRaises(TypeError):
+            a + NumberArray([1, 2, 3], unit=LengthUnit.METER)
+
+    def test_mul_and_div(self):
+        weight = NumberArray([2, 4], unit=WeightUnit.KILOGRAM)
+        length = NumberArray([1, 2], unit=LengthUnit.METER)
+
+        density = weight / length
+        self.assertIsInstance(density.unit, CombinedUnit)
+        self.assertEqual(
+            density.unit, CombinedUnit([WeightUnit.KILOGRAM], [LengthUnit.METER])
+        )
+        self.assertEqual(density.values.tolist(), [2, 2])
+
+        self.assertEqual((weight * 2).values.tolist(), [4, 8])
+        self.assertEqual((2 * weight).unit, WeightUnit.KILOGRAM)
+
+    def test_convert_and_compare(self):
+        a = NumberArray([1, 2.5], unit=WeightUnit.TON)
+        b = a.convert(WeightUnit.KILOGRAM)
+        self.assertEqual(b.unit, WeightUnit.KILOGRAM)
+        self.assertEqual(b.values.tolist(), [1000, 2500])
+
+        self.assertEqual(
+            (a > NumberValue(1500, WeightUnit.KILOGRAM)).tolist(), [False, True]
+        )
+
+    def test_reductions(self):
+        a = NumberArray([1.25, 2.5, 3.75], unit=WeightUnit.KILOGRAM, decimal_places=2)
+        self.assertEqual(a.sum().value, Decimal("7.50"))
+        self.assertEqual(a.sum().unit, WeightUnit.KILOGRAM)
+        self.assertEqual(a.mean().value, Decimal("2.50"))
+        self.assertEqual(a.min().value, Decimal("1.25"))
+        self.assertEqual(a.max().value, Decimal("3.75"))
+
+    def test_from_number_values(self):
+        a = NumberArray.fromNumberValues(
+            [
+                NumberValue(1, WeightUnit.TON),
+                NumberValue(500, WeightUnit.KILOGRAM),
+                NumberValue(2, WeightUnit.TON),
+            ]
+        )
+        self.assertEqual(a.unit, WeightUnit.TON)
+        self.assertEqual(a.values.tolist(), [1, 0.5, 2])
+        self.assertEqual(a[1].value, Decimal("0.5"))
@@ -0,0 +1,105 @@
+from DataBucket.src.auxiliary.identity_map import IdentityMap
+from DataBucket.src.auxiliary.value import ConnectionValue
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import DataBucketConnection, String, dbField
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+
+class PrefetchCurrency(DataBucket):
+
+    class DataInterface(Database):
+        code = String(max_length=3, is_required=True)
+
+
+class PrefetchCustomer(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+        currency = DataBucketConnection(
+            DataBucket="PrefetchCurrency",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+
+
+class PrefetchProject(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+        currency = DataBucketConnection(
+            DataBucket="PrefetchCurrency",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+        customers = DataBucketConnection(
+            DataBucket="PrefetchCustomer",
+            type="ManyToMany",
+            on_delete=dbField.DO_NOTHING,
+        )
+
+
+class TestPrefetch(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        self.euro, self.dollar = PrefetchCurrency.objects.bulk_create(
+            [{"code": "EUR"}, {"code": "USD"}], creator=self.user
+        )
+        self.customers = PrefetchCustomer.objects.bulk_create(
+            [
+                {"name": "north", "currency": self.euro},
+                {"name": "south", "currency": self.dollar},
+            ],
+            creator=self.user,
+        )
+        PrefetchProject.objects.bulk_create(
+            [
+                {
+                    "name": f"project {index}",
+                    "currency": self.euro,
+                    "customers": [customer.id for customer in self.customers],
+                }
+                for index in range(5)
+            ],
+            creator=self.user,
+        )
+        PrefetchCurrency.objects.update(
+            self.euro.id, {"code": "EU2"}, creator=self.user
+        )
+
+    def test_select_related(self):
+        with self.assertNumQueries(2):
+            projects = list(PrefetchProject.objects.all().select_related("currency"))
+        self.assertIsInstance(projects[0].currency, ConnectionValue)
+        self.assertEqual(projects[0].currency.value, self.euro.id)
+        self.assertEqual(projects[0].currency.instance.code.value, "EU2")
+        self.assertIs(projects[0].currency.instance, projects[4].currency.instance)
+        with self.assertRaises(ValueError):
+            list(PrefetchProject.objects.all().select_related("customers"))
+        with self.assertRaises(ValueError):
+            list(PrefetchProject.objects.all().select_related("name"))
+
+    def test_prefetch_related_with_identity_map(self):
+        identity_map = IdentityMap()
+        with self.assertNumQueries(5):
+            projects = list(
+                PrefetchProject.objects.filter({"name__startswith": "project"})
+                .order_by("name")
+                .prefetch_related(
+                    "currency", "customers__currency", identity_map=identity_map
+                )
+            )
+        customers = projects[0].customers.instance
+        self.assertEqual(
+            [customer.name.value for customer in customers], ["north", "south"]
+        )
+        self.assertIs(customers[0], projects[3].customers.instance[0])
+        self.assertIs(customers[0].currency.instance, projects[0].currency.instance)
+        self.assertEqual(len(identity_map), 4)
+
+        with self.assertNumQueries(1):
+            PrefetchProject.objects.all().select_related(
+                "currency", identity_map=identity_map
+            ).first()
@@ -0,0 +1,184 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.bucket_cache import (
+    BucketCache,
+    HTTPRefetchSource,
+    RefetchScheduler,
+    RefetchSource,
+)
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import String
+
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import threading
+import time
+
+
+class RemoteProject(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_unique=True, is_required=True)
+        owner = String(max_length=100)
+
+
+class BlockingSource(RefetchSource):
+    def __init__(self, rows):
+        self.rows = rows
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def fetch(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return self.rows
+
+
+class CountingSource(RefetchSource):
+    def __init__(self):
+        self.calls = 0
+
+    def fetch(self):
+        self.calls += 1
+        return None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FailingSource(RefetchSource):
+    def fetch(self):
+        raise RuntimeError("remote unavailable")
+
+
+class RemoteHandler(BaseHTTPRequestHandler):
+    rows = []
+    etag = '"v1"'
+    not_modified = 0
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == self.etag:
+            RemoteHandler.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps(self.rows).encode()
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRefetchScheduler(TransactionTestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        self.scheduler = RefetchScheduler(max_workers=2, stagger=0)
+
+    def tearDown(self):
+        self.scheduler.stop()
+        RemoteProject.DataInterface.cache = None
+
+    def setSource(self, source):
+        RemoteProject.DataInterface.cache = BucketCache(
+            RemoteProject.DataInterface,
+            interval=3600,
+            refetch_source=source,
+            creator=self.user,
+            delete_missing=True,
+        )
+        return RemoteProject.DataInterface.cache
+
+    def test_conditional_fetch(self):
+        RemoteHandler.rows = [{"name": "remote", "owner": "a"}]
+        server = HTTPServer(("127.0.0.1", 0), RemoteHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            cache = self.setSource(
+                HTTPRefetchSource(f"http://127.0.0.1:{server.server_port}/")
+            )
+            self.scheduler.register(RemoteProject)
+            first = self.scheduler.trigger(cache).result(5)
+            second = self.scheduler.trigger(cache).result(5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(first, {"created": 1, "updated": 0, "deleted": 0})
+        self.assertEqual(second, {"created": 0, "updated": 0, "deleted": 0})
+        self.assertEqual(RemoteHandler.not_modified, 1)
+        self.assertEqual(
+            [record.name.value for record in RemoteProject.objects.all()], ["remote"]
+        )
+
+    def test_readers_keep_snapshot_during_refetch(self):
+        RemoteProject.objects.create({"name": "old"}, creator=self.user)
+        source = BlockingSource([{"name": "new", "owner": "b"}])
+        cache = self.setSource(source)
+        cache.delayRefresh(3600)
+        self.assertEqual(len(RemoteProject.objects.all()), 1)
+
+        future = self.scheduler.trigger(cache)
+        self.assertIs(self.scheduler.trigger(cache), future)
+        self.assertTrue(source.started.wait(5))
+        names = [record.name.value for record in RemoteProject.objects.all()]
+        self.assertEqual(names, ["old"])
+
+        source.release.set()
+        self.assertEqual(future.result(5), {"created": 1, "updated": 0, "deleted": 1})
+        self.assertEqual(source.calls, 1)
+        names = [record.name.value for record in RemoteProject.objects.all()]
+        self.assertEqual(names, ["new"])
+
+    def test_register_requires_refetch_source(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.register(RemoteProject)
+
+    def test_failed_refresh_is_logged(self):
+        cache = self.setSource(FailingSource())
+        with self.assertLogs("DataBucket.cache", "ERROR"):
+            future = self.scheduler.trigger(cache)
+            self.assertIsInstance(future.exception(5), RuntimeError)
+            for _ in range(50):
+                if self.scheduler.getLastError(cache) is not None:
+                    break
+                time.sleep(0.1)
+        self.assertIs(self.scheduler.getLastError(cache), future.exception())
+        self.assertIs(self.scheduler.last_error, future.exception())
+
+    def test_first_refresh_waits_one_interval(self):
+        source = CountingSource()
+        clock = FakeClock()
+        RemoteProject.DataInterface.cache = BucketCache(
+            RemoteProject.DataInterface,
+            interval=10,
+            refetch_source=source,
+            creator=self.user,
+            clock=clock,
+        )
+        scheduler = RefetchScheduler(max_workers=1, stagger=0, poll_interval=0.01)
+        try:
+            scheduler.register(RemoteProject)
+            scheduler.start()
+            time.sleep(0.2)
+            self.assertEqual(source.calls, 0)
+            clock.now = 10
+            for _ in range(50):
+                if source.calls:
+                    break
+                time.sleep(0.1)
+            self.assertEqual(source.calls, 1)
+        finally:
+            scheduler.stop()
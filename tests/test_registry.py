@@ -0,0 +1,165 @@
+from DataBucket.src.auxiliary.data_bucket_registry import DataBucketRegistry
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import DataBucketConnection, String, dbField
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+
+class RegistryCustomer(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+
+
+class RegistryOrder(DataBucket):
+
+    class DataInterface(Database):
+        customer = DataBucketConnection(
+            DataBucket="RegistryCustomer",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+
+
+class RegistryInvoice(DataBucket):
+
+    class DataInterface(Database):
+        customer = DataBucketConnection(
+            DataBucket="DataBucket.RegistryLateCustomer",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+            is_changeable=False,
+        )
+
+
+class RegistryLateCustomer(RegistryCustomer):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+
+
+class RegistryTransfer(DataBucket):
+
+    class DataInterface(Database):
+        sender = DataBucketConnection(
+            DataBucket="RegistryCustomer",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+        receiver = DataBucketConnection(
+            DataBucket="RegistryCustomer",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+        witnesses = DataBucketConnection(
+            DataBucket="RegistryCustomer",
+            type="ManyToMany",
+            on_delete=dbField.DO_NOTHING,
+        )
+        observers = DataBucketConnection(
+            DataBucket="RegistryCustomer",
+            type="ManyToMany",
+            on_delete=dbField.DO_NOTHING,
+        )
+
+
+class TestRegistry(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+
+    def test_lookup(self):
+        registration = DataBucketRegistry.get("RegistryCustomer")
+        self.assertIs(registration.data_bucket, RegistryCustomer)
+        self.assertIs(registration.data_interface, RegistryCustomer.DataInterface)
+        self.assertEqual(
+            registration.models, RegistryCustomer.DataInterface.model_tuple
+        )
+        self.assertIs(
+            DataBucketRegistry.get("DataBucket.RegistryCustomer"), registration
+        )
+        self.assertIs(DataBucketRegistry.get(RegistryCustomer), registration)
+        self.assertIs(
+            DataBucketRegistry.getDataBucket("RegistryLateCustomer"),
+            RegistryLateCustomer,
+        )
+        with self.assertRaises(ValueError):
+            DataBucketRegistry.get("Missing")
+
+    def test_connection_to_registered_bucket(self):
+        field = RegistryOrder.DataInterface.customer
+        self.assertIs(field.data_bucket, RegistryCustomer)
+        self.assertIs(
+            field.field.remote_field.model,
+            DataBucketRegistry.get("RegistryCustomer").unchangeable_model,
+        )
+        customer = RegistryCustomer.objects.create({"name": "c"}, creator=self.user)
+        order = RegistryOrder.objects.create({"customer": customer}, creator=self.user)
+        self.assertEqual(order.customer.value, customer.id)
+        self.assertEqual(
+            RegistryOrder.objects.filter({"customer": customer}).count(), 1
+        )
+
+    def test_forward_reference(self):
+        field = RegistryInvoice.DataInterface.customer
+        self.assertTrue(field.is_resolved)
+        self.assertIs(field.data_bucket, RegistryLateCustomer)
+        self.assertIs(
+            field.field.remote_field.model,
+            RegistryLateCustomer.DataInterface.model_tuple[0],
+        )
+        customer = RegistryLateCustomer.objects.create({"name": "l"}, creator=self.user)
+        invoice = RegistryInvoice.objects.create(
+            {"customer": customer.id}, creator=self.user
+        )
+        self.assertEqual(invoice.customer.value, customer.id)
+
+
+    def test_connections_to_the_same_bucket(self):
+        for model in RegistryTransfer.DataInterface.model_tuple:
+            self.assertEqual(model.check(), [])
+        north = RegistryCustomer.objects.create({"name": "north"}, creator=self.user)
+        south = RegistryCustomer.objects.create({"name": "south"}, creator=self.user)
+        transfer = RegistryTransfer.objects.create(
+            {"sender": north, "receiver": south, "witnesses": [north.id]},
+            creator=self.user,
+        )
+        self.assertEqual(
+            (transfer.sender.value, transfer.receiver.value), (north.id, south.id)
+        )
+
+
+class LazySupplier(DataBucket):
+
+    lazy_models = True
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+
+
+class LazyDelivery(DataBucket):
+
+    lazy_models = "ready"
+
+    class DataInterface(Database):
+        supplier = DataBucketConnection(
+            DataBucket="LazySupplier",
+            type="ForeignKey",
+            on_delete=dbField.DO_NOTHING,
+        )
+
+
+class TestLazyModels(TestCase):
+    def test_lazy_materialization(self):
+        self.assertTrue(DataBucketRegistry.isRegistered("LazySupplier"))
+        self.assertFalse(LazySupplier.DataInterface.is_materialized())
+        self.assertFalse(LazyDelivery.DataInterface.is_materialized())
+
+        DataBucketRegistry.materializeModels()
+        self.assertTrue(LazyDelivery.DataInterface.is_materialized())
+        self.assertTrue(LazySupplier.DataInterface.is_materialized())
+        self.assertIs(
+            LazyDelivery.DataInterface.supplier.field.remote_field.model,
+            LazySupplier.DataInterface.model_tuple[0],
+        )
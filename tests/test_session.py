@@ -0,0 +1,95 @@
+from DataBucket.src.data_bucket import DataBucket
+from DataBucket.src.database.database_interface import Database
+from DataBucket.src.database.db_field import Number, String
+from DataBucket.src.database.session import DataBucketSession
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+
+class SessionPallet(DataBucket):
+
+    class DataInterface(Database):
+        name = String(max_length=100, is_required=True)
+        weight = Number(decimal_places=2, unit=WeightUnit.KILOGRAM, default=0)
+
+
+class TestDataBucketSession(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create(username="creator")
+        self.pallets = SessionPallet.objects.bulk_create(
+            [{"name": f"pallet {index}", "weight": index} for index in range(3)],
+            creator=self.user,
+        )
+
+    def test_repeated_reads_come_from_memory(self):
+        with DataBucketSession() as session:
+            first = SessionPallet.objects.get({"name": "pallet 1"})
+            SessionPallet.objects.get({"name": "missing"})
+            with self.assertNumQueries(0):
+                self.assertIs(SessionPallet.objects.get({"name": "pallet 1"}), first)
+                self.assertIs(SessionPallet.objects.get({"id": first.id}), first)
+                self.assertIsNone(SessionPallet.objects.get({"name": "missing"}))
+            records = list(SessionPallet.objects.filter({"weight__gte": 1}))
+            self.assertIn(first, records)
+            self.assertIs(
+                next(record for record in records if record.id == first.id), first
+            )
+            updated = SessionPallet.objects.update(
+                first.id, {"weight": 8}, creator=self.user
+            )
+            self.assertIs(SessionPallet.objects.get({"id": first.id}), updated)
+        statistics = session.statistics
+        self.assertEqual(statistics.reads_from_database, 2)
+        self.assertEqual(statistics.reads_from_memory, 4)
+        self.assertIsNone(DataBucketSession.getCurrent())
+
+    def test_buffered_writes_flush_on_exit(self):
+        with DataBucketSession(creator=self.user) as session:
+            created = [
+                session.create(SessionPallet, {"name": f"new {index}", "weight": 5})
+                for index in range(3)
+            ]
+            session.update(SessionPallet, self.pallets[0].id, {"weight": 4})
+            session.update(SessionPallet, self.pallets[0].id, {"name": "renamed"})
+            session.update(SessionPallet, self.pallets[1].id, {"weight": 6})
+            session.delete(SessionPallet, self.pallets[2].id)
+            self.assertTrue(session.has_pending)
+            self.assertEqual(SessionPallet.DataInterface.all().count(), 3)
+        self.assertFalse(session.has_pending)
+
+        statistics = session.statistics
+        self.assertEqual(statistics.buffered_writes, 7)
+        self.assertEqual(statistics.write_batches, 3)
+        self.assertGreater(statistics.flush_queries, 0)
+        self.assertEqual(statistics.queries_saved, 0)
+        self.assertEqual(
+            [pending.record.name.value for pending in created],
+            ["new 0", "new 1", "new 2"],
+        )
+        renamed = SessionPallet.objects.get({"id": self.pallets[0].id})
+        self.assertEqual(
+            (renamed.name.value, renamed.weight.value), ("renamed", Decimal("4.00"))
+        )
+        self.assertIsNone(SessionPallet.objects.get({"id": self.pallets[2].id}))
+        self.assertEqual(SessionPallet.DataInterface.all().count(), 5)
+
+    def test_reads_flush_pending_writes(self):
+        with DataBucketSession(creator=self.user) as session:
+            session.update(SessionPallet, self.pallets[0].id, {"weight": 9})
+            record = SessionPallet.objects.get({"id": self.pallets[0].id})
+            self.assertFalse(session.has_pending)
+            self.assertEqual(record.weight.value, Decimal("9.00"))
+            session.delete(SessionPallet, self.pallets[0].id)
+            with self.assertRaises(ValueError):
+                session.update(SessionPallet, self.pallets[0].id, {"weight": 1})
+
+    def test_exception_discards_pending_writes(self):
+        with self.assertRaises(RuntimeError):
+            with DataBucketSession(creator=self.user) as session:
+                session.create(SessionPallet, {"name": "lost"})
+                raise RuntimeError
+        self.assertFalse(session.has_pending)
+        self.assertIsNone(SessionPallet.objects.get({"name": "lost"}))
@@ -1,8 +1,10 @@
 from DataBucket.src.units.unit import Unit, CombinedUnit
 from DataBucket.src.units.length_unit import LengthUnit
 from DataBucket.src.units.weight_unit import WeightUnit
+from DataBucket.src.units.currency_unit import CurrencyUnit
 
 from django.test import TestCase
+import gc
 
 
 class TestUnitConversions(TestCase):
@@ -58,3 +60,66 @@ class TestUnitConversions(TestCase):
         self.assertEqual(d.total_factor, 0.001)
         self.assertEqual(d.numerator, [WeightUnit.KILOGRAM])
         self.assertEqual(d.denominator, [])
+
+    def test_factor_matrix(self):
+        for unit in WeightUnit.UNITS:
+            for to_unit in WeightUnit.UNITS:
+                self.assertEqual(
+                    unit.convert(to_unit)[0],
+                    WeightUnit.FACTOR_DICT[unit] / WeightUnit.FACTOR_DICT[to_unit],
+                )
+        self.assertEqual(
+            WeightUnit.convertMany(
+                [WeightUnit.GRAM, WeightUnit.TON, WeightUnit.KILOGRAM],
+                WeightUnit.KILOGRAM,
+            ),
+            [0.001, 1000, 1],
+        )
+        with self.assertRaises(TypeError):
+            WeightUnit.convertMany([LengthUnit.METER], WeightUnit.KILOGRAM)
+        with self.assertRaises(TypeError):
+            WeightUnit.GRAM.convert(LengthUnit.METER)
+
+    def test_combined_unit_canonical_form(self):
+        a = CombinedUnit([WeightUnit.KILOGRAM, LengthUnit.METER], [LengthUnit.METER])
+        b = CombinedUnit([LengthUnit.METER, WeightUnit.KILOGRAM], [])
+        c = CombinedUnit([WeightUnit.KILOGRAM, LengthUnit.METER], [], 0.5)
+
+        self.assertIs(b.signature, c.signature)
+        self.assertEqual(b, c)
+        self.assertEqual(hash(b), hash(c))
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, CombinedUnit([WeightUnit.KILOGRAM]))
+        self.assertEqual(len({b, c, a}), 2)
+        self.assertEqual(str(CombinedUnit([LengthUnit.METER] * 2)), "m^2")
+
+    def test_signatures_are_released(self):
+        CombinedUnit.clearOperationCache()
+        gc.collect()
+        count = CombinedUnit.getSignatureCount()
+        unit = CombinedUnit([WeightUnit.MILLIGRAM] * 3, [LengthUnit.MILLIMETER] * 5)
+        self.assertEqual(CombinedUnit.getSignatureCount(), count + 1)
+        del unit
+        gc.collect()
+        self.assertEqual(CombinedUnit.getSignatureCount(), count)
+
+    def test_operation_cache(self):
+        CombinedUnit.clearOperationCache()
+        first = CurrencyUnit.USD / WeightUnit.TON
+        second = CurrencyUnit.USD / WeightUnit.TON
+        statistics = CombinedUnit.getOperationCacheStatistics()
+
+        self.assertIs(first, second)
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+        self.assertEqual(CombinedUnit.getOperationCacheStatistics().size, 1)
+
+        first.numerator.append(WeightUnit.KILOGRAM)
+        self.assertEqual(second.numerator, [CurrencyUnit.USD])
+
+        converted = first.convert(WeightUnit.KILOGRAM)
+        self.assertIs(converted, first.convert(WeightUnit.KILOGRAM))
+        self.assertEqual(converted.total_factor, 0.001)
+
+        scaled = CombinedUnit([CurrencyUnit.USD], [WeightUnit.TON], 2)
+        self.assertEqual(scaled.convert(WeightUnit.KILOGRAM).total_factor, 0.002)
@@ -0,0 +1,90 @@
+from DataBucket.src.auxiliary.value import (
+    FixedPointNumberValue,
+    NumberValue,
+    StringValue,
+)
+from DataBucket.src.units.weight_unit import WeightUnit
+
+from decimal import Decimal
+from fractions import Fraction
+import math
+import pickle
+import unittest
+
+
+class TestNumberValue(unittest.TestCase):
+    def test_slots(self):
+        value = NumberValue(1.5, unit=WeightUnit.KILOGRAM, decimal_places=2)
+        self.assertFalse(hasattr(value, "__dict__"))
+        self.assertFalse(hasattr(StringValue("a"), "__dict__"))
+        with self.assertRaises(AttributeError):
+            value.other = 1
+
+    def test_from_decimal(self):
+        value = NumberValue._fromDecimal(Decimal("1.23456"), WeightUnit.TON, 2)
+        self.assertEqual(value.value, Decimal("1.23"))
+        self.assertEqual(value.decimal_places, 2)
+        self.assertIs(value.unit, WeightUnit.TON)
+
+    def test_arithmetic_keeps_units(self):
+        total = NumberValue(1, unit=WeightUnit.TON, decimal_places=2) + NumberValue(
+            500, unit=WeightUnit.KILOGRAM, decimal_places=2
+        )
+        self.assertEqual(total.unit, WeightUnit.KILOGRAM)
+        self.assertEqual(total.value, Decimal("1500.00"))
+        self.assertEqual((-total).value, Decimal("-1500.00"))
+
+    def test_pickle(self):
+        value = NumberValue(2, unit=WeightUnit.KILOGRAM, decimal_places=3)
+        restored = pickle.loads(pickle.dumps(value))
+        self.assertEqual(restored.value, value.value)
+        self.assertIs(restored.unit, WeightUnit.KILOGRAM)
+        self.assertEqual(restored.decimal_places, 3)
+
+
+class TestFixedPointNumberValue(unittest.TestCase):
+    def test_exact_arithmetic(self):
+        total = FixedPointNumberValue(0.1, decimal_places=2) + FixedPointNumberValue(
+            0.2, decimal_places=2
+        )
+        self.assertIsInstance(total, FixedPointNumberValue)
+        self.assertEqual(total.scaled, 30)
+        self.assertEqual(total.value, Decimal("0.30"))
+
+    def test_matches_decimal_path(self):
+        pairs = [("12.345", "0.07"), ("-3.5", "7.25"), ("1000", "0.25")]
+        for left, right in pairs:
+            fixed = FixedPointNumberValue(Decimal(left), WeightUnit.TON, 3)
+            decimal = NumberValue(Decimal(left), WeightUnit.TON, 3)
+            other = NumberValue(Decimal(right), WeightUnit.KILOGRAM, 2)
+            self.assertEqual((fixed + other).value, (decimal + other).value)
+            self.assertEqual((fixed - other).value, (decimal - other).value)
+            self.assertEqual((fixed * other).value, (decimal * other).value)
+            self.assertEqual((fixed / other).value, (decimal / other).value)
+            self.assertEqual((fixed * other).unit, (decimal * other).unit)
+
+    def test_remaining_operators_stay_fixed_point(self):
+        fixed = FixedPointNumberValue(Decimal("7.25"), WeightUnit.TON, 2)
+        results = {
+            "floordiv": (fixed // 2, Decimal("3.00")),
+            "mod": (fixed % 2, Decimal("1.25")),
+            "round": (round(fixed, 1), Decimal("7.2")),
+            "floor": (math.floor(fixed), Decimal("7")),
+            "ceil": (math.ceil(fixed), Decimal("8")),
+        }
+        for name, (result, expected) in results.items():
+            with self.subTest(name):
+                self.assertIsInstance(result, FixedPointNumberValue)
+                self.assertEqual(result.value, expected)
+        with self.assertRaises(TypeError):
+            fixed & 1
+
+    def test_exact_conversion(self):
+        pound = FixedPointNumberValue(1, WeightUnit.POUND, 8)
+        self.assertEqual(
+            pound.convert(WeightUnit.KILOGRAM).value, Decimal("0.45359237")
+        )
+        self.assertEqual(
+            WeightUnit.POUND.convertExact(WeightUnit.GRAM)[0], Fraction("453.59237")
+        )
+        self.assertTrue(pound > NumberValue(0.4, decimal_places=1))